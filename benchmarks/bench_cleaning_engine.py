@@ -0,0 +1,102 @@
+"""
+Benchmark the table-driven cleaning engine against the old per-column cleaners.
+
+For every registered dataset the raw table is tiled up to a target row count
+and cleaned twice: once with the chained per-column approach the original
+clean_* functions used, and once with clean_with_spec(). Both must hold the
+same values (the engine's columns are compactly typed and it adds per-cell
+status columns, which the comparison ignores), and at scale 1 the engine
+output must match the committed file in data/processed byte for byte.
+
+Usage:
+    python benchmarks/bench_cleaning_engine.py [--rows 200000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from cleaning_engine import SPECS, DatasetSpec, clean_with_spec  # noqa: E402
+
+
+def chained_clean(df: pd.DataFrame, spec: DatasetSpec) -> pd.DataFrame:
+    """Reference implementation: the step-by-step cleaning the old functions did."""
+    df = df.copy()
+    df = df.dropna(how="all")
+    df = df.iloc[spec.skip_rows:, :]
+    df = df.iloc[:, :len(spec.columns)]
+    df = df[df.iloc[:, 0].notna()]
+    df.columns = list(spec.columns)
+    if spec.code_col is not None:
+        df = df[df[spec.code_col] != "Code"]
+    df = df[df[spec.region_col].notna()]
+
+    for col in spec.numeric:
+        df[col] = (
+            df[col]
+            .astype(str)
+            .str.replace(",", "", regex=False)
+            .str.replace(":", "", regex=False)
+            .str.strip()
+        )
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    df = df.dropna(subset=[spec.required]).reset_index(drop=True)
+    return df.rename(columns=spec.rename)
+
+
+def tile(df: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """Repeat a raw table until it has at least ``rows`` rows."""
+    reps = max(1, -(-rows // len(df)))
+    return pd.concat([df] * reps, ignore_index=True)
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def check_against_processed(spec: DatasetSpec, raw: pd.DataFrame) -> None:
+    expected = (PROJECT_ROOT / "data" / "processed" / spec.processed_file).read_text(
+        encoding="utf-8"
+    )
+    actual = clean_with_spec(raw, spec).to_csv(index=False)
+    if actual != expected:
+        raise AssertionError(f"{spec.name}: engine output differs from {spec.processed_file}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'dataset':<15}{'rows':>10}{'chained (s)':>14}{'engine (s)':>13}{'speed-up':>10}")
+    for spec in SPECS.values():
+        raw = pd.read_csv(PROJECT_ROOT / "data" / "raw" / spec.raw_file)
+        check_against_processed(spec, raw)
+
+        big = tile(raw, args.rows)
+        reference = chained_clean(big, spec)
+        engine = clean_with_spec(big, spec)[list(reference.columns)]
+        pd.testing.assert_frame_equal(engine, reference, check_dtype=False)
+
+        old = best_of(lambda: chained_clean(big, spec), args.repeat)
+        new = best_of(lambda: clean_with_spec(big, spec), args.repeat)
+        print(f"{spec.name:<15}{len(big):>10}{old:>14.3f}{new:>13.3f}{old / new:>9.1f}x")
+
+    print("All engine outputs identical to the chained cleaners and data/processed.")
+
+
+if __name__ == "__main__":
+    main()
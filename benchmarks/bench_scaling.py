@@ -0,0 +1,291 @@
+"""
+Scaling benchmark for every load / clean / save path.
+
+Each cleaner's raw table is tiled to ONS-shaped inputs of 10^3 up to 10^7
+rows. At every size the module's load_*, clean_* and save_* functions are
+timed (median of --repeat runs after one warm-up run), then run once more
+under tracemalloc for peak memory. Results are compared with a baseline
+file, and the run fails when any path is slower, or peaks higher, than the
+baseline by more than --threshold.
+
+The speed of a shared machine drifts by tens of percent over minutes, so
+every timed call alternates with a fixed calibration workload and a step
+is compared by its median ratio to that workload rather than by raw wall
+time. Small inputs finish in milliseconds, so every step is repeated until
+its calls add up to MIN_SECONDS (and at least --repeat times) to steady
+that median. Any step slower than the baseline by more than --threshold is
+measured again, and reported only when the second run is slower too. The
+10^7 tier takes tens of minutes and has no baseline; it runs only with
+--max-rows 10000000.
+
+Peak memory counts allocations Python and numpy report to tracemalloc;
+buffers allocated inside pyarrow are not included.
+
+Usage:
+    python benchmarks/bench_scaling.py [--max-rows 1000000] [--repeat 5]
+                                       [--threshold 0.25] [--save-baseline]
+                                       [--only births_2019 ...]
+"""
+
+import argparse
+import importlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from bench_cleaning_engine import tile  # noqa: E402
+
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+STEPS = ("load", "clean", "save")
+
+DEFAULT_MAX_ROWS = 10**6
+
+# Differences smaller than these are timer / allocator noise, not regressions
+NOISE_SECONDS = 0.001
+NOISE_MB = 1.0
+
+# Each step is timed until its calls add up to this many seconds, with at
+# most MAX_REPEAT calls (small inputs take milliseconds per call)
+MIN_SECONDS = 1.0
+MAX_REPEAT = 200
+
+# Path -> (module, load, clean, save, raw file)
+PATHS = {
+    "births_2019": (
+        "clean_uk_business_births_2019", "load_births_2019", "clean_births_2019", "save_births_2019",
+        "uk_business_births.csv",
+    ),
+    "births_2024": (
+        "clean_uk_business_births_2024", "load_births_2024", "clean_births_2024", "save_births_2024",
+        "uk_business_births_2024.csv",
+    ),
+    "deaths_2019": (
+        "clean_uk_business_deaths_2019", "load_deaths_2019", "clean_deaths_2019", "save_deaths_2019",
+        "uk_business_deaths.csv",
+    ),
+    "deaths_2024": (
+        "uk_business_deaths_2024", "load_deaths_2024", "clean_deaths_2024", "save_deaths_2024",
+        "uk_business_deaths_2024.csv",
+    ),
+    "survival_2022": (
+        "clean_business_survival_2022", "load_survival_2022", "clean_survival_2022", "save_survival_2022",
+        "business_survival_2022.csv",
+    ),
+    "survival_2019": (
+        "clean_business_survival_rates_2019", "load_survival_2019", "clean_survival_2019", "save_survival_2019",
+        "business_survival_rates.csv",
+    ),
+    "birth_death_rates": (
+        "clean_business_births_vs_deaths", "load_raw", "clean_business_birth_death_rates", "save_clean",
+        "business_birth_death_rates.csv",
+    ),
+}
+
+
+# CSV text for calibrate(): codes and counts shaped like the ONS tables
+_CALIBRATION_CSV = pd.DataFrame({
+    "code": [f"E{i:08d}" for i in range(5_000)],
+    "count": np.arange(5_000) * 7 % 1000,
+}).to_csv(index=False)
+
+
+def calibrate() -> None:
+    """A fixed mix of CSV parsing, string and numeric work; its time tracks the machine's current speed."""
+    df = pd.read_csv(io.StringIO(_CALIBRATION_CSV))
+    df["count"].astype("float64").div(7).round(1).sum()
+    df["code"].str.slice(1).astype("int64").sum()
+    df.to_csv(index=False)
+
+
+def _elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def timed(func, repeat: int, min_seconds: float = 0.0) -> tuple[float, float]:
+    """
+    Median wall time of calls of ``func`` and the median of each call's
+    time relative to calibrate() runs just before and after it.
+
+    One untimed warm-up call comes first; then ``func`` runs at least
+    ``repeat`` times and until the calls add up to ``min_seconds`` (at most
+    MAX_REPEAT times).
+    """
+    func()
+    before = _elapsed(calibrate)
+    timings, relative = [], []
+    while len(timings) < repeat or (sum(timings) < min_seconds and len(timings) < MAX_REPEAT):
+        seconds = _elapsed(func)
+        after = _elapsed(calibrate)
+        timings.append(seconds)
+        relative.append(2 * seconds / (before + after))
+        before = after
+    return statistics.median(timings), statistics.median(relative)
+
+
+def peak_mb(func) -> float:
+    """Peak traced allocation while ``func`` runs, in MiB."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def measure(func, rows: int, repeat: int) -> dict[str, float]:
+    seconds, relative = timed(func, repeat, MIN_SECONDS)
+    return {
+        "seconds": round(seconds, 6),
+        "relative": round(relative, 4),
+        "rows_per_s": round(rows / seconds) if seconds else 0,
+        "peak_mb": round(peak_mb(func), 3),
+    }
+
+
+def bench_path(name: str, rows: int, repeat: int, workdir: Path) -> dict[str, dict[str, float]]:
+    """Time and trace one path's load, clean and save steps at ``rows`` rows."""
+    module_name, load_name, clean_name, save_name, raw_file = PATHS[name]
+    module = importlib.import_module(module_name)
+    load, clean, save = (getattr(module, f) for f in (load_name, clean_name, save_name))
+
+    # ONS-shaped input: the real table, metadata rows and all, repeated
+    raw = pd.read_csv(RAW_DIR / raw_file)
+    big = tile(raw, rows).head(rows)
+    raw_path = workdir / f"{name}_{rows}.csv"
+    big.to_csv(raw_path, index=False)
+    out_path = workdir / f"{name}_{rows}_clean.csv"
+
+    clean_df = clean(big)
+    results = {
+        "load": measure(lambda: load(raw_path), rows, repeat),
+        "clean": measure(lambda: clean(big), rows, repeat),
+        "save": measure(lambda: save(clean_df, out_path), rows, repeat),
+    }
+    raw_path.unlink()
+    return results
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[tuple[str, str, str]]:
+    """(path, rows, description) for every step that regressed beyond ``threshold``."""
+    regressions = []
+    for name, by_rows in results.items():
+        for rows, steps in by_rows.items():
+            for step, now in steps.items():
+                before = baseline.get(name, {}).get(rows, {}).get(step)
+                if before is None:
+                    continue
+                label = f"{name} {step} @ {rows} rows"
+                # Compare time at equal machine speed when both runs were calibrated
+                speed = "relative" if "relative" in before else "seconds"
+                slower = now[speed] > before[speed] * (1 + threshold)
+                if slower and now["seconds"] - before["seconds"] > NOISE_SECONDS:
+                    change = now[speed] / before[speed] - 1
+                    regressions.append((
+                        name, rows,
+                        f"{label}: seconds {before['seconds']:.4f} -> {now['seconds']:.4f}"
+                        f" ({change:+.0%} at equal machine speed)",
+                    ))
+                bigger = now["peak_mb"] > before["peak_mb"] * (1 + threshold)
+                if bigger and now["peak_mb"] - before["peak_mb"] > NOISE_MB:
+                    regressions.append(
+                        (name, rows, f"{label}: peak_mb {before['peak_mb']:.3f} -> {now['peak_mb']:.3f}")
+                    )
+    return regressions
+
+
+def remeasure(results: dict, flagged: set[tuple[str, str]], repeat: int) -> None:
+    """Run each flagged (path, rows) again and keep the faster run of every step."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, rows in sorted(flagged):
+            again = bench_path(name, int(rows), repeat, Path(tmp))
+            for step, now in again.items():
+                first = results[name][rows][step]
+                best = min(first, now, key=lambda m: m["relative"])
+                results[name][rows][step] = {**best, "peak_mb": min(first["peak_mb"], now["peak_mb"])}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-rows", type=int, default=DEFAULT_MAX_ROWS, help="largest input size to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the baseline")
+    parser.add_argument("--only", nargs="+", choices=list(PATHS), help="paths to run (default: all)")
+    args = parser.parse_args()
+
+    sizes = [n for n in SIZES if n <= args.max_rows]
+    names = args.only or list(PATHS)
+    results: dict[str, dict[str, dict]] = {}
+
+    print(f"{'path':<18}{'rows':>10}  " + "".join(f"{s + ' (s)':>12}{'MiB':>9}" for s in STEPS))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            results[name] = {}
+            for rows in sizes:
+                steps = bench_path(name, rows, args.repeat, Path(tmp))
+                # JSON object keys are strings; keep them that way throughout
+                results[name][str(rows)] = steps
+                cells = "".join(f"{steps[s]['seconds']:>12.4f}{steps[s]['peak_mb']:>9.1f}" for s in STEPS)
+                print(f"{name:<18}{rows:>10}  {cells}", flush=True)
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps({"environment": environment(), "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print("Baseline written:", args.baseline)
+        return
+
+    if not args.baseline.exists():
+        print("No baseline file; run with --save-baseline to create one.")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("environment") != environment():
+        print(f"Note: baseline was recorded on {baseline.get('environment')}, this is {environment()}")
+
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        # A real slowdown shows up again; a burst of machine noise rarely does
+        flagged = {(name, rows) for name, rows, _ in regressions}
+        print(f"Measuring {len(flagged)} flagged path / size pairs again...", flush=True)
+        remeasure(results, flagged, args.repeat)
+        regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}:")
+        for _, _, line in regressions:
+            print("  " + line)
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} of {args.baseline.name}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,54 @@
-import os
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
 from pathlib import Path
 
+from matplotlib.figure import Figure
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from query import scan  # noqa: E402
+from render import save_figure  # noqa: E402
 
-# Load clean data
-df = pd.read_csv(
-    PROJECT_ROOT / "data" / "processed" / "business_survival_rates_2019_clean.csv"
-)
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+OUTPUT = "business_survival_rates_2019_line.png"
 
 # Column names
 region_col = "Region"
 one_year = "1-Year Survival Rate (2019 Cohort, %)"
 five_year = "5-Year Survival Rate (2019 Cohort, %)"
 
-# Keep relevant data
-df = df[[region_col, one_year, five_year]].dropna()
-
-# Remove total row and duplicates
-df = df[df[region_col].str.lower() != "total"]
-df = df.groupby(region_col, as_index=False).first()
-
-# Sort by 1-year survival rate (cleaner flow)
-df = df.sort_values(one_year, ascending=False)
-
-# Plot
-plt.figure(figsize=(10, 6))
-plt.plot(df[region_col], df[one_year], marker="o", label="1-Year Survival Rate", color="navy")
-plt.plot(df[region_col], df[five_year], marker="o", label="5-Year Survival Rate", color="skyblue")
-
-plt.title("Business Survival Rates by Region (2019 Cohort)")
-plt.xlabel("Region")
-plt.ylabel("Survival Rate (%)")
-plt.xticks(rotation=45, ha="right")
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-
-# Save
-plots = PROJECT_ROOT / "plots"
-plots.mkdir(exist_ok=True)
-out_path = plots / "business_survival_rates_2019_line.png"
-plt.savefig(out_path, dpi=300)
-
-# Show locally only
-if os.environ.get("CI") != "true":
-    plt.show()
 
-print("Saved:", out_path)
+def build_figure(processed_dir: Path = PROCESSED_DIR) -> Figure:
+    # Regions sorted by 1-year survival rate (cleaner flow), without the
+    # total row or duplicated regions; only these three columns are read
+    df = (
+        scan(processed_dir / "business_survival_rates_2019_clean.csv")
+        .select(region_col, one_year, five_year)
+        .dropna()
+        .where(region_col, lambda regions: regions.str.lower() != "total")
+        .distinct(region_col)
+        .sort(one_year, ascending=False)
+        .collect()
+    )
+
+    # Plot
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.plot(df[region_col], df[one_year], marker="o", label="1-Year Survival Rate", color="navy")
+    ax.plot(df[region_col], df[five_year], marker="o", label="5-Year Survival Rate", color="skyblue")
+
+    ax.set_title("Business Survival Rates by Region (2019 Cohort)")
+    ax.set_xlabel("Region")
+    ax.set_ylabel("Survival Rate (%)")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+
+if __name__ == "__main__":
+    out_path = save_figure(build_figure(), PROJECT_ROOT / "plots" / OUTPUT)
+    print("Saved:", out_path)
@@ -1,14 +1,17 @@
-import os
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
 import numpy as np
 from pathlib import Path
 
+from matplotlib.figure import Figure
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from query import scan  # noqa: E402
+from render import save_figure  # noqa: E402
 
-df = pd.read_csv(
-    PROJECT_ROOT / "data" / "processed" / "business_survival_rates_2019_clean.csv"
-)
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+OUTPUT = "survival_1yr_vs_5yr_2019.png"
 
 # Columns from your dataset
 region_col = "Region"
@@ -16,43 +19,38 @@ one_year_col = "Surviving After 1 Year – Count"
 five_year_col = "Surviving After 5 Years – Count"
 births_col = "Births of New Enterprises (2019)"
 
-# Keep relevant columns only
-df = df[[region_col, births_col, one_year_col, five_year_col]].dropna()
-
-# Remove total row
-df = df[df[region_col].str.lower() != "total"]
-
-# Handle duplicated regions (keep first occurrence)
-df = df.groupby(region_col, as_index=False).first()
-
-# Select top 10 regions by number of births (most meaningful)
-df = df.sort_values(births_col, ascending=False).head(10)
-
-# Plot setup
-x = np.arange(len(df))
-width = 0.35
-
-plt.figure(figsize=(12, 6))
-plt.bar(x - width / 2, df[one_year_col], width, label="Survived 1 Year", color="navy")
-plt.bar(x + width / 2, df[five_year_col], width, label="Survived 5 Years", color="skyblue")
-
-plt.xticks(x, df[region_col], rotation=45, ha="right")
-plt.ylabel("Number of Businesses")
-plt.title("Business Survival: 1-Year vs 5-Year Outcomes (2019 Cohort)")
-plt.legend()
-plt.tight_layout()
-
-# Save plot
-plots = PROJECT_ROOT / "plots"
-plots.mkdir(exist_ok=True)
-out_path = plots / "survival_1yr_vs_5yr_2019.png"
-plt.savefig(out_path, dpi=300)
-
-# Show locally only
-if os.environ.get("CI") != "true":
-    plt.show()
-
-print("Saved:", out_path)
-
-
 
+def build_figure(processed_dir: Path = PROCESSED_DIR) -> Figure:
+    # Top 10 regions by number of births (most meaningful), dropping the
+    # total row and keeping the first row of duplicated regions; only these
+    # four columns are read
+    df = (
+        scan(processed_dir / "business_survival_rates_2019_clean.csv")
+        .select(region_col, births_col, one_year_col, five_year_col)
+        .dropna()
+        .where(region_col, lambda regions: regions.str.lower() != "total")
+        .distinct(region_col)
+        .top_k(10, by=births_col)
+        .collect()
+    )
+
+    # Plot setup
+    x = np.arange(len(df))
+    width = 0.35
+
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    ax.bar(x - width / 2, df[one_year_col], width, label="Survived 1 Year", color="navy")
+    ax.bar(x + width / 2, df[five_year_col], width, label="Survived 5 Years", color="skyblue")
+
+    ax.set_xticks(x, df[region_col], rotation=45, ha="right")
+    ax.set_ylabel("Number of Businesses")
+    ax.set_title("Business Survival: 1-Year vs 5-Year Outcomes (2019 Cohort)")
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+
+if __name__ == "__main__":
+    out_path = save_figure(build_figure(), PROJECT_ROOT / "plots" / OUTPUT)
+    print("Saved:", out_path)
@@ -1,48 +1,51 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 from pathlib import Path
 
-# Project root 
+# Project root
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-# Load dataset that already contains percentages
-df = pd.read_csv(
-    PROJECT_ROOT / "data" / "processed" / "business_birth_death_rates_clean.csv"
-)
+from datasets import load  # noqa: E402
+from render import save_figure  # noqa: E402
 
-# Assume structure: [Year, Births %, Deaths %]
-years = df.iloc[:, 0]
-births_pct = df.iloc[:, 1]
-deaths_pct = df.iloc[:, 2]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+OUTPUT = "uk_business_birth_death_rates_2019_2024.png"
 
-# Plot
-plt.figure(figsize=(10, 6))
 
-plt.plot(years, births_pct, marker="o", linewidth=3,
-         color="navy", label="Business Birth Rate")
-plt.plot(years, deaths_pct, marker="o", linewidth=3,
-         color="skyblue", label="Business Death Rate")
+def build_figure(processed_dir: Path = PROCESSED_DIR) -> Figure:
+    # Load dataset that already contains percentages
+    df = load(processed_dir / "business_birth_death_rates_clean.csv")
 
-plt.title("UK Business Birth & Death Rates (2019–2024)")
-plt.xlabel("Year")
-plt.ylabel("Rate (%)")
+    # Assume structure: [Year, Births %, Deaths %]
+    years = df.iloc[:, 0]
+    births_pct = df.iloc[:, 1]
+    deaths_pct = df.iloc[:, 2]
 
-# Nice percentage formatting on y-axis
-plt.gca().yaxis.set_major_formatter(FuncFormatter(lambda x, _: f"{x:.1f}%"))
+    # Plot
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
-plt.grid(True, linestyle="--", alpha=0.5)
-plt.xticks(years)  # show each year on x-axis
-plt.legend()
-plt.tight_layout()
+    ax.plot(years, births_pct, marker="o", linewidth=3,
+            color="navy", label="Business Birth Rate")
+    ax.plot(years, deaths_pct, marker="o", linewidth=3,
+            color="skyblue", label="Business Death Rate")
 
-# Save
-plots = PROJECT_ROOT / "plots"
-plots.mkdir(exist_ok=True)
-out_path = plots / "uk_business_birth_death_rates_2019_2024.png"
-plt.savefig(out_path, dpi=300)
-plt.show()
+    ax.set_title("UK Business Birth & Death Rates (2019–2024)")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Rate (%)")
 
-print("Saved plot to:", out_path)
+    # Nice percentage formatting on y-axis
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f"{x:.1f}%"))
 
+    ax.grid(True, linestyle="--", alpha=0.5)
+    ax.set_xticks(years)  # show each year on x-axis
+    ax.legend()
+    fig.tight_layout()
+    return fig
 
+
+if __name__ == "__main__":
+    out_path = save_figure(build_figure(), PROJECT_ROOT / "plots" / OUTPUT)
+    print("Saved plot to:", out_path)
@@ -0,0 +1,249 @@
+"""
+Content-hash build cache for the cleaning stages.
+
+A manifest in data/processed records, for each stage, the hash of every raw
+input, the hash of the cleaning code and the hashes of the output it
+produced (with the Parquet copy next to a processed CSV). A stage whose
+inputs, code and outputs are unchanged since the last run is skipped; an
+output edited or overwritten by anything else makes it stale.
+A stage's code is its script plus every project module the script imports,
+directly or not (code_closure), so editing a shared module marks every
+stage that runs it stale.
+
+Hashes of large files are reused while their size and modification time
+match the manifest, so checking an unchanged catalogue costs one stat() per
+file rather than a full read.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+MANIFEST_PATH = PROJECT_ROOT / "data" / "processed" / "manifest.json"
+MANIFEST_VERSION = 2
+
+_BLOCK_SIZE = 1 << 20
+
+
+def _relative(path: str | Path) -> str:
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def hash_file(path: str | Path) -> str:
+    """SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# "import a, b.c as d" / "from a.b import c" statements, at any indentation
+_IMPORT_LINE = re.compile(r"^[ \t]*(?:from[ \t]+(\w+)[\w.]*[ \t]+import|import[ \t]+([\w., \t]+))", re.MULTILINE)
+
+# path -> (mtime_ns, imported names), so each file is scanned once per change
+_IMPORTS: dict[Path, tuple[int, set[str]]] = {}
+
+
+def _imported_names(path: Path) -> set[str]:
+    """Top-level names of the absolute imports in a source file, including function-level ones."""
+    mtime = path.stat().st_mtime_ns
+    cached = _IMPORTS.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    names = set()
+    for module, modules in _IMPORT_LINE.findall(path.read_text(encoding="utf-8")):
+        if module:
+            names.add(module)
+        else:
+            # "import a.b as c, d": the first word of each part, up to its first dot
+            names.update(part.split()[0].split(".")[0] for part in modules.split(",") if part.strip())
+    _IMPORTS[path] = (mtime, names)
+    return names
+
+
+def code_closure(script: str | Path, search: Iterable[str | Path] = (SRC_DIR,)) -> list[Path]:
+    """
+    ``script`` and every module under ``search`` it imports, transitively.
+
+    Imports are found by scanning source lines, not by importing anything.
+    Third-party and standard-library imports are not followed; only
+    NAME.py files found in a ``search`` directory count as project code.
+    """
+    search = [Path(d) for d in search]
+    found: dict[Path, None] = {}
+    todo = [Path(script).resolve()]
+    while todo:
+        path = todo.pop()
+        if path in found:
+            continue
+        found[path] = None
+        for name in _imported_names(path):
+            todo.extend(d / f"{name}.py" for d in search if (d / f"{name}.py").is_file())
+    return sorted(p.resolve() for p in found)
+
+
+def output_files(output: str | Path) -> list[Path]:
+    """``output`` and, for a CSV, the Parquet copy written next to it (if there is one)."""
+    output = Path(output)
+    parquet = output.with_suffix(".parquet")
+    return [output, parquet] if output.suffix == ".csv" and parquet.exists() else [output]
+
+
+def hash_code(paths: Iterable[str | Path]) -> str:
+    """Combined SHA-256 of the source files a stage depends on."""
+    digest = hashlib.sha256()
+    for path in sorted(_relative(p) for p in paths):
+        digest.update(path.encode())
+        digest.update(hash_file(PROJECT_ROOT / path).encode())
+    return digest.hexdigest()
+
+
+@contextmanager
+def _locked(lock_path: Path):
+    """Exclusive advisory lock on ``lock_path`` (no-op where fcntl is unavailable)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(lock_path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class BuildManifest:
+    """Reads, queries and atomically rewrites the processed-data manifest."""
+
+    def __init__(self, path: str | Path = MANIFEST_PATH):
+        self.path = Path(path)
+        self.stages, self.files = self._read()
+        self._recorded: set[str] = set()
+
+    def _read(self) -> tuple[dict, dict]:
+        if not self.path.exists():
+            return {}, {}
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            return {}, {}
+        return data.get("stages", {}), data.get("files", {})
+
+    def file_hash(self, path: str | Path) -> str:
+        """Hash a file, reusing the recorded hash while size and mtime match."""
+        key = _relative(path)
+        stat = os.stat(path)
+        known = self.files.get(key)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["sha256"]
+
+        sha = hash_file(path)
+        self.files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+        return sha
+
+    def fingerprint(self, inputs: Iterable[str | Path], code: Iterable[str | Path]) -> dict:
+        return {
+            "inputs": {_relative(p): self.file_hash(p) for p in inputs},
+            "code": hash_code(code),
+        }
+
+    def is_up_to_date(
+        self,
+        stage: str,
+        inputs: Iterable[str | Path],
+        output: str | Path,
+        code: Iterable[str | Path],
+        check_output: bool = True,
+    ) -> bool:
+        """
+        True when the stage's inputs and code match the manifest and its
+        output exists. With ``check_output`` its output files must also be
+        the ones the stage last wrote.
+        """
+        record = self.stages.get(stage)
+        if record is None or record.get("output") != _relative(output):
+            return False
+        if not Path(output).exists():
+            return False
+        current = self.fingerprint(inputs, code)
+        if record["inputs"] != current["inputs"] or record["code"] != current["code"]:
+            return False
+        return not check_output or record.get("outputs") == self._output_hashes(output)
+
+    def _output_hashes(self, output: str | Path) -> dict[str, str]:
+        return {_relative(p): self.file_hash(p) for p in output_files(output)}
+
+    def record(
+        self,
+        stage: str,
+        inputs: Iterable[str | Path],
+        output: str | Path,
+        code: Iterable[str | Path],
+    ) -> None:
+        entry = self.fingerprint(inputs, code)
+        entry["output"] = _relative(output)
+        entry["outputs"] = self._output_hashes(output)
+        self.stages[stage] = entry
+        self._recorded.add(stage)
+
+    def save(self) -> None:
+        """
+        Merge this instance's records into the manifest on disk.
+
+        Several processes may build stages at once, so the file is re-read
+        under a lock and only the stages recorded here are replaced. It is
+        written via a temporary file so readers never see half of it.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _locked(self.path.with_suffix(".lock")):
+            stages, files = self._read()
+            stages.update({name: self.stages[name] for name in self._recorded})
+            files.update(self.files)
+            self.stages, self.files = stages, files
+
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            payload = {"version": MANIFEST_VERSION, "stages": stages, "files": files}
+            tmp.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+def run_cached(
+    stage: str,
+    inputs: Iterable[str | Path],
+    output: str | Path,
+    code: Iterable[str | Path],
+    build: Callable[[], None],
+    force: bool = False,
+    manifest_path: str | Path = MANIFEST_PATH,
+) -> bool:
+    """
+    Run ``build`` unless the stage is up to date; return whether it ran.
+
+    ``build`` must write ``output``. The manifest is updated only after a
+    successful build.
+    """
+    inputs = list(inputs)
+    code = list(code)
+    manifest = BuildManifest(manifest_path)
+
+    if not force and manifest.is_up_to_date(stage, inputs, output, code):
+        # Keep any re-hashed file entries so the next check is a stat() again
+        manifest.save()
+        return False
+
+    build()
+    manifest.record(stage, inputs, output, code)
+    manifest.save()
+    return True
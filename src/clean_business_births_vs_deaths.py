@@ -2,38 +2,69 @@
 Clean business_birth_death_rates.csv into a tidy Year / Birth / Death % table.
 """
 
+import sys
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import save_table
+from profiling import account, profiled
+from validation import validated
 
+# Compact dtypes for the Parquet copy of the clean table
+COLUMN_TYPES = {"Year": "int16", "Birth Rate (%)": "float32", "Death Rate (%)": "float32"}
+
+
+@profiled
 def load_raw(path: str | Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
-def detect_year_and_rate_columns(df: pd.DataFrame) -> tuple[str, str, str]:
-    numeric = df.apply(pd.to_numeric, errors="coerce")
+def coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Every column as numbers, with non-numeric cells as NaN."""
+    return df.apply(pd.to_numeric, errors="coerce")
+
+
+def sample_rows(df: pd.DataFrame, n: int, blocks: int = 10) -> pd.DataFrame:
+    """
+    About ``n`` rows taken as ``blocks`` evenly spaced contiguous runs.
+
+    Contiguous slices are views, so the cost does not grow with the table,
+    and runs (unlike single strided rows) cannot all land on the same kind
+    of row in a table with a repeating layout.
+    """
+    if len(df) <= n:
+        return df
+    run = max(1, n // blocks)
+    starts = range(0, len(df) - run + 1, max(run, (len(df) - run) // max(1, blocks - 1)))
+    return pd.concat([df.iloc[start:start + run] for start in starts][:blocks])
 
-    # --- year column ---
-    year_candidates = []
-    for col in df.columns:
-        col_series = numeric[col]
-        n_year_like = col_series.between(2000, 2100).sum()
-        year_candidates.append((col, n_year_like))
 
-    year_col = max(year_candidates, key=lambda x: x[1])[0]
+def detect_year_and_rate_columns(
+    df: pd.DataFrame,
+    numeric: pd.DataFrame | None = None,
+    sample: int | None = None,
+) -> tuple[str, str, str]:
+    """
+    Find the year column and the births / deaths rate columns.
 
-    # --- rate columns (0–100) ---
-    rate_candidates = []
-    for col in df.columns:
-        if col == year_col:
-            continue
-        col_series = numeric[col]
-        n_rate_like = col_series.between(0, 100).sum()
-        if n_rate_like >= 3:  # needs to look like a real column
-            rate_candidates.append((col, n_rate_like))
+    ``numeric`` is df already passed through coerce_numeric(); pass it to
+    avoid coercing twice. Otherwise, with ``sample`` set only that many rows
+    are coerced and scored.
+    """
+    if numeric is None:
+        numeric = coerce_numeric(df if sample is None else sample_rows(df, sample))
 
-    # sort best first
-    rate_candidates.sort(key=lambda x: x[1], reverse=True)
+    # --- year column: most values in 2000-2100 (first column wins ties) ---
+    year_scores = numeric.ge(2000).mul(numeric.le(2100)).sum()
+    year_col = year_scores.idxmax()
+
+    # --- rate columns (0-100) ---
+    rate_scores = numeric.ge(0).mul(numeric.le(100)).sum().drop(year_col)
+    rate_scores = rate_scores[rate_scores >= 3]  # needs to look like a real column
+
+    # sort best first, keeping column order among ties
+    rate_candidates = list(rate_scores.sort_values(ascending=False, kind="stable").index)
 
     if len(rate_candidates) < 2:
         raise ValueError("Could not find two rate-like columns in the file.")
@@ -41,7 +72,7 @@ def detect_year_and_rate_columns(df: pd.DataFrame) -> tuple[str, str, str]:
     # try to use names to decide births vs deaths
     births_col = None
     deaths_col = None
-    for col, _ in rate_candidates:
+    for col in rate_candidates:
         name = col.lower()
         if "birth" in name and births_col is None:
             births_col = col
@@ -50,18 +81,30 @@ def detect_year_and_rate_columns(df: pd.DataFrame) -> tuple[str, str, str]:
 
     # if still missing, fall back to the top 2
     if births_col is None:
-        births_col = rate_candidates[0][0]
+        births_col = rate_candidates[0]
     if deaths_col is None:
         # pick the best candidate that isn't the births column
-        deaths_col = next(col for col, _ in rate_candidates if col != births_col)
+        deaths_col = next(col for col in rate_candidates if col != births_col)
 
     return year_col, births_col, deaths_col
 
 
-def clean_business_birth_death_rates(df: pd.DataFrame) -> pd.DataFrame:
-    year_col, births_col, deaths_col = detect_year_and_rate_columns(df)
+@profiled
+@validated("birth_death_rates")
+def clean_business_birth_death_rates(df: pd.DataFrame, sample: int | None = None) -> pd.DataFrame:
+    """
+    Build the Year / Birth Rate / Death Rate table.
 
-    numeric = df.apply(pd.to_numeric, errors="coerce")
+    The frame is coerced to numbers once and shared with the detection step.
+    With ``sample`` set, detection looks at that many rows only and just the
+    three chosen columns are coerced in full.
+    """
+    if sample is None:
+        numeric = coerce_numeric(df)
+        year_col, births_col, deaths_col = detect_year_and_rate_columns(df, numeric)
+    else:
+        year_col, births_col, deaths_col = detect_year_and_rate_columns(df, sample=sample)
+        numeric = coerce_numeric(df[[year_col, births_col, deaths_col]])
 
     year_series = numeric[year_col]
     births_series = numeric[births_col]
@@ -70,6 +113,11 @@ def clean_business_birth_death_rates(df: pd.DataFrame) -> pd.DataFrame:
     mask = (
         year_series.between(2000, 2100) & births_series.notna() & deaths_series.notna()
     )
+    account({
+        "year out of range": year_series.between(2000, 2100),
+        "no birth rate": births_series.notna(),
+        "no death rate": deaths_series.notna(),
+    })
 
     cleaned = pd.DataFrame(
         {
@@ -84,10 +132,10 @@ def clean_business_birth_death_rates(df: pd.DataFrame) -> pd.DataFrame:
     return cleaned
 
 
-def save_clean(df: pd.DataFrame, out_path: str | Path) -> None:
-    out_path = Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False)
+@profiled
+def save_clean(df: pd.DataFrame, out_path: str | Path, columnar: bool = False) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    save_table(df, out_path, COLUMN_TYPES if columnar else None)
 
 
 if __name__ == "__main__":
@@ -96,10 +144,14 @@ if __name__ == "__main__":
     raw_path = PROJECT_ROOT / "data" / "raw" / "business_birth_death_rates.csv"
     out_path = PROJECT_ROOT / "data" / "processed" / "business_birth_death_rates_clean.csv"
 
-    raw_df = load_raw(raw_path)
-    clean_df = clean_business_birth_death_rates(raw_df)
-    save_clean(clean_df, out_path)
-
-    print(f"Saved cleaned file to: {out_path}")
-    print(clean_df)
-
+    def build() -> None:
+        raw_df = load_raw(raw_path)
+        clean_df = clean_business_birth_death_rates(raw_df)
+        save_clean(clean_df, out_path, columnar=True)
+        print(clean_df)
+
+    code = code_closure(__file__)
+    if run_cached("birth_death_rates", [raw_path], out_path, code, build, force="--force" in sys.argv[1:]):
+        print(f"Saved cleaned file to: {out_path}")
+    else:
+        print("Up to date, skipped:", out_path)
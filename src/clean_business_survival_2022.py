@@ -5,80 +5,40 @@ Source: ONS Business Demography Table 5.1d
 Produces readable survival statistics with clear titled columns.
 """
 
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import DEFAULT_CHUNKSIZE, SPECS, clean_dataset, save_table, stream_clean
+from profiling import profiled
+from validation import validated
 
+
+@profiled
 def load_survival_2022(path: str | Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+@profiled
+@validated("survival_2022")
 def clean_survival_2022(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-
-    # Drop fully empty rows
-    df = df.dropna(how="all")
-
-    # Keep main useful columns only
-    df = df.iloc[:, :5]
-
-    # Remove metadata rows
-    df = df[df.iloc[:, 0].notna()]
-
-    # Temporary logical headers
-    df.columns = [
-        "code",
-        "region",
-        "births_2022",
-        "one_year_survivals",
-        "one_year_survival_rate"
-    ]
-
-    df = df[df["region"].notna()]
-    df = df[df["code"] != "Code"]
-
-    # Clean numeric formatting
-    for col in ["births_2022", "one_year_survivals"]:
-        df[col] = (
-            df[col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace(":", "", regex=False)
-        )
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Survival rate (percent)
-    df["one_year_survival_rate"] = (
-        df["one_year_survival_rate"]
-        .astype(str)
-        .str.replace(":", "", regex=False)
-    )
-    df["one_year_survival_rate"] = pd.to_numeric(
-        df["one_year_survival_rate"], errors="coerce"
-    )
-
-    df = df.dropna(subset=["births_2022"]).reset_index(drop=True)
-
-    # -----------------------
-    # Professional Titles
-    # -----------------------
-    df = df.rename(
-        columns={
-            "code": "Geography Code",
-            "region": "Geography Name",
-            "births_2022": "Number of Business Births (2022)",
-            "one_year_survivals": "Number Still Alive After 1 Year",
-            "one_year_survival_rate": "1-Year Survival Rate (%)"
-        }
-    )
-
-    return df
-
-
-def save_survival_2022(df: pd.DataFrame, output_path: str | Path):
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    return clean_dataset(df, "survival_2022")
+
+
+def stream_survival_2022(path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of the raw 2022 survival table without loading it whole."""
+    return stream_clean(path, SPECS["survival_2022"], chunksize)
+
+
+@profiled
+def save_survival_2022(
+    df: pd.DataFrame | Iterable[pd.DataFrame], output_path: str | Path, columnar: bool = False
+) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    column_types = SPECS["survival_2022"].column_types() if columnar else None
+    save_table(df, output_path, column_types)
 
 
 if __name__ == "__main__":
@@ -87,8 +47,13 @@ if __name__ == "__main__":
     raw = PROJECT_ROOT / "data" / "raw" / "business_survival_2022.csv"
     out = PROJECT_ROOT / "data" / "processed" / "business_survival_2022_clean.csv"
 
-    raw_df = load_survival_2022(raw)
-    clean_df = clean_survival_2022(raw_df)
-    save_survival_2022(clean_df, out)
+    def build() -> None:
+        raw_df = load_survival_2022(raw)
+        clean_df = clean_survival_2022(raw_df)
+        save_survival_2022(clean_df, out, columnar=True)
 
-    print("Saved:", out)
+    code = code_closure(__file__)
+    if run_cached("survival_2022", [raw], out, code, build, force="--force" in sys.argv[1:]):
+        print("Saved:", out)
+    else:
+        print("Up to date, skipped:", out)
@@ -3,88 +3,42 @@ Cleaning pipeline for Business Survival by Region (2019 cohort).
 
 """
 
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import DEFAULT_CHUNKSIZE, SPECS, clean_dataset, save_table, stream_clean
+from profiling import profiled
+from validation import validated
 
+
+@profiled
 def load_survival_2019(path: str | Path) -> pd.DataFrame:
     """Load raw survival table for 2019 cohort."""
     return pd.read_csv(path)
 
 
+@profiled
+@validated("survival_2019")
 def clean_survival_2019(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and structure the 2019 regional survival table."""
-    df = df.copy()
-
-    # Drop fully empty rows
-    df = df.dropna(how="all")
-
-    # The first few rows are metadata:
-    # 0: long title
-    # 1: "This worksheet contains one table"
-    # 2: "Units: ..."
-    # 3: "2019"
-    #
-    # Data starts after that, so drop first 4 rows.
-    df = df.iloc[4:, :]
-
-    # Keep first 6 columns (region + 5 numeric columns)
-    df = df.iloc[:, :6]
-
-    # Rename columns to temporary technical names
-    df.columns = [
-        "region",
-        "births_2019",
-        "survive_1yr_count",
-        "survive_1yr_rate",
-        "survive_5yr_count",
-        "survive_5yr_rate",
-    ]
-
-    # Drop any remaining non-region rows
-    df = df[df["region"].notna()]
-
-    # Clean numeric formatting for all numeric columns
-    numeric_cols = [
-        "births_2019",
-        "survive_1yr_count",
-        "survive_1yr_rate",
-        "survive_5yr_count",
-        "survive_5yr_rate",
-    ]
-
-    for col in numeric_cols:
-        df[col] = (
-            df[col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace(":", "", regex=False)
-            .str.strip()
-        )
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Drop rows with no births (safety)
-    df = df.dropna(subset=["births_2019"]).reset_index(drop=True)
-
-    # Professional, readable titles
-    df = df.rename(
-        columns={
-            "region": "Region",
-            "births_2019": "Births of New Enterprises (2019)",
-            "survive_1yr_count": "Surviving After 1 Year – Count",
-            "survive_1yr_rate": "1-Year Survival Rate (2019 Cohort, %)",
-            "survive_5yr_count": "Surviving After 5 Years – Count",
-            "survive_5yr_rate": "5-Year Survival Rate (2019 Cohort, %)",
-        }
-    )
-
-    return df
-
-
-def save_survival_2019(df: pd.DataFrame, output_path: str | Path) -> None:
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    return clean_dataset(df, "survival_2019")
+
+
+def stream_survival_2019(path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of the raw 2019 regional survival table without loading it whole."""
+    return stream_clean(path, SPECS["survival_2019"], chunksize)
+
+
+@profiled
+def save_survival_2019(
+    df: pd.DataFrame | Iterable[pd.DataFrame], output_path: str | Path, columnar: bool = False
+) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    column_types = SPECS["survival_2019"].column_types() if columnar else None
+    save_table(df, output_path, column_types)
 
 
 if __name__ == "__main__":
@@ -96,9 +50,13 @@ if __name__ == "__main__":
     print("PROJECT ROOT:", PROJECT_ROOT)
     print("RAW PATH:", raw)
 
-    raw_df = load_survival_2019(raw)
-    clean_df = clean_survival_2019(raw_df)
-    save_survival_2019(clean_df, out)
-
-    print("Saved cleaned data to:", out)
+    def build() -> None:
+        raw_df = load_survival_2019(raw)
+        clean_df = clean_survival_2019(raw_df)
+        save_survival_2019(clean_df, out, columnar=True)
 
+    code = code_closure(__file__)
+    if run_cached("survival_2019", [raw], out, code, build, force="--force" in sys.argv[1:]):
+        print("Saved cleaned data to:", out)
+    else:
+        print("Up to date, skipped:", out)
@@ -3,60 +3,42 @@ Cleaning pipeline for UK Business Births 2019 dataset.
 
 """
 
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import DEFAULT_CHUNKSIZE, SPECS, clean_dataset, save_table, stream_clean
+from profiling import profiled
+from validation import validated
 
+
+@profiled
 def load_births_2019(path: str | Path) -> pd.DataFrame:
     """Load raw UK business births 2019 dataset."""
     return pd.read_csv(path)
 
 
+@profiled
+@validated("births_2019")
 def clean_births_2019(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and prepare UK business births 2019 data."""
-    df = df.copy()
-
-    # Drop fully empty rows
-    df = df.dropna(how="all")
-
-    # Keep only first 3 useful columns (code, region, value)
-    df = df.iloc[:, :3]
-
-    # Remove metadata / header rows where first cell is NaN or the word 'Code'
-    df = df[df.iloc[:, 0].notna()]
-    df.columns = ["code", "region", "births_2019"]
-    df = df[df["code"] != "Code"]
-    df = df[df["region"].notna()]
+    return clean_dataset(df, "births_2019")
 
-    # Clean numeric formatting
-    df["births_2019"] = (
-        df["births_2019"]
-        .astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace(":", "", regex=False)
-        .str.strip()
-    )
-    df["births_2019"] = pd.to_numeric(df["births_2019"], errors="coerce")
 
-    # Drop rows with no numeric value
-    df = df.dropna(subset=["births_2019"]).reset_index(drop=True)
+def stream_births_2019(path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of the raw UK business births 2019 table without loading it whole."""
+    return stream_clean(path, SPECS["births_2019"], chunksize)
 
-    # Professional column titles
-    df = df.rename(
-        columns={
-            "code": "Geography Code",
-            "region": "Geography Name",
-            "births_2019": "Number of Business Births (2019)",
-        }
-    )
 
-    return df
-
-
-def save_births_2019(df: pd.DataFrame, output_path: str | Path) -> None:
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+@profiled
+def save_births_2019(
+    df: pd.DataFrame | Iterable[pd.DataFrame], output_path: str | Path, columnar: bool = False
+) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    column_types = SPECS["births_2019"].column_types() if columnar else None
+    save_table(df, output_path, column_types)
 
 
 if __name__ == "__main__":
@@ -68,9 +50,13 @@ if __name__ == "__main__":
     print("PROJECT ROOT:", PROJECT_ROOT)
     print("RAW PATH:", raw)
 
-    raw_df = load_births_2019(raw)
-    clean_df = clean_births_2019(raw_df)
-    save_births_2019(clean_df, out)
-
-    print("Saved cleaned data to:", out)
+    def build() -> None:
+        raw_df = load_births_2019(raw)
+        clean_df = clean_births_2019(raw_df)
+        save_births_2019(clean_df, out, columnar=True)
 
+    code = code_closure(__file__)
+    if run_cached("births_2019", [raw], out, code, build, force="--force" in sys.argv[1:]):
+        print("Saved cleaned data to:", out)
+    else:
+        print("Up to date, skipped:", out)
@@ -5,62 +5,40 @@ Source: ONS Business Demography 2024 (Table 1.1d)
 Outputs a clean table with clear readable column titles.
 """
 
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import DEFAULT_CHUNKSIZE, SPECS, clean_dataset, save_table, stream_clean
+from profiling import profiled
+from validation import validated
 
+
+@profiled
 def load_births_2024(path: str | Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+@profiled
+@validated("births_2024")
 def clean_births_2024(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-
-    # Drop fully empty rows
-    df = df.dropna(how="all")
-
-    # Keep only useful columns (first 3 meaningful columns)
-    df = df.iloc[:, :3]
-
-    # Drop top metadata rows (keep rows starting with region codes or names)
-    df = df[df.iloc[:, 0].notna()]
-
-    # Rename to temporary logical names
-    df.columns = ["code", "region", "births_2024"]
-
-    # Remove weird rows like headers inside table
-    df = df[df["region"].notna()]
-    df = df[df["code"] != "Code"]
-
-    # Clean numeric formatting
-    df["births_2024"] = (
-        df["births_2024"]
-        .astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace(":", "", regex=False)
-    )
-    df["births_2024"] = pd.to_numeric(df["births_2024"], errors="coerce")
-
-    # Final reset
-    df = df.dropna(subset=["births_2024"]).reset_index(drop=True)
+    return clean_dataset(df, "births_2024")
 
-    # Professional Column Titles
-   
-    df = df.rename(
-        columns={
-            "code": "Geography Code",
-            "region": "Geography Name",
-            "births_2024": "Number of Business Births (2024)"
-        }
-    )
 
-    return df
+def stream_births_2024(path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of the raw UK business births 2024 table without loading it whole."""
+    return stream_clean(path, SPECS["births_2024"], chunksize)
 
 
-def save_births_2024(df: pd.DataFrame, output_path: str | Path):
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+@profiled
+def save_births_2024(
+    df: pd.DataFrame | Iterable[pd.DataFrame], output_path: str | Path, columnar: bool = False
+) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    column_types = SPECS["births_2024"].column_types() if columnar else None
+    save_table(df, output_path, column_types)
 
 
 if __name__ == "__main__":
@@ -69,8 +47,13 @@ if __name__ == "__main__":
     raw = PROJECT_ROOT / "data" / "raw" / "uk_business_births_2024.csv"
     out = PROJECT_ROOT / "data" / "processed" / "uk_business_births_2024_clean.csv"
 
-    raw_df = load_births_2024(raw)
-    clean_df = clean_births_2024(raw_df)
-    save_births_2024(clean_df, out)
+    def build() -> None:
+        raw_df = load_births_2024(raw)
+        clean_df = clean_births_2024(raw_df)
+        save_births_2024(clean_df, out, columnar=True)
 
-    print("Saved:", out)
+    code = code_closure(__file__)
+    if run_cached("births_2024", [raw], out, code, build, force="--force" in sys.argv[1:]):
+        print("Saved:", out)
+    else:
+        print("Up to date, skipped:", out)
@@ -0,0 +1,290 @@
+"""
+Table-driven cleaning engine shared by the ONS births, deaths and survival pipelines.
+
+Every regional table goes through the same steps: drop empty rows, keep the
+leading columns, drop metadata / repeated header rows, parse the numeric
+columns and give the result readable titles. A DatasetSpec describes what
+differs between tables; clean_with_spec() does the rest.
+
+Clean tables are compact: counts are nullable Int32, rates float32, and
+every numeric column has a categorical "<title> (status)" companion that
+says whether each cell held a value, was suppressed by ONS (":") or was
+not available (blank or unparseable).
+"""
+
+import importlib.util
+import warnings
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from columnar import ColumnarWriter, columnar_path
+from profiling import account, stage
+from specs import SPECS, DatasetSpec, status_column  # noqa: F401 - re-exported
+
+
+# Characters ONS puts inside numeric cells: thousands separators and the
+# ":" suppression marker.
+_NUMERIC_JUNK = str.maketrans("", "", ",:")
+
+# First-cell patterns of ONS title / notes rows and cohort year banners
+_METADATA_ROW = r"(?:Table\s+\d|This worksheet|Units:|Source:|\d{4}$)"
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Per-cell status of a numeric column; the category order gives the codes
+STATUS_VALUE, STATUS_SUPPRESSED, STATUS_NOT_AVAILABLE = 0, 1, 2
+STATUS_LABELS = ("value", "suppressed", "not available")
+STATUS_DTYPE = pd.CategoricalDtype(list(STATUS_LABELS))
+
+# Cells ONS uses for suppressed (confidential / disclosive) values
+_SUPPRESSED_MARKERS = frozenset({":", "[c]"})
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _parse_distinct(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse distinct raw cells.
+
+    Returns float values, an integer-literal mask and the STATUS_* code of
+    each cell.
+    """
+    raw = [v.strip() for v in pd.Series(values, dtype=object).astype(str)]
+    text = pd.Series([v.translate(_NUMERIC_JUNK).strip() for v in raw], dtype=object)
+    parsed = pd.to_numeric(text, errors="coerce").to_numpy(dtype="float64")
+    int_like = text.str.fullmatch(r"[+-]?\d+").to_numpy(dtype=bool)
+    suppressed = np.fromiter((v in _SUPPRESSED_MARKERS for v in raw), dtype=bool, count=len(raw))
+    status = np.where(
+        ~np.isnan(parsed), STATUS_VALUE, np.where(suppressed, STATUS_SUPPRESSED, STATUS_NOT_AVAILABLE)
+    ).astype(np.int8)
+    return parsed, int_like, status
+
+
+def parse_numeric(df: pd.DataFrame, columns, status: bool = False):
+    """
+    Parse ONS-formatted numeric columns in a single pass.
+
+    Thousands separators, ":" suppression markers and surrounding whitespace
+    are removed and the result coerced to numbers, with anything unparseable
+    becoming NaN. All text columns are factorized together, so each distinct
+    cell is cleaned exactly once however many rows or columns repeat it.
+    Column dtypes follow pd.to_numeric: int64 when every cell is an integer
+    literal, float64 otherwise. Columns that are already numeric are passed
+    through untouched.
+
+    With ``status`` a second frame is returned alongside, holding each
+    cell's status (STATUS_DTYPE) from the same pass.
+    """
+    columns = list(columns)
+    text_cols = [c for c in columns if not pd.api.types.is_numeric_dtype(df[c])]
+    parsed_cols, status_cols = {}, {}
+
+    if text_cols:
+        n = len(df)
+        block = df[text_cols].to_numpy(dtype=object).ravel(order="F")
+        codes, distinct = pd.factorize(block)
+        parsed, int_like, cell_status = _parse_distinct(np.asarray(distinct, dtype=object))
+
+        # Missing cells get code -1; point them at an extra NaN slot
+        parsed = np.append(parsed, np.nan)
+        int_like = np.append(int_like, False)
+        cell_status = np.append(cell_status, np.int8(STATUS_NOT_AVAILABLE))
+
+        for i, col in enumerate(text_cols):
+            col_codes = codes[i * n:(i + 1) * n]
+            values = parsed.take(col_codes)
+            if n and int_like.take(col_codes).all():
+                values = values.astype("int64")
+            parsed_cols[col] = pd.Series(values, index=df.index, name=col)
+            if status:
+                status_cols[col] = cell_status.take(col_codes)
+
+    result = pd.DataFrame(
+        {col: parsed_cols[col] if col in parsed_cols else df[col] for col in columns},
+        index=df.index,
+    )
+    if not status:
+        return result
+
+    for col in columns:
+        if col not in status_cols:
+            status_cols[col] = np.where(df[col].notna(), STATUS_VALUE, STATUS_NOT_AVAILABLE).astype(np.int8)
+    statuses = pd.DataFrame(
+        {col: pd.Categorical.from_codes(status_cols[col], dtype=STATUS_DTYPE) for col in columns},
+        index=df.index,
+    )
+    return result, statuses
+
+
+def to_counts(values: pd.Series) -> pd.Series:
+    """
+    Store a parsed count column as nullable Int32.
+
+    Raises ValueError if a value is fractional or does not fit in 32 bits,
+    rather than silently truncating it.
+    """
+    numbers = values.to_numpy(dtype="float64", na_value=np.nan)
+    present = numbers[~np.isnan(numbers)]
+    if (present != np.round(present)).any():
+        raise ValueError(f"Column {values.name!r} holds non-integer counts")
+    if (np.abs(present) > _INT32_MAX).any():
+        raise ValueError(f"Column {values.name!r} holds counts too large for int32")
+    return values.astype("Int32")
+
+
+def _clean_rows(df: pd.DataFrame, spec: DatasetSpec) -> pd.DataFrame:
+    """Filter, parse and title rows that are already trimmed to spec.columns."""
+    df = df.set_axis(list(spec.columns), axis=1)
+
+    # Metadata rows, blank regions and repeated "Code" header rows in one mask
+    with stage("drop metadata rows", len(df)) as s:
+        masks = {"blank first cell": df.iloc[:, 0].notna(), "blank region": df[spec.region_col].notna()}
+        if spec.code_col is not None:
+            masks["repeated header"] = df[spec.code_col] != "Code"
+        keep = masks["blank first cell"] & masks["blank region"]
+        if spec.code_col is not None:
+            keep &= masks["repeated header"]
+        account(masks)
+        df = df[keep]
+        s.rows_out = len(df)
+
+    with stage("parse numeric", len(df)) as s:
+        numeric, status = parse_numeric(df, spec.numeric, status=True)
+        df = df.assign(**{
+            col: numeric[col].astype("float32") if col in spec.rates else to_counts(numeric[col])
+            for col in spec.numeric
+        })
+        df = df.assign(**{status_column(col): status[col] for col in spec.numeric})
+        s.rows_out = len(df)
+
+    # Rows with no value in the key numeric column are notes or footers
+    with stage("drop rows without " + spec.required, len(df)) as s:
+        df = df.dropna(subset=[spec.required])
+        s.rows_out = len(df)
+
+    return df.rename(columns={
+        **spec.rename,
+        **{status_column(col): status_column(spec.rename.get(col, col)) for col in spec.numeric},
+    })
+
+
+def clean_with_spec(df: pd.DataFrame, spec: DatasetSpec) -> pd.DataFrame:
+    """Clean one raw ONS table according to its DatasetSpec."""
+    # Drop fully empty rows, then leading metadata rows and trailing columns
+    with stage("drop empty rows", len(df)) as s:
+        df = df.dropna(how="all")
+        s.rows_out = len(df)
+    with stage("skip leading rows", len(df)) as s:
+        df = df.iloc[spec.skip_rows:, :len(spec.columns)]
+        s.rows_out = len(df)
+    return _clean_rows(df, spec).reset_index(drop=True)
+
+
+def is_metadata_row(first_cells: pd.Series) -> pd.Series:
+    """
+    Flag ONS title / notes rows by their first cell.
+
+    Matches the "Table 2.1d - ..." title, "This worksheet contains one table",
+    "Units: ...", "Source: ..." and bare year banners such as "2019".
+    """
+    text = first_cells.astype("string").str.strip()
+    return text.str.match(_METADATA_ROW, na=False).astype(bool)
+
+
+def stream_clean(
+    path: str | Path, spec: DatasetSpec, chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield cleaned chunks of a raw ONS CSV without reading it whole.
+
+    Only the leading len(spec.columns) columns are parsed. Metadata rows are
+    recognised per chunk by is_metadata_row() rather than by position, so
+    they may appear anywhere in the file. Every chunk has the same compact
+    schema as clean_with_spec(); the chunks carry one continuous RangeIndex
+    and concatenate to the same values. A file with no data rows yields one
+    empty chunk, so the clean table still gets its header.
+    """
+    reader = pd.read_csv(
+        path,
+        header=None,
+        usecols=range(len(spec.columns)),
+        dtype=str,
+        encoding="utf-8-sig",
+        chunksize=chunksize,
+    )
+    offset = 0
+    with reader:
+        for chunk in reader:
+            with stage("drop empty rows", len(chunk)) as s:
+                chunk = chunk.dropna(how="all")
+                s.rows_out = len(chunk)
+            with stage("drop title rows", len(chunk)) as s:
+                chunk = chunk[~is_metadata_row(chunk.iloc[:, 0])]
+                s.rows_out = len(chunk)
+            cleaned = _clean_rows(chunk, spec)
+            cleaned.index = pd.RangeIndex(offset, offset + len(cleaned))
+            offset += len(cleaned)
+            if len(cleaned):
+                yield cleaned
+    if offset == 0:
+        yield _clean_rows(pd.DataFrame(columns=list(spec.columns), dtype=str), spec)
+
+
+def clean_dataset(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """Clean a raw table using the registered spec called ``name``."""
+    try:
+        spec = SPECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown dataset spec: {name!r}") from None
+    return clean_with_spec(df, spec)
+
+
+def save_table(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    output_path: str | Path,
+    column_types: dict[str, str] | None = None,
+) -> None:
+    """
+    Write a clean table to CSV.
+
+    ``data`` is either a DataFrame or an iterable of DataFrame chunks (as
+    produced by stream_clean); chunks are appended as they arrive, so the
+    full table is never held in memory. With ``column_types`` a typed
+    Parquet copy is written next to the CSV in the same pass (see
+    columnar.py); it is skipped with a warning when pyarrow is missing.
+    Raises ValueError, leaving no output behind, when an iterable yields no
+    chunk at all (there would be no header to write).
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if column_types is not None and importlib.util.find_spec("pyarrow") is None:
+        warnings.warn("pyarrow is not installed; writing CSV only", stacklevel=2)
+        column_types = None
+    columnar = ColumnarWriter(columnar_path(output_path), column_types) if column_types else None
+
+    if isinstance(data, pd.DataFrame):
+        with stage("write csv", len(data)):
+            data.to_csv(output_path, index=False)
+        if columnar is not None:
+            with stage("write parquet", len(data)), columnar:
+                columnar.write(data)
+        return
+
+    written = 0
+    try:
+        with open(output_path, "w", newline="", encoding="utf-8") as fh:
+            for written, chunk in enumerate(data, start=1):
+                chunk.to_csv(fh, index=False, header=written == 1)
+                if columnar is not None:
+                    columnar.write(chunk)
+    finally:
+        if columnar is not None:
+            columnar.close()
+        if not written:
+            output_path.unlink(missing_ok=True)
+    if not written:
+        raise ValueError(f"No chunks to write to {output_path.name}")
@@ -0,0 +1,193 @@
+"""
+One entry point for cleaning, plotting, the full pipeline and the benchmarks.
+
+    python src/cli.py info                        # datasets, charts, what is stale
+    python src/cli.py clean [name ...] [--force]
+    python src/cli.py plot [chart ...] [--tier preview|publication|all]
+    python src/cli.py run [--jobs N] [--force] [--dry-run]
+    python src/cli.py bench cleaning_engine|scaling [benchmark options ...]
+    python src/cli.py watch [--debounce 0.5]       # rebuild on data/raw changes
+
+Only the standard library is imported up front. Each subcommand imports
+what it needs when it runs, and cleaning and rendering happen in worker
+processes, so pandas and matplotlib are never loaded by --help or info.
+--import-time runs the command under ``python -X importtime`` and prints
+the slowest imports afterwards.
+"""
+
+import argparse
+import re
+import runpy
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = PROJECT_ROOT / "benchmarks"
+
+# "import time: self [us] | cumulative | imported package" lines of -X importtime
+_IMPORT_TIME = re.compile(r"import time:\s*(\d+) \|\s*(\d+) \| (\s*)(\S+)")
+
+
+def _relative(path: Path) -> str:
+    return str(path.relative_to(PROJECT_ROOT))
+
+
+def cmd_info(args) -> int:
+    from pipeline import build_stages, stale_stages
+
+    stages = build_stages()
+    stale = stale_stages(stages)
+    for kind, title in (("clean", "Datasets"), ("plot", "Charts")):
+        print(f"{title}:")
+        rows = [s for s in stages.values() if s.kind == kind]
+        width = max(len(s.name) for s in rows)
+        for s in rows:
+            missing = [p.name for p in s.inputs if not p.exists()]
+            state = f"missing {', '.join(missing)}" if missing else ("stale" if s.name in stale else "fresh")
+            print(f"  {s.name:<{width}}  {state:<7}  {_relative(s.output)}")
+    return 0
+
+
+def _run_stages(stages: dict, jobs: int | None, force: bool) -> int:
+    from pipeline import print_report, run_pipeline
+
+    start = time.perf_counter()
+    results = run_pipeline(stages, jobs=jobs, force=force)
+    print_report(results, time.perf_counter() - start)
+    return int(any(status in ("failed", "blocked") for status, _ in results.values()))
+
+
+def cmd_clean(args) -> int:
+    from pipeline import build_stages
+
+    stages = {name: s for name, s in build_stages().items() if s.kind == "clean"}
+    unknown = set(args.names) - stages.keys()
+    if unknown:
+        raise SystemExit(f"Unknown datasets: {', '.join(sorted(unknown))}")
+    if args.names:
+        stages = {name: stages[name] for name in args.names}
+    return _run_stages(stages, args.jobs, args.force)
+
+
+def cmd_plot(args) -> int:
+    from render import TIERS, chart_scripts, print_report, render_all
+
+    scripts = chart_scripts(args.charts)
+    failed = False
+    for tier in list(TIERS) if args.tier == "all" else [args.tier]:
+        start = time.perf_counter()
+        results = render_all(scripts, tier, jobs=args.jobs)
+        print_report(results, tier, time.perf_counter() - start)
+        failed |= any(status == "failed" for status, _, _ in results.values())
+    return int(failed)
+
+
+def cmd_run(args) -> int:
+    from pipeline import build_stages, print_plan
+
+    stages = build_stages()
+    if args.dry_run:
+        print_plan(stages, args.force)
+        return 0
+    return _run_stages(stages, args.jobs, args.force)
+
+
+def cmd_bench(args) -> int:
+    script = BENCH_DIR / f"bench_{args.benchmark}.py"
+    saved_argv = sys.argv
+    sys.argv = [str(script), *args.options]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def cmd_watch(args) -> int:
+    from watch import Watcher
+
+    try:
+        Watcher(debounce=args.debounce, interval=args.interval, jobs=args.jobs).run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="UK business demography pipeline.")
+    parser.add_argument("--import-time", action="store_true", help="profile the command's imports")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("info", help="list datasets and charts and whether they are up to date")
+
+    clean = commands.add_parser("clean", help="rebuild processed tables")
+    clean.add_argument("names", nargs="*", help="datasets to clean (default: all)")
+    clean.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    clean.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    plot = commands.add_parser("plot", help="render charts headlessly")
+    plot.add_argument("charts", nargs="*", help="chart script names (default: all)")
+    plot.add_argument("--tier", choices=["publication", "preview", "all"], default="publication")
+    plot.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    run = commands.add_parser("run", help="run every stale cleaning and plotting stage")
+    run.add_argument("--force", action="store_true", help="rebuild every stage")
+    run.add_argument("--dry-run", action="store_true", help="show what would be rebuilt")
+    run.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    bench = commands.add_parser("bench", help="run a benchmark script")
+    bench.add_argument("benchmark", choices=sorted(p.stem[len("bench_"):] for p in BENCH_DIR.glob("bench_*.py")))
+    bench.add_argument("options", nargs=argparse.REMAINDER, help="passed to the benchmark")
+
+    watch = commands.add_parser("watch", help="rebuild what changed files in data/raw affect")
+    watch.add_argument("--debounce", type=float, default=0.5, help="seconds of quiet before a rebuild")
+    watch.add_argument("--interval", type=float, default=0.2, help="seconds between polls")
+    watch.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    for name, sub in commands.choices.items():
+        sub.set_defaults(func=globals()[f"cmd_{name}"])
+    return parser
+
+
+def slowest_imports(report: str, n: int = 15) -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) of the top-level imports in an -X importtime report, slowest first."""
+    rows = []
+    for match in _IMPORT_TIME.finditer(report):
+        own, cumulative, indent, module = match.groups()
+        if not indent:
+            rows.append((module, int(own), int(cumulative)))
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:n]
+
+
+def _profile_imports(argv: list[str], n: int = 15) -> int:
+    """Re-run ``argv`` under -X importtime and list the ``n`` slowest imports."""
+    import subprocess
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, *argv], stderr=subprocess.PIPE, text=True
+    )
+    wall = time.perf_counter() - start
+    other = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+    if other:
+        print("\n".join(other), file=sys.stderr)
+
+    rows = slowest_imports(proc.stderr, n)
+    print(f"\nImports (top level, slowest {len(rows)}); command wall time {wall * 1000:.0f} ms")
+    width = max((len(module) for module, _, _ in rows), default=0)
+    for module, own, cumulative in rows:
+        print(f"  {module:<{width}}  {cumulative / 1000:8.1f} ms  (self {own / 1000:.1f} ms)")
+    return proc.returncode
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = build_parser().parse_args(argv)
+    if args.import_time:
+        return _profile_imports([a for a in argv if a != "--import-time"])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
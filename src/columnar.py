@@ -0,0 +1,139 @@
+"""
+Typed columnar (Parquet) copies of the processed tables.
+
+Next to each processed CSV the cleaners can write a Parquet file with the
+same columns stored compactly: counts as nullable int32, rates as float32
+and geography codes / names as categoricals. Readers that only need a few
+columns load just those columns from the Parquet file instead of parsing
+the whole CSV.
+
+Parquet support needs pyarrow; without it the CSV is still written and
+read_processed() falls back to the CSV.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def columnar_path(csv_path: str | Path) -> Path:
+    """Parquet file that sits next to a processed CSV."""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def to_columnar(df: pd.DataFrame, column_types: dict[str, str]) -> pd.DataFrame:
+    """Cast the columns named in ``column_types``; other columns are left alone."""
+    return df.astype({col: dtype for col, dtype in column_types.items() if col in df.columns})
+
+
+class ColumnarWriter:
+    """
+    Append DataFrame chunks to one Parquet file with a fixed typed schema.
+
+    The schema comes from the first chunk. Categorical columns are stored as
+    dictionary<int32, string> so chunks with different category sets can go
+    into the same file.
+    """
+
+    def __init__(self, path: str | Path, column_types: dict[str, str]):
+        self.path = Path(path)
+        self.column_types = column_types
+        self._schema = None
+        self._writer = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        typed = to_columnar(chunk, self.column_types)
+        if self._writer is None:
+            schema = pa.Schema.from_pandas(typed, preserve_index=False)
+            for col, dtype in self.column_types.items():
+                if dtype == "category" and col in typed.columns:
+                    i = schema.get_field_index(col)
+                    schema = schema.set(i, pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+            self._schema = schema
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, schema)
+
+        table = pa.Table.from_pandas(typed, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Row predicates understood by read_processed(), as (column, op, value)
+_FILTER_OPS = {
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def apply_filters(df: pd.DataFrame, filters) -> pd.DataFrame:
+    """Keep the rows of ``df`` matching every (column, op, value) predicate."""
+    if not filters:
+        return df
+    keep = pd.Series(True, index=df.index)
+    for col, op, value in filters:
+        try:
+            keep &= _FILTER_OPS[op](df[col], value).fillna(False).astype(bool)
+        except KeyError:
+            raise ValueError(f"Unsupported filter op: {op!r}") from None
+    return df[keep]
+
+
+def current_columnar(csv_path: str | Path) -> Path | None:
+    """The Parquet copy of a processed CSV if it exists and is at least as new as the CSV, else None."""
+    csv_path = Path(csv_path)
+    parquet = columnar_path(csv_path)
+    if parquet.exists() and (not csv_path.exists() or parquet.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns):
+        return parquet
+    return None
+
+
+def read_processed(
+    csv_path: str | Path, columns: list[str] | None = None, filters: list[tuple] | None = None
+) -> pd.DataFrame:
+    """
+    Load a processed table, reading only ``columns`` when given.
+
+    Uses the Parquet copy when it exists, is at least as new as the CSV and
+    pyarrow is installed; otherwise reads the CSV. ``filters`` are
+    (column, op, value) row predicates, all of which must hold; with Parquet
+    they are evaluated by the reader, which skips row groups that cannot
+    match. Filter columns need not be among ``columns``.
+    """
+    csv_path = Path(csv_path)
+    parquet = current_columnar(csv_path)
+
+    if parquet is not None:
+        try:
+            if not filters:
+                return pd.read_parquet(parquet, columns=columns)
+            for _, op, _ in filters:
+                if op not in _FILTER_OPS:
+                    raise ValueError(f"Unsupported filter op: {op!r}")
+            df = pd.read_parquet(parquet, columns=columns, filters=list(filters))
+            return df.reset_index(drop=True)
+        except ImportError:
+            pass
+
+    read_cols = None if columns is None else list(dict.fromkeys([*columns, *(f[0] for f in filters or ())]))
+    df = apply_filters(pd.read_csv(csv_path, usecols=read_cols), filters)
+    if filters:
+        df = df.reset_index(drop=True)
+    return df if columns is None else df[columns]
@@ -0,0 +1,116 @@
+"""
+Year-over-year comparison and ranking on the births / deaths panel.
+
+YearComparison takes two years of a BirthsDeathsPanel and computes, for
+every metric and geography at once, the values in both years, their total,
+the absolute and percentage change, as (metric, geography) arrays.
+Leaderboards use partial selection (np.argpartition): picking the top or
+bottom k of n geographies costs O(n + k log k) rather than a full sort.
+
+    comparison = YearComparison(panel, 2019, 2024, level="LA")
+    comparison.top(15, by="total", metric="deaths")
+"""
+
+import numpy as np
+import pandas as pd
+
+from panel import BirthsDeathsPanel
+
+MEASURES = ("before", "after", "total", "change", "pct_change")
+
+
+def top_k_indices(values: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """
+    Positions of the ``k`` largest (or smallest) values along the last axis, best first.
+
+    NaN never ranks ahead of a number. Works on 1-D arrays and on 2-D
+    (metric, geography) arrays, returning one row of positions per metric.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(values.shape[:-1] + (0,), dtype=np.int64)
+
+    # Rank on a key where "better" is smaller and NaN is worst
+    key = np.where(np.isnan(values), np.inf, -values if largest else values)
+    if k < n:
+        part = np.argpartition(key, k - 1, axis=-1)[..., :k]
+    else:
+        part = np.broadcast_to(np.arange(n), values.shape).copy()
+    # Sort just the k winners; ties keep their original order
+    part = np.sort(part, axis=-1)
+    order = np.argsort(np.take_along_axis(key, part, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(part, order, axis=-1)
+
+
+class YearComparison:
+    """Two years of every panel metric side by side, for a set of geographies."""
+
+    def __init__(
+        self,
+        panel: BirthsDeathsPanel,
+        year_a: int,
+        year_b: int,
+        level: str | None = None,
+        mask: np.ndarray | None = None,
+    ):
+        self.panel = panel
+        self.metrics = panel.metrics
+        self.years = (year_a, year_b)
+
+        # (metric, geography, 2): a view when the two years are adjacent
+        values = panel.block([year_a, year_b], level)
+        codes, names = panel.codes(level), panel.names(level)
+        if mask is not None:
+            values, codes = values[:, mask], codes[mask]
+            names = None if names is None else names[mask]
+        self.codes = codes
+        self.names = names
+
+        self.before = values[..., 0].astype(np.float64)
+        self.after = values[..., 1].astype(np.float64)
+        self.total = self.before + self.after
+        self.change = self.after - self.before
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.pct_change = np.where(self.before != 0, 100 * self.change / self.before, np.nan)
+
+    def measure(self, by: str, metric: str | None = None) -> np.ndarray:
+        """One measure as (metric, geography), or (geography,) for one metric."""
+        if by not in MEASURES:
+            raise ValueError(f"Unknown measure: {by!r}")
+        values = getattr(self, by)
+        if metric is None:
+            return values
+        if metric not in self.metrics:
+            raise KeyError(f"Metric not in panel: {metric!r}")
+        return values[self.metrics.index(metric)]
+
+    def rank(self, by: str = "after", metric: str | None = None) -> np.ndarray:
+        """1-based rank of every geography, largest first; NaN ranks last."""
+        values = self.measure(by, metric)
+        order = top_k_indices(values, values.shape[-1])
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, values.shape[-1] + 1), axis=-1)
+        return ranks
+
+    def _leaderboard(self, k: int, by: str, metric: str, largest: bool) -> pd.DataFrame:
+        m = self.metrics.index(metric)
+        picked = top_k_indices(self.measure(by, metric), k, largest)
+        frame = pd.DataFrame({"Geography Code": np.asarray(self.codes)[picked]})
+        if self.names is not None:
+            frame["Geography Name"] = self.names[picked]
+        year_a, year_b = self.years
+        frame[year_a] = self.before[m, picked]
+        frame[year_b] = self.after[m, picked]
+        for name in ("total", "change", "pct_change"):
+            frame[name] = getattr(self, name)[m, picked]
+        return frame
+
+    def top(self, k: int, by: str = "after", metric: str | None = None) -> pd.DataFrame:
+        """The ``k`` geographies with the largest ``by``, best first."""
+        return self._leaderboard(k, by, metric or self.metrics[0], largest=True)
+
+    def bottom(self, k: int, by: str = "after", metric: str | None = None) -> pd.DataFrame:
+        """The ``k`` geographies with the smallest ``by``, smallest first."""
+        return self._leaderboard(k, by, metric or self.metrics[0], largest=False)
@@ -0,0 +1,149 @@
+"""
+Process-local registry of loaded processed tables.
+
+Plots and analysis code load processed tables through load() instead of
+reading the files themselves. A load that nothing cached covers reads only
+the columns and rows it asks for, with the projection and filters pushed
+into read_processed() (and so into the Parquet reader, see columnar.py),
+and keeps that frame. A later load is served from memory when a cached
+frame of the same file covers it: it has every column the load needs and
+no filter the load lacks. Entries are checked against the size and
+modification time of the CSV and its Parquet copy, so a file rewritten by
+a cleaner is read again.
+
+Cached tables are evicted least recently used first once their total size
+passes the memory budget (ONS_DATASET_BUDGET_MB, default 256 MiB). A table
+larger than the whole budget is returned without being kept.
+
+Returned frames are views of the cached table: with pandas' copy-on-write
+(always on from pandas 3, which requirements.txt requires), modifying one
+copies it and never changes what other callers get back.
+
+    deaths = load(PROCESSED_DIR / "uk_business_deaths_2024_clean.csv", columns=[...])
+"""
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from columnar import apply_filters, columnar_path, read_processed
+
+BUDGET_ENV = "ONS_DATASET_BUDGET_MB"
+DEFAULT_BUDGET_MB = 256
+
+
+@dataclass
+class RegistryStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class DatasetRegistry:
+    """Memoized, LRU-evicted processed tables under a memory budget."""
+
+    def __init__(self, budget_mb: float | None = None):
+        if budget_mb is None:
+            budget_mb = float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MB))
+        self.budget = int(budget_mb * 2**20)
+        self.stats = RegistryStats()
+        # (resolved path, columns, filters) -> (file signature, frame, bytes), least recently used first
+        self._entries: OrderedDict[tuple, tuple[tuple, pd.DataFrame, int]] = OrderedDict()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path) -> bool:
+        path = Path(path).resolve()
+        return any(key[0] == path for key in self._entries)
+
+    def _drop(self, key: tuple) -> None:
+        *_, nbytes = self._entries.pop(key)
+        self.nbytes -= nbytes
+
+    @staticmethod
+    def _signature(path: Path) -> tuple:
+        """Size and mtime of the CSV and of its Parquet copy (if any)."""
+        signature = []
+        for file in (path, columnar_path(path)):
+            try:
+                stat = file.stat()
+                signature += [stat.st_size, stat.st_mtime_ns]
+            except FileNotFoundError:
+                signature += [None, None]
+        if signature == [None] * 4:
+            raise FileNotFoundError(path)
+        return tuple(signature)
+
+    def _cached(self, path: Path, signature: tuple, columns, filters) -> tuple[pd.DataFrame, list] | None:
+        """A cached frame of ``path`` covering the load, with the filters still to apply to it."""
+        for key in reversed(list(self._entries)):
+            entry_path, entry_columns, entry_filters = key
+            if entry_path != path:
+                continue
+            if self._entries[key][0] != signature:
+                self._drop(key)
+                continue
+            if not set(entry_filters) <= set(filters):
+                continue
+            residual = [f for f in filters if f not in entry_filters]
+            if entry_columns is not None:
+                if columns is None or not {*columns, *(f[0] for f in residual)} <= set(entry_columns):
+                    continue
+            self._entries.move_to_end(key)
+            return self._entries[key][1], residual
+        return None
+
+    def _table(self, path: str | Path, columns=None, filters=()) -> tuple[pd.DataFrame, list]:
+        """The frame serving a load of ``columns`` / ``filters`` and the filters left to apply."""
+        path = Path(path).resolve()
+        signature = self._signature(path)
+        cached = self._cached(path, signature, columns, filters)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+
+        self.stats.misses += 1
+        frame = read_processed(path, None if columns is None else list(columns), list(filters) or None)
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        if nbytes <= self.budget:
+            while self._entries and self.nbytes + nbytes > self.budget:
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+            self._entries[(path, columns, filters)] = (signature, frame, nbytes)
+            self.nbytes += nbytes
+        return frame, []
+
+    def load(self, path: str | Path, columns: list[str] | None = None, filters=None) -> pd.DataFrame:
+        """
+        A processed table, optionally projected to ``columns`` and filtered.
+
+        ``filters`` are (column, op, value) tuples as in columnar.read_processed.
+        """
+        columns = None if columns is None else tuple(dict.fromkeys(columns))
+        filters = tuple(
+            (col, op, tuple(value) if isinstance(value, (list, set)) else value) for col, op, value in filters or ()
+        )
+        frame, residual = self._table(path, columns, filters)
+        if residual:
+            frame = apply_filters(frame, residual).reset_index(drop=True)
+        if columns is not None:
+            frame = frame[list(columns)]
+        # A new frame over the cached arrays; copy-on-write copies them only if it is modified
+        return frame.copy(deep=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+
+REGISTRY = DatasetRegistry()
+
+
+def load(path: str | Path, columns: list[str] | None = None, filters=None) -> pd.DataFrame:
+    """Load through the process-wide registry (see DatasetRegistry.load)."""
+    return REGISTRY.load(path, columns, filters)
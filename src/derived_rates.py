@@ -0,0 +1,165 @@
+"""
+Birth, death, net formation and churn rates for every geography at once.
+
+Births and deaths come from a BirthsDeathsPanel; active enterprise counts
+come from any table of Geography Code / Year / Active rows and are joined
+onto the panel's geography index and years. All measures are then derived
+in one broadcast over (count, geography, year):
+
+    birth_rate          = 100 * births / active
+    death_rate          = 100 * deaths / active
+    net_formation       = births - deaths
+    net_formation_rate  = 100 * (births - deaths) / active
+    churn_rate          = 100 * (births + deaths) / active
+
+Rates are NaN wherever the active count is missing or zero. The only
+active counts ONS publishes alongside these tables are the UK figures in
+Table 1 (read_active_counts); local-authority counts (Table 3.1) can be
+passed in the same shape to get rates below UK level.
+
+    rates = DerivedRates(BirthsDeathsPanel.from_processed(), read_active_counts())
+    rates.frame("birth_rate", level="UK")
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from geography import CODE_COL, NAME_COL
+from panel import BirthsDeathsPanel
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+RATES_RAW = RAW_DIR / "business_birth_death_rates.csv"
+
+UK_CODE = "K02000001"
+YEAR_COL = "Year"
+ACTIVE_COL = "Active"
+
+MEASURES = ("birth_rate", "death_rate", "net_formation", "net_formation_rate", "churn_rate")
+
+
+def read_active_counts(path: str | Path = RATES_RAW) -> pd.DataFrame:
+    """
+    UK active enterprise counts by year from Table 1 (business_birth_death_rates.csv).
+
+    The table publishes counts to the nearest thousand; they are returned
+    in enterprises.
+    """
+    cells = pd.read_csv(path, header=None, dtype=str, encoding="utf-8-sig")
+    header = cells.apply(lambda col: col.str.strip().str.lower() == "active").to_numpy()
+    rows, cols = np.nonzero(header)
+    if not len(cols):
+        raise ValueError(f"No 'Active' column in {Path(path).name}")
+    years = pd.to_numeric(cells.iloc[:, 0], errors="coerce")
+    active = pd.to_numeric(cells.iloc[:, cols[0]].str.replace(",", "", regex=False), errors="coerce")
+    keep = years.between(2000, 2100) & active.notna()
+    return pd.DataFrame({
+        CODE_COL: UK_CODE,
+        YEAR_COL: years[keep].astype(int).to_numpy(),
+        ACTIVE_COL: active[keep].to_numpy() * 1000,
+    })
+
+
+def derive_rates(births: np.ndarray, deaths: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """
+    Every measure from broadcastable count arrays, as (measure, ...) in MEASURES order.
+    """
+    births, deaths, active = np.broadcast_arrays(
+        np.asarray(births, dtype=np.float64),
+        np.asarray(deaths, dtype=np.float64),
+        np.asarray(active, dtype=np.float64),
+    )
+    net = births - deaths
+    counts = np.stack([births, deaths, net, births + deaths])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_active = np.where(active > 0, 100 * counts / active, np.nan)
+    birth_rate, death_rate, net_rate, churn = per_active
+    return np.stack([birth_rate, death_rate, net, net_rate, churn])
+
+
+class DerivedRates:
+    """Derived rate measures as (measure, geography, year), aligned with a panel."""
+
+    def __init__(self, panel: BirthsDeathsPanel, active: pd.DataFrame | None = None):
+        for metric in ("births", "deaths"):
+            if metric not in panel.metrics:
+                raise KeyError(f"Panel has no {metric} metric")
+        self.panel = panel
+        self.active = self._align_active(active)
+        self.values = derive_rates(panel.get("births"), panel.get("deaths"), self.active)
+
+    def _align_active(self, active: pd.DataFrame | None) -> np.ndarray:
+        """Active counts joined onto the panel's (geography, year) grid; NaN where absent."""
+        panel = self.panel
+        grid = np.full((len(panel.geo), len(panel.years)), np.nan)
+        if active is None or active.empty:
+            return grid
+        ids = panel.geo.encode(active[CODE_COL])
+        years = active[YEAR_COL].to_numpy(dtype=np.int64)
+        positions = np.searchsorted(panel.years, years)
+        known = (ids >= 0) & (positions < len(panel.years))
+        known[known] = panel.years[positions[known]] == years[known]
+        grid[ids[known], positions[known]] = pd.to_numeric(active[ACTIVE_COL]).to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )[known]
+        return grid
+
+    def _rows(self, level: str | None):
+        if level is None:
+            return slice(None)
+        return self.panel.geo.encode(self.panel.codes(level))
+
+    def get(self, measure: str, level: str | None = None) -> np.ndarray:
+        """Geography x year values of one measure; rows follow panel.codes(level)."""
+        if measure not in MEASURES:
+            raise ValueError(f"Unknown measure: {measure!r}")
+        return self.values[MEASURES.index(measure)][self._rows(level)]
+
+    def frame(self, measure: str, level: str | None = None) -> pd.DataFrame:
+        """get() as a labelled DataFrame (codes x years)."""
+        return pd.DataFrame(
+            self.get(measure, level), index=self.panel.codes(level), columns=self.panel.years
+        )
+
+    def table(self, level: str | None = None) -> pd.DataFrame:
+        """Long table: one row per geography and year with the counts and every measure."""
+        rows = self._rows(level)
+        codes = self.panel.codes(level)
+        n_geo, n_year = len(codes), len(self.panel.years)
+        table = pd.DataFrame({
+            CODE_COL: np.repeat(np.asarray(codes, dtype=object), n_year),
+            YEAR_COL: np.tile(self.panel.years, n_geo),
+        })
+        names = self.panel.names(level)
+        if names is not None:
+            table.insert(1, NAME_COL, np.repeat(names, n_year))
+        table["births"] = self.panel.get("births")[rows].ravel()
+        table["deaths"] = self.panel.get("deaths")[rows].ravel()
+        table["active"] = self.active[rows].ravel()
+        for i, measure in enumerate(MEASURES):
+            table[measure] = self.values[i][rows].ravel()
+        return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Derived birth, death and churn rates by geography.")
+    parser.add_argument("--level", help="geography level to report (default: all)")
+    parser.add_argument("--active", type=Path, help="CSV of Geography Code, Year, Active (default: UK Table 1)")
+    parser.add_argument("--output", type=Path, help="write the long table to this CSV")
+    args = parser.parse_args()
+
+    active = pd.read_csv(args.active) if args.active else read_active_counts()
+    rates = DerivedRates(BirthsDeathsPanel.from_processed(), active)
+    table = rates.table(args.level)
+    if args.output:
+        table.to_csv(args.output, index=False)
+        print(f"Saved {len(table)} rows to {args.output}")
+    else:
+        print(table.dropna(subset=["birth_rate"]).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Geography index keyed by ONS GSS code.
+
+The births, deaths and survival tables list the UK, GB, England and Wales,
+the four countries, English regions, counties and local authorities in one
+flat column. The first three characters of a GSS code (K02, E12, E06, ...)
+say which of these a row is, so levels can be read straight off the code
+instead of guessed from row order or counts.
+
+GeographyIndex assigns each code a dense integer id. Code lookups are a
+dict hit, and level filters and cross-year joins run on integer arrays
+rather than on geography names.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Hierarchy levels, broadest first; a level's number is its position here
+LEVELS = ("UK", "GB", "E&W", "country", "region", "county", "LA")
+
+# GSS code prefix -> level
+PREFIX_LEVELS = {
+    "K02": "UK",
+    "K03": "GB",
+    "K04": "E&W",
+    "E92": "country",
+    "W92": "country",
+    "S92": "country",
+    "N92": "country",
+    "E12": "region",
+    "E10": "county",
+    "E11": "county",  # metropolitan counties
+    "E13": "county",  # Inner / Outer London
+    "E06": "LA",
+    "E07": "LA",
+    "E08": "LA",
+    "E09": "LA",
+    "W06": "LA",
+    "S12": "LA",
+    "N09": "LA",
+}
+
+ENGLAND = "E92000001"
+
+CODE_COL = "Geography Code"
+NAME_COL = "Geography Name"
+
+
+def level_number(level: str) -> int:
+    try:
+        return LEVELS.index(level)
+    except ValueError:
+        raise ValueError(f"Unknown geography level: {level!r}") from None
+
+
+def code_level(code: str) -> str | None:
+    """Level of a single GSS code, or None for an unrecognised prefix."""
+    return PREFIX_LEVELS.get(str(code).strip()[:3])
+
+
+class GeographyIndex:
+    """Dense integer ids, names and hierarchy levels for a set of GSS codes."""
+
+    def __init__(self, codes, names=None):
+        codes = pd.Index(pd.Series(codes, dtype=object).astype(str).str.strip())
+        keep = ~codes.duplicated()
+        self.codes = codes[keep]
+        self.names = None if names is None else np.asarray(names, dtype=object)[keep]
+        self._ids = {code: i for i, code in enumerate(self.codes)}
+
+        levels = np.full(len(self.codes), -1, dtype=np.int8)
+        prefixes = self.codes.str[:3]
+        for prefix, level in PREFIX_LEVELS.items():
+            levels[np.asarray(prefixes == prefix)] = level_number(level)
+        self.levels = levels
+
+    @classmethod
+    def from_frames(cls, *frames: pd.DataFrame, code_col: str = CODE_COL, name_col: str = NAME_COL):
+        """Index every code appearing in any of ``frames`` (first name seen wins)."""
+        codes = pd.concat([f[code_col].astype(str) for f in frames], ignore_index=True)
+        names = None
+        if all(name_col in f.columns for f in frames):
+            names = pd.concat([f[name_col].astype(str) for f in frames], ignore_index=True)
+        return cls(codes, names)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code) -> bool:
+        return str(code).strip() in self._ids
+
+    def id_of(self, code: str) -> int:
+        """Integer id of one code; KeyError if it is not indexed."""
+        return self._ids[str(code).strip()]
+
+    def level_of(self, code: str) -> str | None:
+        level = self.levels[self.id_of(code)]
+        return LEVELS[level] if level >= 0 else None
+
+    def name_of(self, code: str) -> str | None:
+        return None if self.names is None else self.names[self.id_of(code)]
+
+    def encode(self, codes) -> np.ndarray:
+        """Integer ids for a column of codes; -1 for codes not in the index."""
+        codes = pd.Series(codes)
+        if isinstance(codes.dtype, pd.CategoricalDtype):
+            # Strip and look up each category once, then expand by the codes
+            category_ids = self.codes.get_indexer(codes.cat.categories.astype(str).str.strip())
+            category_ids = np.append(category_ids, -1)
+            return category_ids[codes.cat.codes.to_numpy()]
+        return self.codes.get_indexer(codes.astype(str).str.strip())
+
+    def levels_for(self, codes) -> np.ndarray:
+        """Level number of each code (-1 for unknown codes)."""
+        ids = self.encode(codes)
+        return np.where(ids >= 0, self.levels[ids], -1)
+
+    def level_mask(self, codes, levels) -> np.ndarray:
+        """Boolean mask of codes whose level is one of ``levels``."""
+        wanted = np.zeros(len(LEVELS) + 1, dtype=bool)
+        for level in [levels] if isinstance(levels, str) else levels:
+            wanted[level_number(level)] = True
+        # Index -1 (unknown) lands on the trailing False slot
+        return wanted[self.levels_for(codes)]
+
+    def subnational_mask(self, codes) -> np.ndarray:
+        """
+        Codes below national level: regions, counties and local authorities,
+        plus Wales, Scotland and Northern Ireland, which have no regions and
+        sit alongside the English regions in ONS tables.
+        """
+        levels = self.levels_for(codes)
+        below = levels >= level_number("region")
+        devolved = (levels == level_number("country")) & (self.encode(codes) != self._ids.get(ENGLAND, -2))
+        return below | devolved
+
+    def select(self, df: pd.DataFrame, levels, code_col: str = CODE_COL) -> pd.DataFrame:
+        """Rows of ``df`` at the given level(s)."""
+        return df[self.level_mask(df[code_col], levels)]
+
+    def join(
+        self,
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        code_col: str = CODE_COL,
+        how: str = "inner",
+    ) -> pd.DataFrame:
+        """
+        Join two tables on geography code via integer ids.
+
+        Each table must have at most one row per code. Columns of ``right``
+        that also appear in ``left`` (such as the name) are taken from
+        ``left``. ``how`` is "inner" or "left".
+        """
+        if how not in ("inner", "left"):
+            raise ValueError(f"Unsupported join: {how!r}")
+
+        left_ids = self.encode(left[code_col])
+        right_ids = self.encode(right[code_col])
+
+        # Position of each indexed code in ``right`` (-1 when absent)
+        right_pos = np.full(len(self), -1, dtype=np.int64)
+        known = right_ids >= 0
+        right_pos[right_ids[known]] = np.flatnonzero(known)
+
+        matched = np.where(left_ids >= 0, right_pos[left_ids], -1)
+        extra = right[[c for c in right.columns if c not in left.columns]].reset_index(drop=True)
+
+        if how == "inner":
+            keep = np.flatnonzero(matched >= 0)
+            left, matched = left.iloc[keep], matched[keep]
+
+        # Reindexing by position leaves NaN rows where matched is -1
+        rows = extra.reindex(matched).reset_index(drop=True)
+        return pd.concat([left.reset_index(drop=True), rows], axis=1)
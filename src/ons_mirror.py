@@ -0,0 +1,198 @@
+"""
+Refresh the raw ONS tables in data/raw from a mirror, concurrently.
+
+Every source file is requested from BASE_URL/<file name> at the same time
+(up to --jobs at once). The ETag and Last-Modified headers of each download
+are kept in data/raw/mirror.json and sent back as If-None-Match /
+If-Modified-Since, so a file the server reports unchanged (304) is never
+downloaded again. Bodies are streamed to a temporary file in 1 MiB blocks
+and moved into place only when complete, so a failed download never leaves
+a truncated raw table behind.
+
+The files land where the cleaners read them, so their load_* functions (and
+the pipeline, which notices the changed hashes) pick them up directly:
+
+    python src/ons_mirror.py --base-url https://example.org/ons/latest
+    python src/pipeline.py
+
+The base URL can also come from the ONS_MIRROR_URL environment variable.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+from cleaning_engine import SPECS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+STATE_FILE = "mirror.json"
+MIRROR_ENV = "ONS_MIRROR_URL"
+
+DEFAULT_JOBS = 8
+DEFAULT_TIMEOUT = 60.0
+
+_BLOCK_SIZE = 1 << 20
+
+# Raw tables read by the cleaners: every spec's file plus the rates table
+SOURCES = tuple(dict.fromkeys([*(spec.raw_file for spec in SPECS.values()), "business_birth_death_rates.csv"]))
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of refreshing one file: "downloaded", "not modified" or "failed"."""
+
+    name: str
+    path: Path
+    status: str
+    bytes: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def load_state(raw_dir: str | Path = RAW_DIR) -> dict[str, dict]:
+    """Validators (etag / last_modified) recorded for each file by earlier refreshes."""
+    path = Path(raw_dir) / STATE_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_state(state: dict[str, dict], raw_dir: str | Path = RAW_DIR) -> None:
+    path = Path(raw_dir) / STATE_FILE
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def conditional_headers(validators: dict | None) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since for a file we already hold."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _download(url: str, dest: Path, validators: dict | None, timeout: float) -> tuple[str, int, dict]:
+    """
+    Conditional GET of ``url`` into ``dest``, blocking.
+
+    Returns the status, the bytes written and the new validators.
+    """
+    request = urllib.request.Request(url, headers=conditional_headers(validators))
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return "not modified", 0, validators
+        raise
+
+    part = dest.with_name(dest.name + ".part")
+    written = 0
+    try:
+        with response, open(part, "wb") as fh:
+            for block in iter(lambda: response.read(_BLOCK_SIZE), b""):
+                fh.write(block)
+                written += len(block)
+            expected = response.headers.get("Content-Length")
+            if expected is not None and int(expected) != written:
+                raise OSError(f"incomplete download: {written} of {expected} bytes")
+        os.replace(part, dest)
+    finally:
+        part.unlink(missing_ok=True)
+
+    new = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+    return "downloaded", written, new
+
+
+async def _refresh_one(
+    name: str, base_url: str, raw_dir: Path, state: dict, limit: asyncio.Semaphore, timeout: float
+) -> FetchResult:
+    dest = raw_dir / name
+    # Validators only mean something while we still hold the file they describe
+    validators = state.get(name) if dest.exists() else None
+    url = base_url.rstrip("/") + "/" + urllib.request.pathname2url(name)
+    async with limit:
+        start = time.perf_counter()
+        try:
+            status, written, new = await asyncio.to_thread(_download, url, dest, validators, timeout)
+        except (OSError, ValueError, http.client.HTTPException) as exc:
+            return FetchResult(name, dest, "failed", seconds=time.perf_counter() - start, error=str(exc))
+    if status == "downloaded":
+        state[name] = new
+    return FetchResult(name, dest, status, written, time.perf_counter() - start)
+
+
+async def refresh_async(
+    base_url: str,
+    names: list[str] | None = None,
+    raw_dir: str | Path = RAW_DIR,
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[FetchResult]:
+    """
+    Refresh ``names`` (default: SOURCES) from ``base_url`` concurrently.
+
+    The standard library has no non-blocking HTTP client, so each request
+    runs in a worker thread; at most ``jobs`` are in flight at once.
+    """
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    state = load_state(raw_dir)
+    limit = asyncio.Semaphore(jobs)
+    names = list(names or SOURCES)
+    # One unexpected error must not abort the other downloads or their report
+    results = await asyncio.gather(
+        *(_refresh_one(name, base_url, raw_dir, state, limit, timeout) for name in names),
+        return_exceptions=True,
+    )
+    save_state(state, raw_dir)
+    return [
+        FetchResult(name, raw_dir / name, "failed", error=repr(result)) if isinstance(result, BaseException) else result
+        for name, result in zip(names, results)
+    ]
+
+
+def refresh(
+    base_url: str,
+    names: list[str] | None = None,
+    raw_dir: str | Path = RAW_DIR,
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[FetchResult]:
+    """Blocking wrapper around refresh_async()."""
+    return asyncio.run(refresh_async(base_url, names, raw_dir, jobs, timeout))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh data/raw from an ONS mirror.")
+    parser.add_argument("names", nargs="*", help=f"files to refresh (default: all {len(SOURCES)})")
+    parser.add_argument("--base-url", default=os.environ.get(MIRROR_ENV), help=f"default: ${MIRROR_ENV}")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--raw-dir", type=Path, default=RAW_DIR)
+    args = parser.parse_args()
+    if not args.base_url:
+        parser.error(f"no --base-url given and ${MIRROR_ENV} is not set")
+
+    results = refresh(args.base_url, args.names or None, args.raw_dir, args.jobs, args.timeout)
+    for r in results:
+        detail = r.error if r.error else f"{r.bytes:>12,} bytes"
+        print(f"  {r.name:<34}{r.status:<14}{r.seconds:>7.2f}s  {detail}")
+    if any(r.status == "failed" for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
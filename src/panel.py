@@ -0,0 +1,191 @@
+"""
+Long-format births / deaths panel: geography x year x metric.
+
+The per-year processed tables ("Number of Business Births (2019)", ...)
+are loaded once into one float32 array of shape (metric, geography, year),
+with NaN where a geography is missing from a year's table. Geographies are
+stored grouped by hierarchy level (see geography.py), so every level is a
+contiguous block and panel.get() can hand back numpy views instead of
+copies. A saved panel is a directory holding values.npy plus a small JSON
+header, and loads memory-mapped.
+
+    panel = BirthsDeathsPanel.from_processed()
+    la = panel.get(metric="deaths", years=[2019, 2024], level="LA")
+"""
+
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import SPECS
+from datasets import load
+from geography import CODE_COL, LEVELS, NAME_COL, GeographyIndex, level_number
+from releases import ReleaseStore, value_column
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+METRICS = ("births", "deaths")
+
+_SPEC_NAME = re.compile(r"^(births|deaths)_(\d{4})$")
+
+
+def _level_sort_key(levels: np.ndarray) -> np.ndarray:
+    """Level numbers with unknown codes (-1) sorted after every known level."""
+    return np.where(levels >= 0, levels, len(LEVELS)).astype(np.int16)
+
+
+class BirthsDeathsPanel:
+    """Dense metric x geography x year array with code, name and level labels."""
+
+    def __init__(self, values: np.ndarray, metrics, codes, names, years):
+        self.values = values
+        self.metrics = tuple(metrics)
+        self.years = np.asarray(years, dtype=np.int16)
+        self.geo = GeographyIndex(codes, names)
+
+        # Geographies are stored grouped by level; record each level's block
+        order_key = _level_sort_key(self.geo.levels)
+        if np.any(np.diff(order_key) < 0):
+            raise ValueError("Panel geographies must be grouped by level")
+        self._level_slices = {}
+        for number, level in enumerate(LEVELS):
+            start, stop = np.searchsorted(order_key, [number, number + 1])
+            if stop > start:
+                self._level_slices[level] = slice(int(start), int(stop))
+
+    @classmethod
+    def from_tables(cls, tables: dict[tuple[str, int], pd.DataFrame], value_cols: dict[tuple[str, int], str]):
+        """
+        Build a panel from clean tables keyed by (metric, year).
+
+        ``value_cols`` names the count column of each table. Geographies are
+        the union of all tables' codes, ordered by level and then by first
+        appearance.
+        """
+        geo = GeographyIndex.from_frames(*tables.values())
+        order = np.argsort(_level_sort_key(geo.levels), kind="stable")
+        codes = np.asarray(geo.codes, dtype=object)[order]
+        names = None if geo.names is None else geo.names[order]
+        sorted_geo = GeographyIndex(codes, names)
+
+        metrics = tuple(m for m in METRICS if any(key[0] == m for key in tables))
+        years = sorted({year for _, year in tables})
+        values = np.full((len(metrics), len(codes), len(years)), np.nan, dtype=np.float32)
+
+        for (metric, year), df in tables.items():
+            ids = sorted_geo.encode(df[CODE_COL])
+            column = pd.to_numeric(df[value_cols[(metric, year)]], errors="coerce")
+            known = ids >= 0
+            values[metrics.index(metric), ids[known], years.index(year)] = column.to_numpy(
+                dtype=np.float32, na_value=np.nan
+            )[known]
+
+        return cls(values, metrics, codes, names, years)
+
+    @classmethod
+    def from_processed(cls, processed_dir: str | Path = PROCESSED_DIR, metrics=METRICS):
+        """Build the panel from every births_YYYY / deaths_YYYY processed table in ``metrics``."""
+        tables, value_cols = {}, {}
+        for name, spec in SPECS.items():
+            match = _SPEC_NAME.match(name)
+            if match is None or match.group(1) not in metrics:
+                continue
+            key = (match.group(1), int(match.group(2)))
+            value_col = spec.rename[spec.required]
+            tables[key] = load(
+                Path(processed_dir) / spec.processed_file, columns=[CODE_COL, NAME_COL, value_col]
+            )
+            value_cols[key] = value_col
+        return cls.from_tables(tables, value_cols)
+
+    @classmethod
+    def from_releases(cls, store: ReleaseStore | None = None):
+        """Build the panel from every year stored in a year-partitioned ReleaseStore."""
+        store = ReleaseStore() if store is None else store
+        tables, value_cols = {}, {}
+        for metric in METRICS:
+            for year in store.years(metric):
+                value_col = value_column(metric, year)
+                tables[(metric, year)] = store.read(metric, year, columns=[CODE_COL, NAME_COL, value_col])
+                value_cols[(metric, year)] = value_col
+        return cls.from_tables(tables, value_cols)
+
+    def save(self, directory: str | Path) -> None:
+        """Write values.npy and panel.json into ``directory``."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "values.npy", np.ascontiguousarray(self.values))
+        header = {
+            "metrics": list(self.metrics),
+            "years": self.years.tolist(),
+            "codes": list(self.geo.codes),
+            "names": None if self.geo.names is None else list(self.geo.names),
+        }
+        (directory / "panel.json").write_text(json.dumps(header), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True):
+        """Open a saved panel; values are memory-mapped read-only unless ``mmap`` is False."""
+        directory = Path(directory)
+        header = json.loads((directory / "panel.json").read_text(encoding="utf-8"))
+        values = np.load(directory / "values.npy", mmap_mode="r" if mmap else None)
+        return cls(values, header["metrics"], header["codes"], header["names"], header["years"])
+
+    def _year_index(self, years) -> slice | np.ndarray:
+        if years is None:
+            return slice(None)
+        wanted = np.atleast_1d(np.asarray(years))
+        if wanted.size == 0:
+            return slice(0, 0)
+        positions = np.searchsorted(self.years, wanted)
+        found = positions < len(self.years)
+        found[found] = self.years[positions[found]] == wanted[found]
+        if not found.all():
+            raise KeyError(f"Years not in panel: {wanted[~found].tolist()}")
+        # A run of consecutive positions is a slice, which keeps the result a view
+        if np.all(np.diff(positions) == 1):
+            return slice(int(positions[0]), int(positions[-1]) + 1)
+        return positions
+
+    def _geo_slice(self, level: str | None) -> slice:
+        if level is None:
+            return slice(None)
+        level_number(level)  # rejects unknown level names
+        return self._level_slices.get(level, slice(0, 0))
+
+    def get(self, metric: str, years=None, level: str | None = None) -> np.ndarray:
+        """
+        Geography x year values for one metric.
+
+        Returns a view of the panel when ``years`` is None or a run of
+        consecutive panel years (the usual case); any other year selection
+        is a copy. Rows follow codes(level).
+        """
+        if metric not in self.metrics:
+            raise KeyError(f"Metric not in panel: {metric!r}")
+        return self.values[self.metrics.index(metric), self._geo_slice(level), self._year_index(years)]
+
+    def block(self, years=None, level: str | None = None) -> np.ndarray:
+        """Every metric at once, as (metric, geography, year); a view like get()."""
+        return self.values[:, self._geo_slice(level), self._year_index(years)]
+
+    def codes(self, level: str | None = None) -> pd.Index:
+        """Geography codes labelling the rows returned by get(level=...)."""
+        return self.geo.codes[self._geo_slice(level)]
+
+    def names(self, level: str | None = None) -> np.ndarray | None:
+        """Geography names for the rows returned by get(level=...), if known."""
+        return None if self.geo.names is None else self.geo.names[self._geo_slice(level)]
+
+    def frame(self, metric: str, years=None, level: str | None = None) -> pd.DataFrame:
+        """get() as a labelled DataFrame (codes x years)."""
+        index = self._year_index(years)
+        return pd.DataFrame(
+            self.get(metric, years, level),
+            index=self.codes(level),
+            columns=self.years[index],
+        )
@@ -0,0 +1,312 @@
+"""
+Dependency-aware runner for every cleaning and plotting stage.
+
+The stages form a DAG: raw CSV -> cleaner -> processed CSV -> plot. A stage
+depends on every stage that produces one of its inputs. Ready stages run
+concurrently in a process pool; a stage is rebuilt only when its inputs or
+code changed since the last run (see build_cache.py), which in practice
+means the stages downstream of whatever changed. Each stage's wall time is
+reported at the end.
+
+Usage:
+    python src/pipeline.py [--jobs N] [--force] [--dry-run]
+"""
+
+import argparse
+import os
+import runpy
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+from build_cache import MANIFEST_PATH, BuildManifest, code_closure
+from specs import SPECS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+PLOTS_DIR = PROJECT_ROOT / "plots"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of the pipeline: a script with its input and output files."""
+
+    name: str
+    kind: str  # "clean" or "plot"
+    script: Path
+    inputs: tuple[Path, ...]
+    output: Path
+    code: tuple[Path, ...]
+    # Ordering-only dependencies, for stages that overwrite the same file
+    after: tuple[str, ...] = ()
+
+
+# Cleaner script for each registered dataset spec
+_CLEANER_SCRIPTS = {
+    "births_2019": "clean_uk_business_births_2019.py",
+    "births_2024": "clean_uk_business_births_2024.py",
+    "deaths_2019": "clean_uk_business_deaths_2019.py",
+    "deaths_2024": "uk_business_deaths_2024.py",
+    "survival_2022": "clean_business_survival_2022.py",
+    "survival_2019": "clean_business_survival_rates_2019.py",
+}
+
+# Plot script -> (processed inputs, chart written)
+_PLOTS = {
+    "birth_vs_survival_percentage": (
+        ("business_survival_rates_2019_clean.csv",),
+        "business_survival_rates_2019_line.png",
+    ),
+    "births_vs_survival_bar": (
+        ("business_survival_rates_2019_clean.csv",),
+        "survival_1yr_vs_5yr_2019.png",
+    ),
+    "business_birth_death_rates": (
+        ("business_birth_death_rates_clean.csv",),
+        "uk_business_birth_death_rates_2019_2024.png",
+    ),
+    "deaths_bar_2019_vs_2024": (
+        ("uk_business_deaths_2019_clean.csv", "uk_business_deaths_2024_clean.csv"),
+        "business_deaths_2019_2024_comparison.png",
+    ),
+    "births_bar_chart_2024": (
+        ("uk_business_deaths_2019_clean.csv", "uk_business_deaths_2024_clean.csv"),
+        "business_deaths_2019_2024_comparison.png",
+    ),
+}
+
+# Both deaths comparison scripts write the same chart; never run them together
+_AFTER = {"plot:births_bar_chart_2024": ("plot:deaths_bar_2019_vs_2024",)}
+
+
+def build_stages() -> dict[str, Stage]:
+    """The full stage catalogue, keyed by stage name."""
+    stages = {}
+    for name, spec in SPECS.items():
+        script = SRC_DIR / _CLEANER_SCRIPTS[name]
+        stages[name] = Stage(
+            name=name,
+            kind="clean",
+            script=script,
+            inputs=(RAW_DIR / spec.raw_file,),
+            output=PROCESSED_DIR / spec.processed_file,
+            code=tuple(code_closure(script)),
+        )
+
+    script = SRC_DIR / "clean_business_births_vs_deaths.py"
+    stages["birth_death_rates"] = Stage(
+        name="birth_death_rates",
+        kind="clean",
+        script=script,
+        inputs=(RAW_DIR / "business_birth_death_rates.csv",),
+        output=PROCESSED_DIR / "business_birth_death_rates_clean.csv",
+        code=tuple(code_closure(script)),
+    )
+
+    for name, (inputs, chart) in _PLOTS.items():
+        script = PLOTS_DIR / f"{name}.py"
+        stages[f"plot:{name}"] = Stage(
+            name=f"plot:{name}",
+            kind="plot",
+            script=script,
+            inputs=tuple(PROCESSED_DIR / f for f in inputs),
+            output=PLOTS_DIR / chart,
+            code=tuple(code_closure(script)),
+            after=_AFTER.get(f"plot:{name}", ()),
+        )
+    return stages
+
+
+def dependencies(stages: dict[str, Stage]) -> dict[str, set[str]]:
+    """Map each stage to the stages that must finish before it starts."""
+    producers = {s.output: s.name for s in stages.values()}
+    deps = {}
+    for stage in stages.values():
+        deps[stage.name] = {producers[p] for p in stage.inputs if p in producers}
+        # Ordering only matters against stages that run in the same pipeline
+        deps[stage.name].update(name for name in stage.after if name in stages)
+    return deps
+
+
+def downstream(stages: dict[str, Stage], changed: set[str]) -> set[str]:
+    """Stages in ``changed`` plus everything that depends on them, transitively."""
+    deps = dependencies(stages)
+    result = set(changed)
+    grew = True
+    while grew:
+        grew = False
+        for name, needs in deps.items():
+            if name not in result and needs & result:
+                result.add(name)
+                grew = True
+    return result
+
+
+def _overwritten(stages: dict[str, Stage]) -> set[str]:
+    """Stages whose output a stage ordered after them in the same run writes again."""
+    return {
+        name for stage in stages.values() for name in stage.after
+        if name in stages and stages[name].output == stage.output
+    }
+
+
+def _is_fresh(manifest: BuildManifest, stage: Stage, overwritten: set[str] = frozenset()) -> bool:
+    if not all(p.exists() for p in stage.inputs):
+        return False
+    # A file a later stage rewrites never holds this stage's bytes; its inputs and code decide
+    return manifest.is_up_to_date(
+        stage.name, stage.inputs, stage.output, stage.code, check_output=stage.name not in overwritten
+    )
+
+
+def _init_worker() -> None:
+    # Plots must never open a window or block on plt.show() inside the pool
+    os.environ["MPLBACKEND"] = "Agg"
+    os.environ["CI"] = "true"
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def _run_stage(script: str, kind: str) -> float:
+    """Run one stage script as __main__ in a worker process; return its wall time."""
+    start = time.perf_counter()
+    saved_argv = sys.argv
+    # Cleaners are told to --force: the runner has already decided to rebuild
+    sys.argv = [script, "--force"] if kind == "clean" else [script]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+        if "matplotlib.pyplot" in sys.modules:
+            sys.modules["matplotlib.pyplot"].close("all")
+    return time.perf_counter() - start
+
+
+def worker_pool(jobs: int | None = None):
+    """A process pool whose workers can run stage scripts."""
+    # Imported here: multiprocessing is most of this module's import time,
+    # and listing stages (cli.py info) never needs it
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker)
+
+
+def run_pipeline(
+    stages: dict[str, Stage] | None = None,
+    jobs: int | None = None,
+    force: bool = False,
+    manifest_path: str | Path = MANIFEST_PATH,
+    pool=None,
+) -> dict[str, tuple[str, float]]:
+    """
+    Run every stale stage, independent stages in parallel.
+
+    A stage is checked when all its dependencies have finished, so it is
+    skipped if an upstream rebuild left its inputs byte-identical. Stages
+    whose dependencies failed, or can never finish, are not run. Returns
+    {stage: (status, seconds)} with status "built", "skipped", "failed" or
+    "blocked". A long-running caller can pass its own ``pool`` (set up with
+    worker_pool()) to keep warm workers between runs.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    stages = build_stages() if stages is None else stages
+    deps = dependencies(stages)
+    overwritten = _overwritten(stages)
+    manifest = BuildManifest(manifest_path)
+    results: dict[str, tuple[str, float]] = {}
+    running = {}
+
+    with nullcontext(pool) if pool is not None else worker_pool(jobs) as pool:
+        while len(results) < len(stages):
+            progressed = False
+            for name, stage in stages.items():
+                if name in results or name in running.values():
+                    continue
+                if not deps[name] <= results.keys():
+                    continue
+                progressed = True
+                if any(results[d][0] in ("failed", "blocked") for d in deps[name]):
+                    results[name] = ("blocked", 0.0)
+                    continue
+                if not force and _is_fresh(manifest, stage, overwritten):
+                    results[name] = ("skipped", 0.0)
+                    continue
+                future = pool.submit(_run_stage, str(stage.script), stage.kind)
+                running[future] = name
+
+            if not running:
+                if not progressed:
+                    # Only a dependency cycle (or a deps map out of step with stages) gets here
+                    for name in stages.keys() - results.keys():
+                        unmet = ", ".join(sorted(deps[name] - results.keys()))
+                        print(f"[{name}] blocked: waits on {unmet}", file=sys.stderr)
+                        results[name] = ("blocked", 0.0)
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                stage = stages[name]
+                try:
+                    seconds = future.result()
+                except BaseException as exc:  # noqa: BLE001 - report and carry on
+                    print(f"[{name}] failed: {exc!r}", file=sys.stderr)
+                    results[name] = ("failed", 0.0)
+                    continue
+                manifest.record(name, stage.inputs, stage.output, stage.code)
+                manifest.save()
+                results[name] = ("built", seconds)
+
+    return results
+
+
+def print_report(results: dict[str, tuple[str, float]], wall: float) -> None:
+    width = max(len(name) for name in results)
+    for name, (status, seconds) in results.items():
+        print(f"{name:<{width}}  {status:<8} {seconds:7.2f}s")
+    serial = sum(seconds for _, seconds in results.values())
+    print(f"{'total':<{width}}  wall {wall:.2f}s (stage time {serial:.2f}s)")
+
+
+def stale_stages(stages: dict[str, Stage], force: bool = False) -> set[str]:
+    """Stages a run would rebuild: the out-of-date ones and everything downstream."""
+    manifest = BuildManifest()
+    overwritten = _overwritten(stages)
+    return downstream(
+        stages, {s.name for s in stages.values() if force or not _is_fresh(manifest, s, overwritten)}
+    )
+
+
+def print_plan(stages: dict[str, Stage], force: bool) -> None:
+    stale = stale_stages(stages, force)
+    deps = dependencies(stages)
+    for name in stages:
+        needs = ", ".join(sorted(deps[name])) or "-"
+        print(f"{'rebuild' if name in stale else 'fresh  '}  {name}  <- {needs}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the cleaning and plotting pipeline.")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild every stage")
+    parser.add_argument("--dry-run", action="store_true", help="show what would be rebuilt")
+    args = parser.parse_args()
+
+    stages = build_stages()
+    if args.dry_run:
+        print_plan(stages, args.force)
+        return
+
+    start = time.perf_counter()
+    results = run_pipeline(stages, jobs=args.jobs, force=args.force)
+    print_report(results, time.perf_counter() - start)
+    if any(status in ("failed", "blocked") for status, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Opt-in per-stage profiling and row accounting for the cleaning pipelines.
+
+While a Tracer is active, every load_* / clean_* / save_* call and every
+step inside the cleaning engine records its wall time, memory allocated
+(net and peak, via tracemalloc) and rows in / out. Nested steps are
+recorded under their caller, so a trace shows which filter dropped which
+rows and where the time went. When no Tracer is active the hooks return
+immediately.
+
+    with tracing("trace.json"):
+        save_births_2019(clean_births_2019(load_births_2019(raw)), out)
+
+Any script can be traced without code changes by setting ONS_TRACE to a
+JSON file, which is rewritten each time a top-level stage finishes; "{pid}"
+in the name is replaced by the process id, so pipeline workers do not
+overwrite each other:
+
+    ONS_TRACE=trace-{pid}.json python src/pipeline.py --force
+    python src/profiling.py trace-*.json
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+TRACE_ENV = "ONS_TRACE"
+
+_MB = 2**20
+
+
+class _NullStage:
+    """Stand-in yielded by stage() when tracing is off; ignores rows_out."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """One running stage; the caller may set rows_out before it closes."""
+
+    def __init__(self, tracer: "Tracer", name: str, rows_in: int | None):
+        self.tracer = tracer
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.child_peak = 0
+
+    def __enter__(self):
+        tracer = self.tracer
+        self.path = "/".join([s.name for s in tracer._stack] + [self.name])
+        tracer._stack.append(self)
+        # Keep records in start order (callers before the steps inside them)
+        self.index = len(tracer.records)
+        tracer.records.append(None)
+        if tracer.memory:
+            self.mem_start, self.outer_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        tracer = self.tracer
+        tracer._stack.pop()
+        record = {
+            "stage": self.path,
+            "depth": len(tracer._stack),
+            "seconds": round(seconds, 6),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+        }
+        if tracer.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # reset_peak() in nested stages hides their peaks; they report them here
+            peak = max(peak, self.child_peak)
+            record["alloc_mb"] = round((current - self.mem_start) / _MB, 3)
+            record["peak_mb"] = round((peak - self.mem_start) / _MB, 3)
+            if tracer._stack:
+                parent = tracer._stack[-1]
+                parent.child_peak = max(parent.child_peak, peak, self.outer_peak)
+        if exc_info[0] is not None:
+            record["error"] = exc_info[0].__name__
+        tracer.records[self.index] = record
+        if tracer.path is not None and not tracer._stack:
+            tracer.write(tracer.path)
+        return False
+
+
+class Tracer:
+    """
+    Collects stage records while active.
+
+    With ``memory`` (the default) tracemalloc runs for the tracer's
+    lifetime; it slows allocation-heavy code several times over, so turn it
+    off when only the timings matter. With ``path`` the trace is written
+    out after every top-level stage.
+    """
+
+    def __init__(self, memory: bool = True, path: str | Path | None = None):
+        self.memory = memory
+        self.path = path
+        self.records: list[dict] = []
+        self._stack: list[_Stage] = []
+        self._started_tracemalloc = False
+
+    def stage(self, name: str, rows_in: int | None = None) -> _Stage:
+        return _Stage(self, name, rows_in)
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def to_dict(self) -> dict:
+        return {"pid": os.getpid(), "argv": sys.argv, "stages": self.records}
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(str(path).replace("{pid}", str(os.getpid())))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+_active: Tracer | None = None
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def stage(name: str, rows_in: int | None = None):
+    """
+    Context manager timing one step; set ``.rows_out`` on it to record rows out.
+
+        with stage("drop empty rows", len(df)) as s:
+            df = df.dropna(how="all")
+            s.rows_out = len(df)
+    """
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name, rows_in)
+
+
+def account(masks: dict[str, pd.Series]) -> None:
+    """
+    Record how many rows each of several keep-masks removes, applied in order.
+
+    Filters that are combined into one mask for speed can still be
+    accounted for separately; nothing is computed when tracing is off.
+    """
+    if _active is None:
+        return
+    keep = None
+    for name, mask in masks.items():
+        mask = mask.to_numpy(dtype=bool, na_value=False)
+        rows_in = len(mask) if keep is None else int(keep.sum())
+        keep = mask if keep is None else keep & mask
+        with _active.stage(name, rows_in) as s:
+            s.rows_out = int(keep.sum())
+
+
+def _rows(value) -> int | None:
+    return len(value) if isinstance(value, pd.DataFrame) else None
+
+
+def profiled(func):
+    """
+    Record each call of ``func`` as a stage named after it.
+
+    Rows in are counted when the first argument is a DataFrame, rows out
+    when the result is one.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _active is None:
+            return func(*args, **kwargs)
+        with _active.stage(func.__name__, _rows(args[0]) if args else None) as s:
+            result = func(*args, **kwargs)
+            s.rows_out = _rows(result)
+        return result
+
+    return wrapper
+
+
+@contextmanager
+def tracing(path: str | Path | None = None, memory: bool = True):
+    """Activate a Tracer for the block; write its JSON trace to ``path`` on exit."""
+    global _active
+    previous, tracer = _active, Tracer(memory)
+    tracer.start()
+    _active = tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
+        tracer.stop()
+        if path is not None:
+            tracer.write(path)
+
+
+def summarize(records: list[dict]) -> pd.DataFrame:
+    """Total calls, time, peak memory and rows per stage path, in first-seen order."""
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+    for col in ("rows_in", "rows_out", "peak_mb"):
+        if col not in df:
+            df[col] = None
+    df["rows_in"] = pd.to_numeric(df["rows_in"])
+    df["rows_out"] = pd.to_numeric(df["rows_out"])
+    summary = df.groupby("stage", sort=False).agg(
+        calls=("seconds", "size"),
+        seconds=("seconds", "sum"),
+        peak_mb=("peak_mb", "max"),
+        rows_in=("rows_in", lambda s: s.sum(min_count=1)),
+        rows_out=("rows_out", lambda s: s.sum(min_count=1)),
+    )
+    summary["rows_dropped"] = summary["rows_in"] - summary["rows_out"]
+    return summary.reset_index()
+
+
+def _start_from_env() -> None:
+    """Trace this whole process when ONS_TRACE is set (ONS_TRACE_MEMORY=0: timings only)."""
+    global _active
+    path = os.environ.get(TRACE_ENV)
+    if not path or _active is not None:
+        return
+    _active = Tracer(memory=os.environ.get(f"{TRACE_ENV}_MEMORY", "1") != "0", path=path)
+    _active.start()
+
+
+_start_from_env()
+
+
+def main() -> None:
+    paths = sys.argv[1:]
+    if not paths:
+        sys.exit("usage: python src/profiling.py TRACE.json [...]")
+    records = []
+    for path in paths:
+        records.extend(json.loads(Path(path).read_text(encoding="utf-8"))["stages"])
+    with pd.option_context("display.width", 200, "display.max_colwidth", 70):
+        print(summarize(records).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
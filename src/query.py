@@ -0,0 +1,293 @@
+"""
+Lazy queries over the processed tables.
+
+A Query records operations instead of running them. collect() plans the
+whole chain first: it works out which columns every step needs and pushes
+that projection, plus the row filters that come before any join, distinct
+or top-k, into the scan. Scans load through the dataset registry
+(datasets.py), which hands the projection and filters on to the reader
+and serves later scans covered by a frame it kept from memory.
+collect_all() runs several queries together and scans each table once,
+however many queries (or self-joins) use it.
+
+    top10 = (
+        scan(PROCESSED_DIR / "business_survival_rates_2019_clean.csv")
+        .select("Region", "Births of New Enterprises (2019)")
+        .filter("Region", "!=", "Total")
+        .top_k(10, by="Births of New Enterprises (2019)")
+        .collect()
+    )
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from columnar import apply_filters, current_columnar
+from comparison import top_k_indices
+from datasets import load
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+
+@dataclass(frozen=True)
+class Select:
+    columns: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Filter:
+    column: str
+    op: str
+    value: object = field(hash=False)
+
+
+@dataclass(frozen=True)
+class Where:
+    """A row filter no reader can run: ``keep`` maps the column to a boolean mask."""
+
+    column: str
+    keep: Callable[[pd.Series], pd.Series] = field(hash=False)
+
+
+@dataclass(frozen=True)
+class DropNA:
+    columns: tuple[str, ...] | None
+
+
+@dataclass(frozen=True)
+class Distinct:
+    columns: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Sort:
+    by: tuple[str, ...]
+    ascending: bool
+
+
+@dataclass(frozen=True)
+class TopK:
+    n: int
+    by: str
+    ascending: bool
+
+
+@dataclass(frozen=True)
+class Join:
+    other: "Query"
+    on: tuple[str, ...]
+    how: str
+
+
+# Operations after which a row filter no longer commutes with the rest
+_BARRIERS = (Distinct, TopK, Join)
+
+
+@dataclass(frozen=True)
+class Scan:
+    """One read of a processed table: the columns and filters pushed into it."""
+
+    path: Path
+    columns: tuple[str, ...] | None
+    filters: tuple[tuple, ...]
+
+
+def table_columns(path: str | Path) -> list[str]:
+    """Column names of a processed table, from the schema of the file read_processed() would read."""
+    parquet = current_columnar(path)
+    if parquet is not None:
+        try:
+            import pyarrow.parquet as pq
+            return list(pq.read_schema(parquet).names)
+        except ImportError:
+            pass
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+class Query:
+    """A deferred chain of operations on one processed table."""
+
+    def __init__(self, path: str | Path, ops: tuple = ()):
+        self.path = Path(path)
+        self.ops = ops
+
+    def _then(self, op) -> "Query":
+        return Query(self.path, self.ops + (op,))
+
+    def select(self, *columns: str) -> "Query":
+        return self._then(Select(tuple(columns)))
+
+    def filter(self, column: str, op: str, value) -> "Query":
+        """Keep rows where ``column op value``; op as in columnar.read_processed."""
+        if isinstance(value, (list, set)):
+            value = tuple(value)
+        return self._then(Filter(column, op, value))
+
+    def where(self, column: str, keep: Callable[[pd.Series], pd.Series]) -> "Query":
+        """Keep rows where ``keep(column)`` is True; applied in memory, never pushed into the scan."""
+        return self._then(Where(column, keep))
+
+    def dropna(self, *columns: str) -> "Query":
+        return self._then(DropNA(tuple(columns) or None))
+
+    def distinct(self, *columns: str) -> "Query":
+        """First row for each distinct value of ``columns``."""
+        return self._then(Distinct(tuple(columns)))
+
+    def sort(self, *by: str, ascending: bool = True) -> "Query":
+        """Stable sort, so ties keep their current order."""
+        return self._then(Sort(tuple(by), ascending))
+
+    def top_k(self, n: int, by: str, ascending: bool = False) -> "Query":
+        """The ``n`` rows with the largest (or smallest) ``by``, in order, by partial selection."""
+        return self._then(TopK(n, by, ascending))
+
+    def join(self, other: "Query", on, how: str = "inner") -> "Query":
+        on = (on,) if isinstance(on, str) else tuple(on)
+        return self._then(Join(other, on, how))
+
+    # --- planning ---
+
+    def _plan(self, demand: set[str] | None) -> tuple[Scan, tuple]:
+        """
+        The Scan this query reads and the operations left to run in memory.
+
+        ``demand`` is the set of columns wanted downstream (None: all).
+        """
+        needed = None if demand is None else set(demand)
+        for op in reversed(self.ops):
+            if isinstance(op, Select):
+                needed = set(op.columns)
+            elif needed is None:
+                continue
+            elif isinstance(op, (Filter, Where)):
+                needed.add(op.column)
+            elif isinstance(op, DropNA):
+                if op.columns is None:
+                    # A bare dropna() looks at every column that reaches it
+                    needed = None
+                else:
+                    needed.update(op.columns)
+            elif isinstance(op, (Distinct, Sort)):
+                needed.update(op.columns if isinstance(op, Distinct) else op.by)
+            elif isinstance(op, TopK):
+                needed.add(op.by)
+            elif isinstance(op, Join):
+                needed.update(op.on)
+
+        pushed, rest = [], []
+        for i, op in enumerate(self.ops):
+            if isinstance(op, _BARRIERS):
+                rest.extend(self.ops[i:])
+                break
+            if isinstance(op, Filter):
+                pushed.append((op.column, op.op, op.value))
+            else:
+                rest.append(op)
+
+        columns = None
+        if needed is not None:
+            columns = tuple(c for c in table_columns(self.path) if c in needed)
+        return Scan(self.path, columns, tuple(pushed)), tuple(rest)
+
+    def explain(self) -> str:
+        """The scan and in-memory steps collect() would run, one per line."""
+        lines = []
+        self._explain(None, lines, "")
+        return "\n".join(lines)
+
+    def _explain(self, demand, lines, indent) -> None:
+        scan, rest = self._plan(demand)
+        columns = "*" if scan.columns is None else ", ".join(scan.columns)
+        lines.append(f"{indent}scan {scan.path.name} columns=[{columns}] filters={list(scan.filters)}")
+        for op in rest:
+            if isinstance(op, Join):
+                lines.append(f"{indent}join on {list(op.on)} ({op.how}) with")
+                op.other._explain(None, lines, indent + "    ")
+            else:
+                lines.append(f"{indent}{op}")
+
+    # --- execution ---
+
+    def _scans(self, demand=None) -> list[Scan]:
+        scan, rest = self._plan(demand)
+        scans = [scan]
+        for op in rest:
+            if isinstance(op, Join):
+                scans.extend(op.other._scans())
+        return scans
+
+    def _run(self, tables: dict, demand=None) -> pd.DataFrame:
+        scan, rest = self._plan(demand)
+        df = tables[scan]
+        for op in rest:
+            if isinstance(op, Select):
+                df = df[list(op.columns)]
+            elif isinstance(op, Filter):
+                df = apply_filters(df, [(op.column, op.op, op.value)])
+            elif isinstance(op, Where):
+                df = df[np.asarray(op.keep(df[op.column]).fillna(False), dtype=bool)]
+            elif isinstance(op, DropNA):
+                df = df.dropna(subset=None if op.columns is None else list(op.columns))
+            elif isinstance(op, Distinct):
+                df = df.drop_duplicates(subset=list(op.columns), keep="first")
+            elif isinstance(op, Sort):
+                df = df.sort_values(list(op.by), ascending=op.ascending, kind="stable")
+            elif isinstance(op, TopK):
+                values = df[op.by].to_numpy(dtype="float64", na_value=np.nan)
+                df = df.iloc[top_k_indices(values, op.n, largest=not op.ascending)]
+            elif isinstance(op, Join):
+                right = op.other._run(tables)
+                df = df.merge(right, on=list(op.on), how=op.how, suffixes=("", "_right"))
+        return df.reset_index(drop=True)
+
+    def collect(self) -> pd.DataFrame:
+        return collect_all([self])[0]
+
+
+def scan(path: str | Path) -> Query:
+    """Start a query on a processed table (a path, or a file name in data/processed)."""
+    path = Path(path)
+    return Query(path if path.parent != Path(".") else PROCESSED_DIR / path)
+
+
+def _read_shared(scans: list[Scan]) -> dict[Scan, pd.DataFrame]:
+    """
+    Read each table once for every scan of it.
+
+    The shared read takes the union of the scans' columns and keeps only the
+    filters common to all of them; each scan's own remaining filters and
+    projection are then applied to that one frame in memory.
+    """
+    by_path: dict[Path, list[Scan]] = {}
+    for s in dict.fromkeys(scans):
+        by_path.setdefault(s.path, []).append(s)
+
+    tables = {}
+    for path, group in by_path.items():
+        if any(s.columns is None for s in group):
+            columns = None
+        else:
+            columns = list(dict.fromkeys(c for s in group for c in s.columns))
+        common = [f for f in group[0].filters if all(f in s.filters for s in group[1:])]
+        if columns is not None:
+            # Columns only used by a residual filter still have to be read
+            residual_cols = (f[0] for s in group for f in s.filters if f not in common)
+            columns = list(dict.fromkeys([*columns, *residual_cols]))
+        shared = load(path, columns=columns, filters=common or None)
+        for s in group:
+            df = apply_filters(shared, [f for f in s.filters if f not in common])
+            tables[s] = df if s.columns is None else df[list(s.columns)]
+    return tables
+
+
+def collect_all(queries: list[Query]) -> list[pd.DataFrame]:
+    """Run several queries, reading each underlying table only once."""
+    scans = [s for q in queries for s in q._scans()]
+    tables = _read_shared(scans)
+    return [q._run(tables) for q in queries]
@@ -0,0 +1,235 @@
+"""
+Year-partitioned births / deaths storage with incremental release ingestion.
+
+Each year of each metric is one partition under data/processed/releases:
+
+    releases/births/2019.csv (+ .parquet)
+    releases/deaths/2024.csv
+    releases/aggregates.csv
+
+A new ONS release is added with append_release(): only the new year's raw
+table is cleaned, it is checked against the partitions already stored, and
+the aggregates table (UK total, local-authority count and total, and the
+year-on-year change) gains one row, with only the following year's change
+updated, so earlier years are never re-read or recomputed.
+
+    python src/releases.py bootstrap
+    python src/releases.py append births 2025 data/raw/uk_business_births_2025.csv
+"""
+
+import argparse
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import SPECS, DatasetSpec, clean_with_spec, save_table
+from columnar import columnar_path, read_processed
+from geography import CODE_COL, NAME_COL, GeographyIndex
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+RELEASES_DIR = PROJECT_ROOT / "data" / "processed" / "releases"
+
+METRICS = ("births", "deaths")
+UK_CODE = "K02000001"
+
+# Share of the previous release's geographies a new release must still list;
+# boundary reviews retire a few codes, a truncated file loses many
+MIN_OVERLAP = 0.9
+
+AGGREGATE_COLUMNS = ["metric", "year", "uk_total", "local_authorities", "la_total", "change", "change_pct"]
+
+
+def value_column(metric: str, year: int) -> str:
+    """Title of the count column, matching the existing processed tables."""
+    return f"Number of Business {metric.title()} ({year})"
+
+
+def release_spec(metric: str, year: int, raw_file: str = "") -> DatasetSpec:
+    """A births / deaths DatasetSpec for any year (same layout as births_2019)."""
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric!r}")
+    template = SPECS[f"{metric}_2019"]
+    value = f"{metric}_{year}"
+    return replace(
+        template,
+        name=value,
+        raw_file=raw_file,
+        processed_file=f"{year}.csv",
+        columns=("code", "region", value),
+        numeric=(value,),
+        required=value,
+        rename={"code": CODE_COL, "region": NAME_COL, value: value_column(metric, year)},
+    )
+
+
+class ReleaseStore:
+    """Per-year partitions of the births and deaths tables, plus their aggregates."""
+
+    def __init__(self, root: str | Path = RELEASES_DIR):
+        self.root = Path(root)
+        self.aggregates_path = self.root / "aggregates.csv"
+
+    def partition_path(self, metric: str, year: int) -> Path:
+        return self.root / metric / f"{year}.csv"
+
+    def years(self, metric: str) -> list[int]:
+        """Years stored for ``metric``, ascending."""
+        return sorted(int(p.stem) for p in (self.root / metric).glob("*.csv") if p.stem.isdigit())
+
+    def read(self, metric: str, year: int, columns: list[str] | None = None) -> pd.DataFrame:
+        path = self.partition_path(metric, year)
+        if not path.exists():
+            raise KeyError(f"No {metric} partition for {year}")
+        return read_processed(path, columns=columns)
+
+    def aggregates(self) -> pd.DataFrame:
+        if not self.aggregates_path.exists():
+            return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+        return pd.read_csv(self.aggregates_path)
+
+    def validate(self, metric: str, year: int, table: pd.DataFrame, replace_existing: bool = False) -> None:
+        """
+        Raise ValueError listing every problem with a new partition.
+
+        Checks that the year is new (unless ``replace_existing``), the table
+        has a UK row, no duplicate codes and no negative counts, and that it
+        still covers at least MIN_OVERLAP of the geographies in the closest
+        earlier (or, failing that, later) stored year.
+        """
+        problems = []
+        stored = self.years(metric)
+        if year in stored and not replace_existing:
+            problems.append(f"{metric} {year} is already stored")
+
+        codes = table[CODE_COL].astype(str).str.strip()
+        values = table[value_column(metric, year)]
+        if table.empty:
+            problems.append("table is empty")
+        if UK_CODE not in set(codes):
+            problems.append(f"no UK total row ({UK_CODE})")
+        duplicated = codes[codes.duplicated()].unique()
+        if len(duplicated):
+            problems.append(f"duplicate geography codes: {', '.join(duplicated[:5])}")
+        if (values < 0).any():
+            problems.append("negative counts")
+
+        others = [y for y in stored if y != year]
+        if others:
+            earlier = [y for y in others if y < year]
+            reference = earlier[-1] if earlier else others[0]
+            previous = self.read(metric, reference, columns=[CODE_COL])[CODE_COL].astype(str).str.strip()
+            overlap = previous.isin(codes).mean()
+            if overlap < MIN_OVERLAP:
+                problems.append(f"covers only {overlap:.0%} of the {reference} geographies")
+
+        if problems:
+            raise ValueError(f"Invalid {metric} release {year}: " + "; ".join(problems))
+
+    def append_release(
+        self, metric: str, year: int, raw_path: str | Path, replace_existing: bool = False
+    ) -> pd.DataFrame:
+        """
+        Clean, validate and store one year's raw table; returns the partition.
+
+        Only ``raw_path`` is read and only this year's aggregates (and the
+        next stored year's change) are updated. The partition and the
+        aggregates are staged to temporary files and moved into place
+        together, so a failure stores neither.
+        """
+        spec = release_spec(metric, year, Path(raw_path).name)
+        table = clean_with_spec(pd.read_csv(raw_path), spec)
+        self.validate(metric, year, table, replace_existing)
+        agg = self._aggregates_with(metric, year, table)
+
+        partition = self.partition_path(metric, year)
+        staged = partition.with_name(f"{year}.{os.getpid()}.tmp.csv")
+        staged_agg = self.aggregates_path.with_name(f"aggregates.{os.getpid()}.tmp.csv")
+        moves = [
+            (staged, partition),
+            (columnar_path(staged), columnar_path(partition)),
+            (staged_agg, self.aggregates_path),
+        ]
+        try:
+            save_table(table, staged, spec.column_types())
+            agg.to_csv(staged_agg, index=False)
+            for source, dest in moves:
+                if source.exists():
+                    os.replace(source, dest)
+        finally:
+            for source, _ in moves:
+                source.unlink(missing_ok=True)
+        return table
+
+    def _aggregates_with(self, metric: str, year: int, table: pd.DataFrame) -> pd.DataFrame:
+        """The aggregates table with ``year`` of ``metric`` (re)computed from ``table``."""
+        codes = table[CODE_COL]
+        values = table[value_column(metric, year)].to_numpy(dtype="float64", na_value=np.nan)
+        local = GeographyIndex(codes).level_mask(codes, "LA")
+        uk = values[np.flatnonzero(codes.astype(str).str.strip() == UK_CODE)[0]]
+
+        agg = self.aggregates()
+        agg = agg[~((agg["metric"] == metric) & (agg["year"] == year))]
+        row = {
+            "metric": metric,
+            "year": year,
+            "uk_total": uk,
+            "local_authorities": int(local.sum()),
+            "la_total": values[local].sum(),
+        }
+        new = pd.DataFrame([row])
+        agg = pd.concat([agg, new], ignore_index=True) if len(agg) else new
+        agg = agg.sort_values(["metric", "year"], kind="stable").reset_index(drop=True)
+
+        # Year-on-year change for this year and the one after it only
+        rows = np.flatnonzero(agg["metric"] == metric)
+        position = int(np.flatnonzero(agg["year"].to_numpy()[rows] == year)[0])
+        for i in (position, position + 1):
+            if 0 < i < len(rows):
+                before, now = agg.at[rows[i - 1], "uk_total"], agg.at[rows[i], "uk_total"]
+                agg.at[rows[i], "change"] = now - before
+                agg.at[rows[i], "change_pct"] = round(100 * (now - before) / before, 2)
+            elif i == 0:
+                agg.at[rows[i], "change"] = np.nan
+                agg.at[rows[i], "change_pct"] = np.nan
+
+        return agg[AGGREGATE_COLUMNS]
+
+    def bootstrap(self, raw_dir: str | Path = RAW_DIR) -> list[tuple[str, int]]:
+        """Load the releases registered in SPECS (births_2019, ...) that are not stored yet."""
+        added = []
+        for name, spec in SPECS.items():
+            metric, _, year = name.partition("_")
+            if metric not in METRICS or int(year) in self.years(metric):
+                continue
+            self.append_release(metric, int(year), Path(raw_dir) / spec.raw_file)
+            added.append((metric, int(year)))
+        return added
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Year-partitioned births / deaths releases.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("bootstrap", help="store the releases already in data/raw")
+    append = commands.add_parser("append", help="ingest one new release")
+    append.add_argument("metric", choices=METRICS)
+    append.add_argument("year", type=int)
+    append.add_argument("raw_path", type=Path)
+    append.add_argument("--replace", action="store_true", help="overwrite a stored year")
+    args = parser.parse_args()
+
+    store = ReleaseStore()
+    if args.command == "bootstrap":
+        for metric, year in store.bootstrap():
+            print(f"Stored {metric} {year}")
+    else:
+        table = store.append_release(args.metric, args.year, args.raw_path, args.replace)
+        print(f"Stored {args.metric} {args.year}: {len(table)} geographies")
+    print(store.aggregates().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Headless batch renderer for the charts in plots/.
+
+Every plot script exposes OUTPUT (the chart's file name) and
+build_figure(), which draws with the object-oriented matplotlib API and
+never touches pyplot state. This module renders any set of those charts in
+a process pool with the Agg backend forced, at one of two tiers:
+
+    publication  300 dpi, written to plots/ (the committed charts)
+    preview       72 dpi, written to plots/preview/ for quick checks
+
+and reports how long each chart took to build and to save.
+
+Usage:
+    python src/render.py [--tier preview|publication|all] [--jobs N] [chart ...]
+"""
+
+import argparse
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+PLOTS_DIR = PROJECT_ROOT / "plots"
+PREVIEW_DIR = PLOTS_DIR / "preview"
+
+TIERS = {"publication": 300, "preview": 72}
+
+
+def save_figure(fig, path: str | Path, dpi: int = TIERS["publication"]) -> Path:
+    """Write ``fig`` to ``path``, creating the directory if needed."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=dpi)
+    return path
+
+
+def chart_scripts(names=None) -> list[Path]:
+    """Plot scripts in plots/, optionally restricted to the given chart names."""
+    scripts = sorted(PLOTS_DIR.glob("*.py"))
+    if names:
+        by_name = {s.stem: s for s in scripts}
+        unknown = [n for n in names if n not in by_name]
+        if unknown:
+            raise ValueError(f"Unknown charts: {', '.join(unknown)}")
+        scripts = [by_name[n] for n in names]
+    return scripts
+
+
+def _load_chart(script: Path) -> dict:
+    # Executes the script's top level only; drawing happens in build_figure()
+    return runpy.run_path(str(script), run_name="__chart__")
+
+
+def output_path(script: Path, tier: str) -> Path:
+    """Where ``script`` is rendered for ``tier``."""
+    if tier == "preview":
+        # One file per script, so charts that share an output name don't collide
+        return PREVIEW_DIR / f"{script.stem}.png"
+    return PLOTS_DIR / _load_chart(script)["OUTPUT"]
+
+
+def _init_worker() -> None:
+    os.environ["MPLBACKEND"] = "Agg"
+    os.environ["CI"] = "true"
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def render_chart(script: str | Path, tier: str = "publication") -> tuple[Path, float, float]:
+    """Build and save one chart; returns (path, build seconds, save seconds)."""
+    script = Path(script)
+    chart = _load_chart(script)
+
+    start = time.perf_counter()
+    fig = chart["build_figure"]()
+    built = time.perf_counter()
+    path = save_figure(fig, output_path(script, tier), dpi=TIERS[tier])
+    return path, built - start, time.perf_counter() - built
+
+
+def _render_group(scripts: list[str], tier: str) -> list[tuple[str, Path, float, float]]:
+    return [(Path(s).stem, *render_chart(s, tier)) for s in scripts]
+
+
+def render_all(
+    scripts: list[Path] | None = None, tier: str = "publication", jobs: int | None = None
+) -> dict[str, tuple[str, float, float]]:
+    """
+    Render charts in parallel; returns {chart: (status, build s, save s)}.
+
+    Charts writing the same file are rendered one after another in the same
+    worker, in ``scripts`` order, so the last one wins as it would serially.
+    A chart that raises is reported as "failed" without stopping the rest.
+    """
+    if tier not in TIERS:
+        raise ValueError(f"Unknown render tier: {tier!r}")
+    scripts = chart_scripts() if scripts is None else scripts
+
+    groups: dict[Path, list[str]] = {}
+    for script in scripts:
+        groups.setdefault(output_path(script, tier), []).append(str(script))
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = {pool.submit(_render_group, group, tier): group for group in groups.values()}
+        for future in as_completed(futures):
+            try:
+                rendered = future.result()
+            except Exception as exc:  # noqa: BLE001 - report and carry on
+                for script in futures[future]:
+                    print(f"[{Path(script).stem}] failed: {exc!r}", file=sys.stderr)
+                    results[Path(script).stem] = ("failed", 0.0, 0.0)
+                continue
+            for name, _, build_s, save_s in rendered:
+                results[name] = ("rendered", build_s, save_s)
+
+    return {Path(s).stem: results[Path(s).stem] for s in scripts}
+
+
+def print_report(results: dict[str, tuple[str, float, float]], tier: str, wall: float) -> None:
+    width = max(len(name) for name in results)
+    print(f"{tier} ({TIERS[tier]} dpi)")
+    for name, (status, build_s, save_s) in results.items():
+        print(f"  {name:<{width}}  {status:<8} build {build_s:6.2f}s  save {save_s:6.2f}s")
+    print(f"  {'total':<{width}}  wall {wall:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render the charts in plots/ headlessly.")
+    parser.add_argument("charts", nargs="*", help="chart script names (default: all)")
+    parser.add_argument("--tier", choices=[*TIERS, "all"], default="publication")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    scripts = chart_scripts(args.charts)
+    tiers = list(TIERS) if args.tier == "all" else [args.tier]
+    failed = False
+    for tier in tiers:
+        start = time.perf_counter()
+        results = render_all(scripts, tier, jobs=args.jobs)
+        print_report(results, tier, time.perf_counter() - start)
+        failed |= any(status == "failed" for status, _, _ in results.values())
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Roll counts up the geography hierarchy and reconcile them with the published totals.
+
+ONS tables list every geography in one flat column, each aggregate row
+followed by its parts: UK, GB, England and Wales, England, each region
+with its unitary authorities, counties and their districts, then Wales,
+Scotland and Northern Ireland with their local authorities. The parent of
+a row is read off that order: the most recent still-open row of a level
+its GSS prefix can belong to (PARENT_PREFIXES; a district, E07, sits in
+a county, E10, when one is open and in its region otherwise).
+
+Parents are stored as integer ids, so summing the children of every
+aggregate, for every metric and year at once, is one np.add.at over the
+(geography, metric, year) array. reconcile() compares those sums with the
+published aggregate rows; each published count is rounded to base 5, so
+a parent may differ from the sum of its n children by up to 2 per count,
+2 * (n + 1) in all.
+
+    report = reconcile_panel(BirthsDeathsPanel.from_processed())
+    report[~report["ok"]]
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import SPECS
+from datasets import load
+from geography import CODE_COL, LEVELS, NAME_COL, PREFIX_LEVELS, GeographyIndex, level_number
+from panel import BirthsDeathsPanel
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+# Largest difference base-5 rounding can make to one integer count
+ROUNDING_ERROR = 2
+
+# GSS prefix -> prefixes of the rows it can belong to, most specific first
+PARENT_PREFIXES = {
+    "K03": ("K02",),
+    "K04": ("K03",),
+    "E92": ("K04",),
+    "W92": ("K04",),
+    "S92": ("K03",),
+    "N92": ("K02",),
+    "E12": ("E92",),
+    "E10": ("E12",),
+    "E11": ("E12",),
+    "E13": ("E12",),
+    "E06": ("E12",),
+    "E07": ("E10", "E12"),
+    "E08": ("E11", "E12"),
+    "E09": ("E13", "E12"),
+    "W06": ("W92",),
+    "S12": ("S92",),
+    "N09": ("N92",),
+}
+
+
+def parent_codes(codes) -> list[str | None]:
+    """
+    Parent of each code in one table, from the table's row order.
+
+    A row closes every open row of a deeper level, so a county's districts
+    end at the next region. Codes with no parent (the UK, unknown
+    prefixes) get None.
+    """
+    parents = []
+    open_rows: dict[str, str] = {}
+    for code in pd.Series(codes, dtype=object).astype(str).str.strip():
+        prefix = code[:3]
+        level = PREFIX_LEVELS.get(prefix)
+        if level is not None:
+            depth = level_number(level)
+            for other in [p for p in open_rows if level_number(PREFIX_LEVELS[p]) > depth]:
+                del open_rows[other]
+        parents.append(next((open_rows[p] for p in PARENT_PREFIXES.get(prefix, ()) if p in open_rows), None))
+        if level is not None:
+            open_rows[prefix] = code
+    return parents
+
+
+class Hierarchy:
+    """Geographies with the integer id of each one's parent (-1 for none)."""
+
+    def __init__(self, codes, parents, names=None):
+        self.geo = GeographyIndex(codes, names)
+        parents = pd.Series(parents, dtype=object)
+        self.parent = np.where(parents.notna(), self.geo.encode(parents.fillna("")), -1)
+        has_parent = self.parent >= 0
+        self.n_children = np.bincount(self.parent[has_parent], minlength=len(self.geo))
+
+    @classmethod
+    def from_tables(cls, *frames: pd.DataFrame, code_col: str = CODE_COL, name_col: str = NAME_COL):
+        """
+        The union of several tables' hierarchies (e.g. before and after a
+        boundary change); the first table listing a code gives its parent.
+        """
+        seen: dict[str, tuple[str | None, str | None]] = {}
+        for frame in frames:
+            codes = frame[code_col].astype(str).str.strip()
+            names = frame[name_col].astype(str) if name_col in frame.columns else [None] * len(frame)
+            for code, parent, name in zip(codes, parent_codes(codes), names):
+                seen.setdefault(code, (parent, name))
+        codes = list(seen)
+        return cls(codes, [seen[c][0] for c in codes], [seen[c][1] for c in codes])
+
+    @classmethod
+    def from_processed(cls, processed_dir: str | Path = PROCESSED_DIR):
+        """Hierarchy of every births / deaths processed table."""
+        frames = [
+            load(Path(processed_dir) / spec.processed_file, columns=[CODE_COL, NAME_COL])
+            for name, spec in SPECS.items()
+            if name.startswith(("births_", "deaths_"))
+        ]
+        return cls.from_tables(*frames)
+
+    def __len__(self) -> int:
+        return len(self.geo)
+
+    def child_sums(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sum and count of the non-missing direct children of every geography.
+
+        ``values`` has geographies on its first axis (any trailing shape,
+        e.g. metric x year); both results have the same shape.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        children = np.flatnonzero(self.parent >= 0)
+        present = ~np.isnan(values[children])
+        sums = np.zeros_like(values)
+        counts = np.zeros(values.shape, dtype=np.int64)
+        np.add.at(sums, self.parent[children], np.where(present, values[children], 0.0))
+        np.add.at(counts, self.parent[children], present)
+        return sums, counts
+
+    def roll_up(self, values: np.ndarray) -> np.ndarray:
+        """
+        Totals built from the bottom of the hierarchy only.
+
+        Geographies without children keep their own value; every other one
+        is the sum of its children's rolled-up totals, so the UK row holds
+        the sum of every local authority.
+        """
+        rolled = np.array(values, dtype=np.float64)
+        rolled[self.n_children > 0] = 0.0
+        depth = np.where(self.geo.levels >= 0, self.geo.levels, len(LEVELS))
+        # Parents are always shallower than their children, so going from the
+        # deepest level up, each level's totals are final before they are added
+        for level in range(len(LEVELS) - 1, 0, -1):
+            children = np.flatnonzero((depth == level) & (self.parent >= 0))
+            np.add.at(rolled, self.parent[children], np.nan_to_num(rolled[children]))
+        return rolled
+
+
+def reconcile(
+    hierarchy: Hierarchy, values: np.ndarray, labels: pd.MultiIndex | None = None, tolerance: float | None = None
+) -> pd.DataFrame:
+    """
+    Compare every published aggregate with the sum of its direct children.
+
+    ``values`` is (geography, ...) aligned with ``hierarchy``; its trailing
+    axes are flattened into columns named by ``labels``. Without
+    ``tolerance`` each check allows ROUNDING_ERROR * (children + 1).
+    Returns one row per aggregate geography and column that has a value.
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(len(hierarchy), -1)
+    sums, counts = hierarchy.child_sums(values)
+
+    rows, cols = np.nonzero((counts > 0) & ~np.isnan(values))
+    published, children_sum, n = values[rows, cols], sums[rows, cols], counts[rows, cols]
+    allowed = ROUNDING_ERROR * (n + 1) if tolerance is None else np.full(len(n), tolerance)
+    difference = published - children_sum
+
+    report = pd.DataFrame({CODE_COL: np.asarray(hierarchy.geo.codes, dtype=object)[rows]})
+    if hierarchy.geo.names is not None:
+        report[NAME_COL] = hierarchy.geo.names[rows]
+    if labels is not None:
+        for i, name in enumerate(labels.names):
+            report[name or f"column_{i}"] = labels.get_level_values(i)[cols]
+    else:
+        report["column"] = cols
+    report["published"] = published
+    report["children_sum"] = children_sum
+    report["children"] = n
+    report["difference"] = difference
+    report["tolerance"] = allowed
+    report["ok"] = np.abs(difference) <= allowed
+    return report
+
+
+def reconcile_panel(panel: BirthsDeathsPanel, hierarchy: Hierarchy | None = None, **kwargs) -> pd.DataFrame:
+    """reconcile() for every metric and year of a panel in one pass."""
+    hierarchy = Hierarchy.from_processed() if hierarchy is None else hierarchy
+    ids = panel.geo.encode(hierarchy.geo.codes)
+    # (geography, metric, year) in hierarchy order; NaN where the panel lacks a code
+    values = np.full((len(hierarchy), len(panel.metrics), len(panel.years)), np.nan)
+    known = ids >= 0
+    values[known] = np.moveaxis(panel.values, 1, 0)[ids[known]]
+    labels = pd.MultiIndex.from_product([panel.metrics, panel.years.tolist()], names=["metric", "year"])
+    return reconcile(hierarchy, values, labels, **kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that local counts add up to the published totals.")
+    parser.add_argument("--tolerance", type=float, help="allowed difference (default: base-5 rounding bound)")
+    args = parser.parse_args()
+
+    report = reconcile_panel(BirthsDeathsPanel.from_processed(), tolerance=args.tolerance)
+    failures = report[~report["ok"]]
+    print(f"Checked {len(report)} aggregate values; {len(failures)} outside tolerance.")
+    if len(failures):
+        print(failures.to_string(index=False))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Dataset specs: how each raw ONS table maps onto its clean table.
+
+Kept free of pandas so the stage catalogue (pipeline.py, cli.py) can be
+built without importing it; cleaning_engine re-exports everything here.
+"""
+
+from dataclasses import dataclass, field
+
+
+def status_column(title: str) -> str:
+    """Name of the status column that accompanies a numeric column."""
+    return f"{title} (status)"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    Describes how one raw ONS table maps onto a clean table.
+
+    raw_file / processed_file are file names under data/raw and
+    data/processed. columns are temporary names for the leading raw columns,
+    numeric the subset to parse, rates the numeric columns holding
+    percentages rather than counts, and required the column whose missing
+    values mark non-data rows.
+    """
+
+    name: str
+    raw_file: str
+    processed_file: str
+    columns: tuple[str, ...]
+    numeric: tuple[str, ...]
+    required: str
+    rename: dict[str, str] = field(default_factory=dict, hash=False)
+    skip_rows: int = 0
+    code_col: str | None = "code"
+    region_col: str = "region"
+    rates: tuple[str, ...] = ()
+
+    def column_types(self) -> dict[str, str]:
+        """Compact dtypes for the clean (titled) columns, used by the Parquet copy."""
+        types = {}
+        for col in self.columns:
+            if col in self.rates:
+                dtype = "float32"
+            elif col in self.numeric:
+                dtype = "Int32"
+            else:
+                dtype = "category"
+            types[self.rename.get(col, col)] = dtype
+        for col in self.numeric:
+            types[status_column(self.rename.get(col, col))] = "category"
+        return types
+
+
+SPECS: dict[str, DatasetSpec] = {
+    spec.name: spec
+    for spec in [
+        DatasetSpec(
+            name="births_2019",
+            raw_file="uk_business_births.csv",
+            processed_file="uk_business_births_2019_clean.csv",
+            columns=("code", "region", "births_2019"),
+            numeric=("births_2019",),
+            required="births_2019",
+            rename={
+                "code": "Geography Code",
+                "region": "Geography Name",
+                "births_2019": "Number of Business Births (2019)",
+            },
+        ),
+        DatasetSpec(
+            name="births_2024",
+            raw_file="uk_business_births_2024.csv",
+            processed_file="uk_business_births_2024_clean.csv",
+            columns=("code", "region", "births_2024"),
+            numeric=("births_2024",),
+            required="births_2024",
+            rename={
+                "code": "Geography Code",
+                "region": "Geography Name",
+                "births_2024": "Number of Business Births (2024)",
+            },
+        ),
+        DatasetSpec(
+            name="deaths_2019",
+            raw_file="uk_business_deaths.csv",
+            processed_file="uk_business_deaths_2019_clean.csv",
+            columns=("code", "region", "deaths_2019"),
+            numeric=("deaths_2019",),
+            required="deaths_2019",
+            rename={
+                "code": "Geography Code",
+                "region": "Geography Name",
+                "deaths_2019": "Number of Business Deaths (2019)",
+            },
+        ),
+        DatasetSpec(
+            name="deaths_2024",
+            raw_file="uk_business_deaths_2024.csv",
+            processed_file="uk_business_deaths_2024_clean.csv",
+            columns=("code", "region", "deaths_2024"),
+            numeric=("deaths_2024",),
+            required="deaths_2024",
+            rename={
+                "code": "Geography Code",
+                "region": "Geography Name",
+                "deaths_2024": "Number of Business Deaths (2024)",
+            },
+        ),
+        DatasetSpec(
+            name="survival_2022",
+            raw_file="business_survival_2022.csv",
+            processed_file="business_survival_2022_clean.csv",
+            columns=(
+                "code",
+                "region",
+                "births_2022",
+                "one_year_survivals",
+                "one_year_survival_rate",
+            ),
+            numeric=("births_2022", "one_year_survivals", "one_year_survival_rate"),
+            required="births_2022",
+            rename={
+                "code": "Geography Code",
+                "region": "Geography Name",
+                "births_2022": "Number of Business Births (2022)",
+                "one_year_survivals": "Number Still Alive After 1 Year",
+                "one_year_survival_rate": "1-Year Survival Rate (%)",
+            },
+            rates=("one_year_survival_rate",),
+        ),
+        # The 2019 regional table has no code column; its first four
+        # non-empty rows are the title, "This worksheet contains one table",
+        # "Units: ..." and the "2019" cohort banner.
+        DatasetSpec(
+            name="survival_2019",
+            raw_file="business_survival_rates.csv",
+            processed_file="business_survival_rates_2019_clean.csv",
+            columns=(
+                "region",
+                "births_2019",
+                "survive_1yr_count",
+                "survive_1yr_rate",
+                "survive_5yr_count",
+                "survive_5yr_rate",
+            ),
+            numeric=(
+                "births_2019",
+                "survive_1yr_count",
+                "survive_1yr_rate",
+                "survive_5yr_count",
+                "survive_5yr_rate",
+            ),
+            required="births_2019",
+            rename={
+                "region": "Region",
+                "births_2019": "Births of New Enterprises (2019)",
+                "survive_1yr_count": "Surviving After 1 Year – Count",
+                "survive_1yr_rate": "1-Year Survival Rate (2019 Cohort, %)",
+                "survive_5yr_count": "Surviving After 5 Years – Count",
+                "survive_5yr_rate": "5-Year Survival Rate (2019 Cohort, %)",
+            },
+            rates=("survive_1yr_rate", "survive_5yr_rate"),
+            skip_rows=4,
+            code_col=None,
+        ),
+    ]
+}
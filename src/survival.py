@@ -0,0 +1,202 @@
+"""
+Multi-horizon business survival: cohort x horizon x geography.
+
+The clean survival tables keep only the 1-year (2022 district table) or
+1- and 5-year (2019 regional table) columns. This module reads every
+horizon straight from the raw ONS survival tables into dense masked arrays:
+
+    births[cohort, geography]
+    survivors[cohort, horizon, geography]
+
+Suppressed (":") and absent cells are masked, so horizons a cohort has not
+reached yet drop out of every calculation. Cumulative survival, conditional
+survival and hazards are then whole-array operations over all cohorts and
+geographies at once.
+
+    matrix = SurvivalMatrix.from_raw()
+    hazards = matrix.hazard()               # (cohort, horizon, geography)
+    london = matrix.frame("conditional", cohort=2020)
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import SPECS, parse_numeric
+from geography import GeographyIndex
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+
+# The regional table has names only; map them onto GSS codes so both
+# tables share one geography axis ("Total" is the UK row).
+REGION_CODES = {
+    "north east": "E12000001",
+    "north west": "E12000002",
+    "yorkshire and the humber": "E12000003",
+    "east midlands": "E12000004",
+    "west midlands": "E12000005",
+    "east": "E12000006",
+    "london": "E12000007",
+    "south east": "E12000008",
+    "south west": "E12000009",
+    "wales": "W92000004",
+    "scotland": "S92000003",
+    "northern ireland": "N92000002",
+    "total": "K02000001",
+}
+
+MEASURES = ("cumulative", "conditional", "hazard")
+
+_HORIZON_HEADER = re.compile(r"^(\d+)-year survival$")
+_COHORT_HEADER = re.compile(r"^(\d{4})\s+Births$")
+_YEAR = re.compile(r"^\d{4}$")
+
+
+def read_survival_table(path: str | Path) -> pd.DataFrame:
+    """
+    Long-format counts from one raw ONS survival table.
+
+    Handles both layouts in data/raw: a code and name column followed by
+    "2022 Births" (one cohort), or a name column followed by "Births" with
+    "2019", "2020", ... banner rows starting each cohort. Returns one row per
+    cohort and geography with columns cohort, code, name, births and one
+    "survived_<h>" count column per horizon in the table.
+    """
+    raw = pd.read_csv(path, header=None, dtype=str, encoding="utf-8-sig")
+    raw = raw.dropna(how="all")
+    cells = raw.apply(lambda col: col.str.strip())
+
+    # The header row is the one naming the horizon count columns
+    header_pos = int(np.flatnonzero(cells.eq("1-year survival").any(axis=1))[0])
+    header = cells.iloc[header_pos]
+    horizons = {}
+    for col, title in header.items():
+        match = _HORIZON_HEADER.match(str(title))
+        if match:
+            horizons[int(match.group(1))] = col
+    births_col = next(col for col, title in header.items() if str(title).endswith("Births"))
+    key_cols = [col for col in raw.columns if col < births_col]
+
+    body = cells.iloc[header_pos + 1:]
+    first = body[key_cols[0]]
+
+    # Cohort: from "2022 Births" in the header, else the latest banner row
+    cohort_match = _COHORT_HEADER.match(str(header[births_col]))
+    if cohort_match:
+        cohort = pd.Series(int(cohort_match.group(1)), index=body.index)
+    else:
+        banner = first.str.match(_YEAR, na=False) & body[births_col].isna()
+        cohort = first.where(banner).ffill()
+        body, cohort = body[~banner], cohort[~banner].astype(int)
+
+    value_cols = [births_col] + list(horizons.values())
+    numeric = parse_numeric(body, value_cols)
+    names = body[key_cols[-1]]
+    if len(key_cols) > 1:
+        codes = body[key_cols[0]]
+    else:
+        codes = names.str.lower().map(REGION_CODES).fillna(names)
+
+    table = pd.DataFrame({
+        "cohort": cohort,
+        "code": codes,
+        "name": names,
+        "births": numeric[births_col].astype("float64"),
+    })
+    for h, col in horizons.items():
+        table[f"survived_{h}"] = numeric[col].astype("float64")
+    return table[table["births"].notna()].reset_index(drop=True)
+
+
+class SurvivalMatrix:
+    """Masked births and survivor counts over cohort x horizon x geography."""
+
+    def __init__(self, births: np.ma.MaskedArray, survivors: np.ma.MaskedArray, cohorts, horizons, geo):
+        self.births = births
+        self.survivors = survivors
+        self.cohorts = np.asarray(cohorts, dtype=np.int16)
+        self.horizons = np.asarray(horizons, dtype=np.int8)
+        self.geo = geo
+
+    @classmethod
+    def from_tables(cls, tables: list[pd.DataFrame]):
+        """
+        Stack read_survival_table() outputs into one matrix.
+
+        Where two tables cover the same cohort and geography, the earlier
+        table's values are kept and the later one only fills its gaps; within
+        one table the first row for a cohort and geography is kept.
+        """
+        geo = GeographyIndex(
+            pd.concat([t["code"] for t in tables], ignore_index=True),
+            pd.concat([t["name"] for t in tables], ignore_index=True),
+        )
+        cohorts = sorted(set().union(*(t["cohort"].unique() for t in tables)))
+        horizons = sorted({
+            int(col.rsplit("_", 1)[1]) for t in tables for col in t.columns if col.startswith("survived_")
+        })
+
+        births = np.full((len(cohorts), len(geo)), np.nan)
+        survivors = np.full((len(cohorts), len(horizons), len(geo)), np.nan)
+        for table in tables:
+            c = np.searchsorted(cohorts, table["cohort"].to_numpy())
+            g = geo.encode(table["code"])
+            # A fancy-index assignment keeps the last of repeated cells, so drop repeats first
+            first = ~pd.Series(c * len(geo) + g).duplicated(keep="first").to_numpy()
+            table, c, g = table[first], c[first], g[first]
+            empty = np.isnan(births[c, g])
+            births[c[empty], g[empty]] = table["births"].to_numpy()[empty]
+            for col in table.columns:
+                if not col.startswith("survived_"):
+                    continue
+                h = horizons.index(int(col.rsplit("_", 1)[1]))
+                target = survivors[c, h, g]
+                fill = np.isnan(target)
+                survivors[c[fill], h, g[fill]] = table[col].to_numpy()[fill]
+
+        return cls(np.ma.masked_invalid(births), np.ma.masked_invalid(survivors), cohorts, horizons, geo)
+
+    @classmethod
+    def from_raw(cls, raw_dir: str | Path = RAW_DIR):
+        """Every survival table registered in cleaning_engine.SPECS."""
+        paths = [Path(raw_dir) / spec.raw_file for name, spec in SPECS.items() if name.startswith("survival_")]
+        return cls.from_tables([read_survival_table(p) for p in paths])
+
+    def cumulative_survival(self) -> np.ma.MaskedArray:
+        """Share of each cohort still trading after h years, S(h)."""
+        return self.survivors / self.births[:, np.newaxis, :]
+
+    def conditional_survival(self) -> np.ma.MaskedArray:
+        """S(h) / S(h - 1): share of year h - 1 survivors still trading at year h."""
+        cumulative = self.cumulative_survival()
+        previous = np.ma.concatenate(
+            [np.ma.ones(cumulative[:, :1].shape), cumulative[:, :-1]], axis=1
+        )
+        # S(h - 1) is only known when the previous horizon is in the matrix
+        gaps = np.diff(self.horizons, prepend=0) != 1
+        previous[:, gaps] = np.ma.masked
+        return cumulative / previous
+
+    def hazard(self) -> np.ma.MaskedArray:
+        """Probability of closing during year h given survival to year h - 1."""
+        return 1 - self.conditional_survival()
+
+    def measure(self, name: str) -> np.ma.MaskedArray:
+        if name == "cumulative":
+            return self.cumulative_survival()
+        if name == "conditional":
+            return self.conditional_survival()
+        if name == "hazard":
+            return self.hazard()
+        raise ValueError(f"Unknown survival measure: {name!r}")
+
+    def frame(self, measure: str, cohort: int) -> pd.DataFrame:
+        """One cohort's ``measure`` as a geography x horizon DataFrame (NaN where masked)."""
+        positions = np.flatnonzero(self.cohorts == cohort)
+        if not len(positions):
+            raise KeyError(f"Cohort not in matrix: {cohort}")
+        values = self.measure(measure)[positions[0]].filled(np.nan)
+        return pd.DataFrame(values.T, index=self.geo.codes, columns=self.horizons)
@@ -0,0 +1,336 @@
+"""
+Synthetic raw ONS tables at arbitrary scale, for load testing.
+
+Writes CSVs laid out like the real files in data/raw, quirks included:
+BOM-prefixed first line, blank leading rows or "Table ..." / "This
+worksheet ..." / "Units: ..." metadata rows, a year banner row, quoted
+"363,825" thousands, ":" suppression markers, repeated "Code" header rows,
+stacked cohort blocks and trailing blank rows.
+
+Geographies follow the ONS hierarchy (UK, GB, England and Wales, England,
+the nine English regions, then Wales, Scotland and Northern Ireland), with
+the requested number of local authorities spread over them. Every count is a
+multiple of 5 and each aggregate row is the exact sum of its local
+authorities, so roll-ups can be checked against the published totals.
+
+    python src/synthetic_ons.py OUT_DIR [--geographies 100000] [--years 2015-2024] [--seed 0]
+"""
+
+import argparse
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from cleaning_engine import SPECS
+
+HORIZONS = (1, 2, 3, 4, 5)
+
+_REGIONS = (
+    ("E12000001", "NORTH EAST"),
+    ("E12000002", "NORTH WEST"),
+    ("E12000003", "YORKSHIRE AND THE HUMBER"),
+    ("E12000004", "EAST MIDLANDS"),
+    ("E12000005", "WEST MIDLANDS"),
+    ("E12000006", "EAST"),
+    ("E12000007", "LONDON"),
+    ("E12000008", "SOUTH EAST"),
+    ("E12000009", "SOUTH WEST"),
+)
+_DEVOLVED = (("W92000004", "WALES", "W06"), ("S92000003", "SCOTLAND", "S12"), ("N92000002", "NORTHERN IRELAND", "N09"))
+_ENGLISH_LA_PREFIXES = ("E06", "E07", "E08", "E09")
+
+# Share of local authorities in England; the rest go to the devolved nations
+_ENGLAND_SHARE = 0.85
+
+
+@dataclass
+class Geographies:
+    """Rows of a synthetic table in ONS order, and what each aggregate row sums."""
+
+    codes: list[str]
+    names: list[str]
+    la_rows: np.ndarray
+    # Aggregate row index -> row indices it is the sum of
+    aggregates: dict[int, list[int]]
+
+
+def synthetic_geographies(n_local: int) -> Geographies:
+    """The national / regional frame plus ``n_local`` local authorities."""
+    codes = ["K02000001", "K03000001", "K04000001", "E92000001"]
+    names = ["UNITED KINGDOM", "GREAT BRITAIN", "ENGLAND AND WALES", "ENGLAND"]
+    la_rows = []
+    aggregates = {}
+    counters = dict.fromkeys(_ENGLISH_LA_PREFIXES + tuple(p for _, _, p in _DEVOLVED), 0)
+
+    def add_block(code, name, prefixes, count):
+        row = len(codes)
+        codes.append(code)
+        names.append(name)
+        aggregates[row] = []
+        for i in range(count):
+            prefix = prefixes[i % len(prefixes)]
+            counters[prefix] += 1
+            la_rows.append(len(codes))
+            aggregates[row].append(len(codes))
+            codes.append(f"{prefix}{counters[prefix]:06d}")
+            names.append(f"{name.title()} Area {i + 1}")
+        return row
+
+    n_england = round(n_local * _ENGLAND_SHARE)
+    n_devolved = n_local - n_england
+    regions = [
+        add_block(code, name, _ENGLISH_LA_PREFIXES, n_england // len(_REGIONS) + (i < n_england % len(_REGIONS)))
+        for i, (code, name) in enumerate(_REGIONS)
+    ]
+    wales, scotland, northern_ireland = (
+        add_block(code, name, (prefix,), n_devolved // len(_DEVOLVED) + (i < n_devolved % len(_DEVOLVED)))
+        for i, (code, name, prefix) in enumerate(_DEVOLVED)
+    )
+
+    aggregates[3] = regions
+    aggregates[2] = [3, wales]
+    aggregates[1] = [3, wales, scotland]
+    aggregates[0] = [1, northern_ireland]
+    return Geographies(codes, names, np.array(la_rows, dtype=np.int64), aggregates)
+
+
+def _roll_up(geo: Geographies, la_values: np.ndarray) -> np.ndarray:
+    """Local authority values, with every aggregate row the sum of its parts."""
+    values = np.zeros((len(geo.codes),) + la_values.shape[1:], dtype=np.int64)
+    values[geo.la_rows] = la_values
+    # Regions and nations sum local authorities; rows 3..0 (England, E&W, GB,
+    # UK) sum those, so go from the bottom of the hierarchy up
+    for row in sorted(geo.aggregates, reverse=True):
+        values[row] = values[geo.aggregates[row]].sum(axis=0)
+    return values
+
+
+def _counts(rng: np.random.Generator, n: int, mean: float) -> np.ndarray:
+    """Local authority counts, rounded to base 5 like ONS publications."""
+    return (np.maximum(rng.lognormal(np.log(mean), 0.6, n), 5) / 5).round().astype(np.int64) * 5
+
+
+def _fmt(value, suppressed: bool = False) -> str:
+    # csv.writer quotes "9,445" because of the comma, as ONS exports do
+    return ":" if suppressed else f"{int(value):,}"
+
+
+class _Table:
+    """CSV writer that pads every row to a fixed width and starts with a BOM."""
+
+    def __init__(self, path: Path, width: int):
+        self.path = Path(path)
+        self.width = width
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._fh, lineterminator="\n")
+        return self
+
+    def row(self, *cells) -> None:
+        cells = ["" if c is None else c for c in cells]
+        self._writer.writerow(cells + [""] * (self.width - len(cells)))
+
+    def blank(self, n: int = 1) -> None:
+        for _ in range(n):
+            self.row()
+
+    def __exit__(self, *exc_info):
+        self._fh.close()
+
+
+def write_counts_table(
+    path: str | Path,
+    kind: str,
+    year: int,
+    geo: Geographies,
+    rng: np.random.Generator,
+    titled: bool = False,
+    suppress: float = 0.01,
+    header_every: int = 5_000,
+    width: int = 6,
+) -> None:
+    """
+    A births or deaths table (Table 1.1 / 2.1 layout) for one year.
+
+    ``titled`` writes the "Table ..." / "This worksheet ..." / "Units: ..."
+    rows (as in the 2024 deaths file) instead of three blank rows. A
+    "Code,Geography,..." header row is repeated every ``header_every`` rows,
+    and a ``suppress`` share of local authorities is published as ":" (those
+    still count towards the aggregates).
+    """
+    values = _roll_up(geo, _counts(rng, len(geo.la_rows), 60 if kind == "births" else 50))
+    suppressed = np.zeros(len(geo.codes), dtype=bool)
+    suppressed[geo.la_rows] = rng.random(len(geo.la_rows)) < suppress
+
+    with _Table(path, width) as table:
+        if titled:
+            noun = "Births" if kind == "births" else "Deaths"
+            table.row(f"Table {1 if kind == 'births' else 2}.1d - Count Of {noun} Of New Enterprises For {year}")
+            table.row("This worksheet contains one table")
+            table.row("Units: Counts (control rounded to base 5)")
+        else:
+            table.blank(3)
+        table.row(None, None, str(year))
+        for i, (code, name) in enumerate(zip(geo.codes, geo.names)):
+            if i and header_every and i % header_every == 0:
+                table.row("Code", "Geography", str(year))
+            table.row(code, name, _fmt(values[i], suppressed[i]))
+        table.blank(3)
+
+
+def write_district_survival(
+    path: str | Path, cohort: int, release: int, geo: Geographies, rng: np.random.Generator
+) -> None:
+    """The Table 5.1d layout: one cohort, every geography, five horizons."""
+    survivors, births = _survival_counts(rng, len(geo.la_rows))
+    births, survivors = _roll_up(geo, births), _roll_up(geo, survivors)
+
+    with _Table(path, 13) as table:
+        table.row(f"Table 5.1d - Survival Of Newly Born Enterprises By Births Of Units In {cohort} And Their Survival")
+        table.row("This worksheet contains one table")
+        table.row("Units: Counts (control rounded to base 5)")
+        header = [None, None, f"{cohort} Births"]
+        for h in HORIZONS:
+            header += [f"{h}-year survival", f"{h}-year      per cent"]
+        table.row(*header)
+        for i, (code, name) in enumerate(zip(geo.codes, geo.names)):
+            # Codes carry the trailing space the real 5.1d export has
+            table.row(f"{code} ", name, _fmt(births[i]), *_horizon_cells(births[i], survivors[i], cohort, release))
+
+
+def write_regional_survival(
+    path: str | Path, cohorts: list[int], release: int, geo: Geographies, rng: np.random.Generator
+) -> None:
+    """The Table 4.1 layout: regions and nations, one stacked block per cohort."""
+    rows = [geo.codes.index(code) for code, _ in _REGIONS] + [geo.codes.index(c) for c, _, _ in _DEVOLVED]
+    with _Table(path, 12) as table:
+        table.row(f"Table 4.1 - Survival Of Newly Born Enterprises Region By Births For {cohorts[0]} To {cohorts[-1]}")
+        table.row("This worksheet contains one table")
+        table.row("Units: Counts (control rounded to base 5)")
+        header = [None, "Births"]
+        for h in HORIZONS:
+            header += [f"{h}-year survival", f"{h}-year      per cent"]
+        table.row(*header)
+        for cohort in cohorts:
+            survivors, births = _survival_counts(rng, len(geo.la_rows))
+            births, survivors = _roll_up(geo, births), _roll_up(geo, survivors)
+            table.row(str(cohort))
+            for i in rows + [0]:
+                name = "Total" if i == 0 else geo.names[i].title()
+                table.row(name, _fmt(births[i]), *_horizon_cells(births[i], survivors[i], cohort, release))
+        table.blank(5)
+
+
+def _survival_counts(rng: np.random.Generator, n: int) -> tuple[np.ndarray, np.ndarray]:
+    births = _counts(rng, n, 60)
+    # Cumulative survival falls each year; counts stay multiples of 5
+    rates = np.cumprod(rng.uniform([0.90, 0.72, 0.75, 0.80, 0.84], [0.96, 0.80, 0.82, 0.86, 0.90], (n, 5)), axis=1)
+    survivors = (births[:, None] * rates / 5).round().astype(np.int64) * 5
+    return survivors, births
+
+
+def _horizon_cells(births: int, survivors: np.ndarray, cohort: int, release: int) -> list[str]:
+    cells = []
+    for h, count in zip(HORIZONS, survivors):
+        # Horizons the cohort has not reached by the release are suppressed
+        if cohort + h > release:
+            cells += [":", ":"]
+        else:
+            cells += [_fmt(count), f"{100 * count / births:.1f}" if births else ":"]
+    return cells
+
+
+def write_rates_table(path: str | Path, years: list[int], rng: np.random.Generator) -> None:
+    """Table 1: UK active count, birth and death rates per year."""
+    with _Table(path, 8) as table:
+        table.row("Table 1: Business birth and death rates")
+        table.row(f"UK, {years[0]} to {years[-1]}")
+        table.blank()
+        table.row("Count to nearest thousand")
+        table.row(None, "Active ", None, "Births ", None, None, "Deaths ")
+        table.row(None, "Count", None, "Count", "Rate (%)", None, "Count", "Rate (%)")
+        table.blank()
+        for year in years:
+            active = int(rng.integers(2_700, 3_000))
+            birth_rate, death_rate = rng.uniform(10, 14), rng.uniform(9, 12)
+            table.row(
+                str(year), _fmt(active), None,
+                str(round(active * birth_rate / 100)), f"{birth_rate:.1f}", None,
+                str(round(active * death_rate / 100)), f"{death_rate:.1f}",
+            )
+        table.blank()
+        table.row("Source: ", "Inter-Departmental Business Register (IDBR) from the Office for National Statistics ")
+
+
+def generate(
+    out_dir: str | Path, n_local: int = 400, years: list[int] | None = None, seed: int = 0
+) -> list[Path]:
+    """
+    Write a complete synthetic data/raw directory into ``out_dir``.
+
+    Every raw file named in cleaning_engine.SPECS is written (so the
+    cleaners run unchanged against ``out_dir``), plus
+    uk_business_births_YYYY.csv / uk_business_deaths_YYYY.csv for each year
+    in ``years`` whose name is not already a SPECS raw file (2024 keeps
+    its spec layout). Returns the paths written.
+    """
+    out_dir = Path(out_dir)
+    years = sorted(years or [2019, 2024])
+    release = max(years + [2024])
+    geo = synthetic_geographies(n_local)
+    rng = np.random.default_rng(seed)
+    written = []
+
+    def counts(name, kind, year, **kwargs):
+        path = out_dir / name
+        write_counts_table(path, kind, year, geo, rng, **kwargs)
+        written.append(path)
+
+    counts(SPECS["births_2019"].raw_file, "births", 2019)
+    counts(SPECS["births_2024"].raw_file, "births", 2024, width=4)
+    counts(SPECS["deaths_2019"].raw_file, "deaths", 2019, width=7)
+    counts(SPECS["deaths_2024"].raw_file, "deaths", 2024, titled=True, width=5)
+    spec_files = {spec.raw_file for spec in SPECS.values()}
+    for year in years:
+        for kind, titled in (("births", False), ("deaths", True)):
+            name = f"uk_business_{kind}_{year}.csv"
+            if name not in spec_files:
+                counts(name, kind, year, titled=titled)
+
+    path = out_dir / SPECS["survival_2022"].raw_file
+    write_district_survival(path, 2022, release, geo, rng)
+    written.append(path)
+
+    path = out_dir / SPECS["survival_2019"].raw_file
+    write_regional_survival(path, list(range(2019, release)), release, geo, rng)
+    written.append(path)
+
+    path = out_dir / "business_birth_death_rates.csv"
+    write_rates_table(path, years, rng)
+    written.append(path)
+    return sorted(set(written))
+
+
+def _year_range(text: str) -> list[int]:
+    start, _, stop = text.partition("-")
+    return list(range(int(start), int(stop or start) + 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write synthetic ONS-format raw CSVs.")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--geographies", type=int, default=400, help="number of local authorities")
+    parser.add_argument("--years", type=_year_range, default=[2019, 2024], help="e.g. 2015-2024")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for path in generate(args.out_dir, args.geographies, args.years, args.seed):
+        print("Wrote:", path)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,62 +5,40 @@ Source: ONS Business Demography 2024 (Table 2.1d)
 Outputs a clean dataset with clear readable column titles.
 """
 
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import pandas as pd
 
+from build_cache import code_closure, run_cached
+from cleaning_engine import DEFAULT_CHUNKSIZE, SPECS, clean_dataset, save_table, stream_clean
+from profiling import profiled
+from validation import validated
 
+
+@profiled
 def load_deaths_2024(path: str | Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+@profiled
+@validated("deaths_2024")
 def clean_deaths_2024(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-
-    # Drop empty rows
-    df = df.dropna(how="all")
-
-    # Keep only first 3 useful columns
-    df = df.iloc[:, :3]
-
-    # Remove metadata + blank region rows
-    df = df[df.iloc[:, 0].notna()]
-
-    # Rename temp headers
-    df.columns = ["code", "region", "deaths_2024"]
-
-    # Remove internal header junk
-    df = df[df["region"].notna()]
-    df = df[df["code"] != "Code"]
-
-    # Clean numeric values
-    df["deaths_2024"] = (
-        df["deaths_2024"]
-        .astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace(":", "", regex=False)
-    )
-
-    df["deaths_2024"] = pd.to_numeric(df["deaths_2024"], errors="coerce")
+    return clean_dataset(df, "deaths_2024")
 
-    df = df.dropna(subset=["deaths_2024"]).reset_index(drop=True)
-    
-    # Professional Column Titles
- 
-    df = df.rename(
-        columns={
-            "code": "Geography Code",
-            "region": "Geography Name",
-            "deaths_2024": "Number of Business Deaths (2024)"
-        }
-    )
 
-    return df
+def stream_deaths_2024(path: str | Path, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of the raw UK business deaths 2024 table without loading it whole."""
+    return stream_clean(path, SPECS["deaths_2024"], chunksize)
 
 
-def save_deaths_2024(df: pd.DataFrame, output_path: str | Path):
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+@profiled
+def save_deaths_2024(
+    df: pd.DataFrame | Iterable[pd.DataFrame], output_path: str | Path, columnar: bool = False
+) -> None:
+    """Write the clean table to CSV, plus a typed Parquet copy when ``columnar`` is set."""
+    column_types = SPECS["deaths_2024"].column_types() if columnar else None
+    save_table(df, output_path, column_types)
 
 
 if __name__ == "__main__":
@@ -69,8 +47,13 @@ if __name__ == "__main__":
     raw = PROJECT_ROOT / "data" / "raw" / "uk_business_deaths_2024.csv"
     out = PROJECT_ROOT / "data" / "processed" / "uk_business_deaths_2024_clean.csv"
 
-    raw_df = load_deaths_2024(raw)
-    clean_df = clean_deaths_2024(raw_df)
-    save_deaths_2024(clean_df, out)
+    def build() -> None:
+        raw_df = load_deaths_2024(raw)
+        clean_df = clean_deaths_2024(raw_df)
+        save_deaths_2024(clean_df, out, columnar=True)
 
-    print("Saved:", out)
+    code = code_closure(__file__)
+    if run_cached("deaths_2024", [raw], out, code, build, force="--force" in sys.argv[1:]):
+        print("Saved:", out)
+    else:
+        print("Up to date, skipped:", out)
@@ -0,0 +1,290 @@
+"""
+Schema and consistency checks for the clean tables.
+
+Each rule is one columnar expression over whole columns that flags the
+rows breaking it: GSS codes that do not match the ONS pattern, negative
+counts, rates outside 0-100, survivors exceeding births, published
+survival rates that disagree with survivors / births, and value / status
+columns that disagree. Missing values never break a rule (the status
+columns say why they are missing).
+
+Every clean_* function is wrapped with @validated, which checks its result
+in the mode given by ONS_VALIDATE:
+
+    full        check every row and warn about any violations (default)
+    fail-fast   raise ValidationError at the first rule that is broken
+    sample      check a fixed-size random sample of rows, warn on violations
+                (the sample positions are drawn once per table size and reused)
+    off         skip validation
+
+    ONS_VALIDATE=fail-fast python src/pipeline.py --force
+    python src/validation.py            # check data/processed
+"""
+
+import argparse
+import functools
+import os
+import re
+import warnings
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import SPECS, DatasetSpec, status_column
+from profiling import stage
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+VALIDATE_ENV = "ONS_VALIDATE"
+MODES = ("full", "fail-fast", "sample", "off")
+DEFAULT_SAMPLE = 1000
+
+CODE_PATTERN = r"[EKNSW]\d{8}"
+_CODE = re.compile(CODE_PATTERN)
+
+# Published rates have one decimal place; the float32 slack covers storage
+RATE_TOLERANCE = 0.05 + 1e-4
+
+# Survival tables: (survivors, births, published survival rate)
+_SURVIVAL = {
+    "survival_2022": (("one_year_survivals", "births_2022", "one_year_survival_rate"),),
+    "survival_2019": (
+        ("survive_1yr_count", "births_2019", "survive_1yr_rate"),
+        ("survive_5yr_count", "births_2019", "survive_5yr_rate"),
+    ),
+}
+
+PROCESSED_FILES = {
+    **{name: spec.processed_file for name, spec in SPECS.items()},
+    "birth_death_rates": "business_birth_death_rates_clean.csv",
+}
+
+
+class ValidationError(ValueError):
+    """A clean table broke a validation rule (raised in fail-fast mode)."""
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A named check over some columns of a clean table.
+
+    ``violated`` takes those columns (numeric ones as float64 arrays with
+    NaN for missing values, the rest as Series) and returns a boolean mask
+    that is True on the rows breaking the rule; NA counts as passing.
+    """
+
+    name: str
+    columns: tuple[str, ...]
+    violated: Callable[..., np.ndarray]
+
+    def rows(self, columns: "_Columns") -> np.ndarray:
+        """Boolean mask of the rows in ``columns`` that break the rule."""
+        mask = self.violated(*(columns[col] for col in self.columns))
+        if isinstance(mask, pd.Series):
+            mask = mask.fillna(False)
+        return np.asarray(mask, dtype=bool)
+
+
+class _Columns(dict):
+    """The columns of ``df`` (at ``positions`` only, if given), converted for the rules on first use."""
+
+    def __init__(self, df: pd.DataFrame, positions: np.ndarray | None = None):
+        super().__init__()
+        self.df = df
+        self.positions = positions
+
+    def __missing__(self, col: str):
+        values = self.df[col] if self.positions is None else self.df[col].iloc[self.positions]
+        if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+            values = values.to_numpy(dtype="float64", na_value=np.nan)
+        self[col] = values
+        return values
+
+
+def _bad_code(codes: pd.Series) -> np.ndarray:
+    # Match each distinct code once rather than every row
+    ids, distinct = pd.factorize(codes, use_na_sentinel=False)
+    ok = np.array([isinstance(code, str) and _CODE.fullmatch(code.strip()) is not None for code in distinct])
+    return ~ok[ids] if len(ok) else np.zeros(len(ids), dtype=bool)
+
+
+def _negative(values: np.ndarray) -> np.ndarray:
+    return values < 0
+
+
+def _outside_percent(values: np.ndarray) -> np.ndarray:
+    return (values < 0) | (values > 100)
+
+
+def _exceeds(part: np.ndarray, whole: np.ndarray) -> np.ndarray:
+    return part > whole
+
+
+def _rate_mismatch(rate: np.ndarray, part: np.ndarray, whole: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.abs(rate - 100 * part / np.where(whole == 0, np.nan, whole)) > RATE_TOLERANCE
+
+
+def _equals(labels: pd.Series, value: str) -> np.ndarray:
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        # Compare the category codes rather than the labels
+        categories = labels.cat.categories
+        if value not in categories:
+            return np.zeros(len(labels), dtype=bool)
+        return labels.cat.codes.to_numpy() == categories.get_loc(value)
+    return np.asarray(labels == value, dtype=bool)
+
+
+def _status_mismatch(values: np.ndarray, status: pd.Series) -> np.ndarray:
+    return ~np.isnan(values) != _equals(status, "value")
+
+
+def spec_rules(spec: DatasetSpec) -> tuple[Rule, ...]:
+    """The rules for a table cleaned by the engine, derived from its spec."""
+    title = {col: spec.rename.get(col, col) for col in spec.columns}
+    rules = []
+    if spec.code_col is not None:
+        rules.append(Rule("code matches ONS pattern", (title[spec.code_col],), _bad_code))
+    for col in spec.numeric:
+        if col in spec.rates:
+            rules.append(Rule(f"{title[col]} within 0-100", (title[col],), _outside_percent))
+        else:
+            rules.append(Rule(f"{title[col]} non-negative", (title[col],), _negative))
+        rules.append(Rule(
+            f"{title[col]} agrees with its status", (title[col], status_column(title[col])), _status_mismatch
+        ))
+    for survivors, births, rate in _SURVIVAL.get(spec.name, ()):
+        rules.append(Rule(f"{title[survivors]} at most births", (title[survivors], title[births]), _exceeds))
+        rules.append(Rule(
+            f"{title[rate]} matches survivors / births", (title[rate], title[survivors], title[births]), _rate_mismatch
+        ))
+    return tuple(rules)
+
+
+RULES: dict[str, tuple[Rule, ...]] = {
+    **{name: spec_rules(spec) for name, spec in SPECS.items()},
+    "birth_death_rates": (
+        Rule("Year within 2000-2100", ("Year",), lambda years: (years < 2000) | (years > 2100)),
+        Rule("Birth Rate (%) within 0-100", ("Birth Rate (%)",), _outside_percent),
+        Rule("Death Rate (%) within 0-100", ("Death Rate (%)",), _outside_percent),
+    ),
+}
+
+# Column identifying a row in violation reports
+_KEY_COLUMNS = ("Geography Code", "Region", "Year")
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_positions(n: int, size: int, seed: int) -> np.ndarray:
+    """``size`` distinct row positions out of ``n`` in ascending order, drawn once per (n, size, seed)."""
+    positions = np.sort(np.random.default_rng(seed).choice(n, size, replace=False))
+    positions.flags.writeable = False
+    return positions
+
+
+def validate(
+    df: pd.DataFrame, rules, mode: str = "full", sample: int = DEFAULT_SAMPLE, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Check ``df`` against ``rules`` (a RULES name or a sequence of Rule).
+
+    Returns one row per violation: the rule, the row label and the row's
+    key (code, region or year). "fail-fast" raises ValidationError on the
+    first broken rule instead; "sample" checks ``sample`` random rows.
+    """
+    if isinstance(rules, str):
+        try:
+            rules = RULES[rules]
+        except KeyError:
+            raise ValueError(f"No validation rules for {rules!r}") from None
+    if mode not in MODES:
+        raise ValueError(f"Unknown validation mode: {mode!r} (expected one of {', '.join(MODES)})")
+    key = next((col for col in _KEY_COLUMNS if col in df.columns), None)
+    found = []
+    if mode == "off":
+        rules = ()
+    positions = None
+    if mode == "sample" and len(df) > sample:
+        positions = _sample_positions(len(df), sample, seed)
+    columns = _Columns(df, positions)
+
+    for rule in rules:
+        bad = rule.rows(columns)
+        if not bad.any():
+            continue
+        where = np.flatnonzero(bad) if positions is None else positions[bad]
+        rows = df.index[where]
+        keys = df[key].iloc[where].to_numpy() if key is not None else None
+        if mode == "fail-fast":
+            shown = ", ".join(map(str, (keys if key is not None else rows)[:5]))
+            raise ValidationError(f"{len(where)} rows break '{rule.name}': {shown}")
+        violations = pd.DataFrame({"rule": rule.name, "row": rows})
+        if key is not None:
+            violations[key] = keys
+        found.append(violations)
+
+    columns = ["rule", "row"] + ([key] if key else [])
+    return pd.concat(found, ignore_index=True) if found else pd.DataFrame(columns=columns)
+
+
+def check_table(df: pd.DataFrame, name: str, mode: str | None = None) -> pd.DataFrame:
+    """validate() in the ONS_VALIDATE mode, warning when any rule is broken."""
+    mode = mode or os.environ.get(VALIDATE_ENV, "full")
+    with stage("validate", len(df)) as s:
+        violations = validate(df, name, mode)
+        s.rows_out = len(df)
+    if len(violations):
+        counts = violations["rule"].value_counts(sort=False)
+        summary = "; ".join(f"{rule}: {n} rows" for rule, n in counts.items())
+        warnings.warn(f"{name} failed validation ({summary})", stacklevel=3)
+    return violations
+
+
+def validated(name: str):
+    """Check the table returned by the decorated clean_* function against RULES[name]."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            check_table(result, name)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate the processed tables.")
+    parser.add_argument("names", nargs="*", help=f"tables to check (default: all of {', '.join(RULES)})")
+    parser.add_argument("--mode", choices=MODES[:3], default="full")
+    parser.add_argument("--processed-dir", type=Path, default=PROCESSED_DIR)
+    args = parser.parse_args()
+
+    unknown = set(args.names) - set(RULES)
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(sorted(unknown))}")
+
+    failed = False
+    for name in args.names or RULES:
+        try:
+            violations = validate(pd.read_csv(args.processed_dir / PROCESSED_FILES[name]), name, args.mode)
+        except ValidationError as exc:
+            print(f"{name}: {exc}")
+            failed = True
+            continue
+        failed |= len(violations) > 0
+        print(f"{name}: {len(violations)} violations")
+        if len(violations):
+            print(violations.to_string(index=False))
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
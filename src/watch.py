@@ -0,0 +1,160 @@
+"""
+Watch data/raw and rebuild only what a changed file affects.
+
+The raw directory is polled for files whose size or modification time
+changed. A burst of writes (an editor saving, a download finishing, several
+files dropped at once) is debounced into one rebuild, which runs the
+cleaner stages reading the changed files and every chart downstream of
+them (see pipeline.downstream) in the background while polling continues.
+Changes that arrive during a rebuild are queued for the next one.
+
+Rebuilds reuse one process pool whose workers have already imported
+pandas and matplotlib, so a change to a raw table is usually reflected in
+data/processed and plots/ about a second later.
+
+Usage:
+    python src/watch.py [--debounce 0.5] [--interval 0.2] [--jobs N]
+"""
+
+import argparse
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from pipeline import RAW_DIR, Stage, build_stages, downstream, print_report, run_pipeline, worker_pool
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_INTERVAL = 0.2
+
+
+def snapshot(directory: str | Path) -> dict[Path, tuple[int, int]]:
+    """(size, mtime_ns) of every regular file directly inside ``directory``."""
+    files = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                files[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def changed_files(before: dict, after: dict) -> set[Path]:
+    """Files added, removed or rewritten between two snapshots."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def affected_stages(stages: dict[str, Stage], paths) -> dict[str, Stage]:
+    """The stages reading any of ``paths`` and everything downstream, in catalogue order."""
+    paths = {Path(p).resolve() for p in paths}
+    readers = {name for name, stage in stages.items() if paths & {p.resolve() for p in stage.inputs}}
+    names = downstream(stages, readers)
+    return {name: stage for name, stage in stages.items() if name in names}
+
+
+class Debouncer:
+    """Collects items until none have arrived for ``delay`` seconds."""
+
+    def __init__(self, delay: float = DEFAULT_DEBOUNCE):
+        self.delay = delay
+        self.pending: set = set()
+        self._last = 0.0
+
+    def add(self, items, now: float | None = None) -> None:
+        if items:
+            self.pending |= set(items)
+            self._last = time.monotonic() if now is None else now
+
+    def ready(self, now: float | None = None) -> set:
+        """The collected items once the burst has settled (emptying the queue), else an empty set."""
+        now = time.monotonic() if now is None else now
+        if not self.pending or now - self._last < self.delay:
+            return set()
+        items, self.pending = self.pending, set()
+        return items
+
+
+def _preload() -> None:
+    # Import the heavy modules once per worker, ahead of the first change
+    import matplotlib.pyplot  # noqa: F401
+    import cleaning_engine  # noqa: F401
+
+
+def _log(message: str) -> None:
+    print(f"[{datetime.now():%H:%M:%S}] {message}", flush=True)
+
+
+class Watcher:
+    """Polls a raw directory and rebuilds the affected stages in a background thread."""
+
+    def __init__(
+        self,
+        raw_dir: str | Path = RAW_DIR,
+        stages: dict[str, Stage] | None = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        interval: float = DEFAULT_INTERVAL,
+        jobs: int | None = None,
+    ):
+        self.raw_dir = Path(raw_dir)
+        self.stages = build_stages() if stages is None else stages
+        self.interval = interval
+        self.jobs = jobs
+        self.debouncer = Debouncer(debounce)
+        self._files = snapshot(self.raw_dir)
+        self._build: threading.Thread | None = None
+
+    def poll(self) -> set[Path]:
+        """Files changed since the last poll."""
+        files = snapshot(self.raw_dir)
+        changed = changed_files(self._files, files)
+        self._files = files
+        return changed
+
+    def rebuild(self, paths: set[Path], pool=None) -> dict[str, tuple[str, float]]:
+        """Run the stages affected by ``paths``; returns run_pipeline's results."""
+        stages = affected_stages(self.stages, paths)
+        names = ", ".join(sorted(p.name for p in paths))
+        if not stages:
+            _log(f"changed {names}: no stage reads it")
+            return {}
+        _log(f"changed {names}: rebuilding {', '.join(stages)}")
+        start = time.perf_counter()
+        results = run_pipeline(stages, jobs=self.jobs, pool=pool)
+        print_report(results, time.perf_counter() - start)
+        return results
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Poll until ``stop`` is set (or forever), rebuilding after each settled burst."""
+        stop = stop or threading.Event()
+        with worker_pool(self.jobs) as pool:
+            for _ in range(self.jobs or os.cpu_count() or 1):
+                pool.submit(_preload)
+            _log(f"watching {self.raw_dir} (Ctrl+C to stop)")
+            while not stop.wait(self.interval):
+                self.debouncer.add(self.poll())
+                if self._build is not None and self._build.is_alive():
+                    continue
+                paths = self.debouncer.ready()
+                if paths:
+                    self._build = threading.Thread(target=self.rebuild, args=(paths, pool), daemon=True)
+                    self._build.start()
+            if self._build is not None:
+                self._build.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild processed tables and charts when raw files change.")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="seconds of quiet before a rebuild")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    try:
+        Watcher(debounce=args.debounce, interval=args.interval, jobs=args.jobs).run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Ingest the ONS Business Demography workbook directly, without CSV exports.
+
+The workbook is opened once; its shared strings and sheet index are read
+up front, and each needed sheet is then streamed row by row
+(xml.etree.ElementTree.iterparse, clearing rows as it goes) into a frame
+laid out exactly as pd.read_csv would load the sheet's CSV export, first
+row as header included. Numeric cells arrive as numbers, so the cleaners'
+numeric parsing has nothing left to do for them. Each sheet goes straight
+to its cleaner:
+
+    tables = ingest_workbook("data/raw/businessdemography2024.xlsx")
+    python src/workbook.py data/raw/businessdemography2024.xlsx --save
+
+WORKBOOK_SHEETS maps cleaners to the sheet names of the current edition;
+pass --sheet name=sheet (or a ``sheets`` dict) for other editions, e.g.
+births_2019="Table 1.1d" against the 2019 workbook.
+
+Only the standard library is needed: an .xlsx file is a zip of XML parts.
+"""
+
+import argparse
+import importlib
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+# Cleaner -> sheet in the current (2024) Business Demography workbook
+WORKBOOK_SHEETS = {
+    "births_2024": "Table 1.1d",
+    "deaths_2024": "Table 2.1d",
+    "survival_2019": "Table 4.1",
+    "survival_2022": "Table 5.1d",
+    "birth_death_rates": "Table 1",
+}
+
+# Cleaner -> (module, clean function, save function, processed file)
+CLEANERS = {
+    "births_2019": (
+        "clean_uk_business_births_2019", "clean_births_2019", "save_births_2019",
+        "uk_business_births_2019_clean.csv",
+    ),
+    "births_2024": (
+        "clean_uk_business_births_2024", "clean_births_2024", "save_births_2024",
+        "uk_business_births_2024_clean.csv",
+    ),
+    "deaths_2019": (
+        "clean_uk_business_deaths_2019", "clean_deaths_2019", "save_deaths_2019",
+        "uk_business_deaths_2019_clean.csv",
+    ),
+    "deaths_2024": (
+        "uk_business_deaths_2024", "clean_deaths_2024", "save_deaths_2024",
+        "uk_business_deaths_2024_clean.csv",
+    ),
+    "survival_2022": (
+        "clean_business_survival_2022", "clean_survival_2022", "save_survival_2022",
+        "business_survival_2022_clean.csv",
+    ),
+    "survival_2019": (
+        "clean_business_survival_rates_2019", "clean_survival_2019", "save_survival_2019",
+        "business_survival_rates_2019_clean.csv",
+    ),
+    "birth_death_rates": (
+        "clean_business_births_vs_deaths", "clean_business_birth_death_rates", "save_clean",
+        "business_birth_death_rates_clean.csv",
+    ),
+}
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+def _column_index(letters: str) -> int:
+    """0-based column of a cell reference's letters ("A" -> 0, "AB" -> 27)."""
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+
+def _number(text: str):
+    """An XLSX numeric cell as int when it is integral, float otherwise."""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+class Workbook:
+    """Read-only streaming access to the sheets of one .xlsx file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        self.sheets = self._sheet_parts()
+        self._strings = self._shared_strings()
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _sheet_parts(self) -> dict[str, str]:
+        """Sheet name -> zip member, in workbook order."""
+        rels = {}
+        with self._zip.open("xl/_rels/workbook.xml.rels") as fh:
+            for _, el in iterparse(fh):
+                if el.tag == f"{_PKG_REL_NS}Relationship":
+                    target = el.get("Target")
+                    target = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+                    rels[el.get("Id")] = posixpath.normpath(target)
+        sheets = {}
+        with self._zip.open("xl/workbook.xml") as fh:
+            for _, el in iterparse(fh):
+                if el.tag == f"{_NS}sheet":
+                    sheets[el.get("name")] = rels[el.get(f"{_REL_NS}id")]
+        return sheets
+
+    def _shared_strings(self) -> list[str]:
+        if "xl/sharedStrings.xml" not in self._zip.namelist():
+            return []
+        strings = []
+        with self._zip.open("xl/sharedStrings.xml") as fh:
+            for _, el in iterparse(fh):
+                if el.tag == f"{_NS}si":
+                    # Rich text is split over several <t> runs
+                    strings.append("".join(t.text or "" for t in el.iter(f"{_NS}t")))
+                    el.clear()
+        return strings
+
+    def _cell_value(self, cell):
+        kind = cell.get("t")
+        if kind == "inlineStr":
+            return "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+        v = cell.find(f"{_NS}v")
+        if v is None or v.text is None:
+            return None
+        if kind == "s":
+            return self._strings[int(v.text)]
+        if kind in ("str", "e"):
+            return v.text
+        if kind == "b":
+            return v.text == "1"
+        return _number(v.text)
+
+    def rows(self, sheet: str) -> Iterator[list]:
+        """
+        Yield every row of ``sheet`` as a list of cell values (None when empty).
+
+        Rows the file leaves out (empty rows) are yielded as empty lists, so
+        row positions match the sheet.
+        """
+        try:
+            part = self.sheets[sheet]
+        except KeyError:
+            raise KeyError(f"No sheet {sheet!r} in {self.path.name}") from None
+        expected = 1
+        sheet_data = None
+        with self._zip.open(part) as fh:
+            for event, el in iterparse(fh, events=("start", "end")):
+                if event == "start":
+                    if el.tag == f"{_NS}sheetData":
+                        sheet_data = el
+                    continue
+                if el.tag != f"{_NS}row":
+                    continue
+                number = int(el.get("r", expected))
+                for _ in range(expected, number):
+                    yield []
+                expected = number + 1
+
+                values = []
+                for position, cell in enumerate(el.iter(f"{_NS}c")):
+                    ref = _CELL_REF.match(cell.get("r", ""))
+                    col = _column_index(ref.group(1)) if ref else position
+                    value = self._cell_value(cell)
+                    if value is not None and value != "":
+                        values.extend([None] * (col + 1 - len(values)))
+                        values[col] = value
+                yield values
+                # Drop finished rows so memory does not grow with the sheet
+                sheet_data.clear()
+
+    def frame(self, sheet: str) -> pd.DataFrame:
+        """
+        ``sheet`` as the DataFrame pd.read_csv would give for its CSV export.
+
+        The first row becomes the header (blank titles as "Unnamed: i",
+        repeats numbered like read_csv does) and every row is padded to the
+        widest one.
+        """
+        rows = self.rows(sheet)
+        header = next(rows, [])
+        # Fill one list per column as the rows stream past, so only the
+        # cell values are held, never the whole sheet as row lists
+        columns = [[] for _ in header]
+        height = 0
+        for row in rows:
+            for _ in range(len(columns), len(row)):
+                columns.append([None] * height)
+            for i, column in enumerate(columns):
+                column.append(row[i] if i < len(row) else None)
+            height += 1
+
+        names, seen = [], {}
+        for i in range(len(columns)):
+            cell = header[i] if i < len(header) else None
+            name = f"Unnamed: {i}" if cell is None else str(cell)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return pd.DataFrame(dict(zip(names, columns)), index=range(height), dtype=object).infer_objects()
+
+
+def _cleaner(name: str):
+    try:
+        module_name, clean_name, save_name, processed_file = CLEANERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown cleaner: {name!r}") from None
+    module = importlib.import_module(module_name)
+    return getattr(module, clean_name), getattr(module, save_name), processed_file
+
+
+def ingest_workbook(
+    path: str | Path,
+    sheets: dict[str, str] | None = None,
+    processed_dir: str | Path | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Clean every mapped sheet of the workbook at ``path``; returns the clean tables.
+
+    ``sheets`` maps cleaner names (see CLEANERS) to sheet names and defaults
+    to WORKBOOK_SHEETS. With ``processed_dir`` each table is also saved
+    there, with its Parquet copy, under its usual processed file name.
+    """
+    sheets = WORKBOOK_SHEETS if sheets is None else sheets
+    tables = {}
+    with Workbook(path) as book:
+        missing = [s for s in sheets.values() if s not in book.sheets]
+        if missing:
+            raise KeyError(f"{Path(path).name} has no sheet(s): {', '.join(missing)}")
+        for name, sheet in sheets.items():
+            clean, save, processed_file = _cleaner(name)
+            tables[name] = clean(book.frame(sheet))
+            if processed_dir is not None:
+                save(tables[name], Path(processed_dir) / processed_file, columnar=True)
+    return tables
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Clean the ONS demography tables straight from the workbook.")
+    parser.add_argument("workbook", type=Path)
+    parser.add_argument(
+        "--sheet", action="append", default=[], metavar="NAME=SHEET",
+        help="map a cleaner to a sheet (repeatable; replaces the default mapping)",
+    )
+    parser.add_argument("--save", action="store_true", help="write the tables to data/processed")
+    args = parser.parse_args()
+
+    sheets = dict(item.split("=", 1) for item in args.sheet) or None
+    tables = ingest_workbook(args.workbook, sheets, PROCESSED_DIR if args.save else None)
+    for name, table in tables.items():
+        print(f"  {name:<20}{len(table):>6} rows")
+
+
+if __name__ == "__main__":
+    main()
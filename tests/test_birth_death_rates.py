@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import clean_business_births_vs_deaths as rates
+from clean_business_births_vs_deaths import (
+    clean_business_birth_death_rates,
+    detect_year_and_rate_columns,
+    load_raw,
+    sample_rows,
+)
+
+RAW = PROJECT_ROOT / "data" / "raw" / "business_birth_death_rates.csv"
+
+
+def test_detection_prefers_named_columns():
+    df = pd.DataFrame({
+        "year": [2019, 2020, 2021],
+        "Death rate": [10.5, 10.4, 11.2],
+        "Birth rate": [12.6, 11.5, 12.4],
+        "count": [2889, 2897, 2940],
+    })
+
+    assert detect_year_and_rate_columns(df) == ("year", "Birth rate", "Death rate")
+
+
+def test_clean_coerces_the_frame_once(monkeypatch):
+    calls = []
+    original = rates.coerce_numeric
+
+    def counting(df):
+        calls.append(df.shape)
+        return original(df)
+
+    monkeypatch.setattr(rates, "coerce_numeric", counting)
+    clean_business_birth_death_rates(load_raw(RAW))
+
+    assert len(calls) == 1
+
+
+def test_sampled_detection_matches_full_detection_on_long_table():
+    raw = load_raw(RAW)
+    big = pd.concat([raw] * 500, ignore_index=True)
+
+    assert detect_year_and_rate_columns(big, sample=200) == detect_year_and_rate_columns(raw)
+    assert len(sample_rows(big, 200)) == 200
+    pd.testing.assert_frame_equal(
+        clean_business_birth_death_rates(raw, sample=10),
+        clean_business_birth_death_rates(raw),
+    )
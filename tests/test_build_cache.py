@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from build_cache import BuildManifest, code_closure, run_cached
+
+
+def _stage(tmp_path):
+    raw = tmp_path / "raw.csv"
+    code = tmp_path / "cleaner.py"
+    out = tmp_path / "out.csv"
+    raw.write_text("a\n1\n", encoding="utf-8")
+    code.write_text("VERSION = 1\n", encoding="utf-8")
+    return raw, code, out
+
+
+def test_run_cached_skips_unchanged_stage(tmp_path):
+    raw, code, out = _stage(tmp_path)
+    manifest = tmp_path / "manifest.json"
+    calls = []
+
+    def build():
+        calls.append(1)
+        out.write_text(raw.read_text(encoding="utf-8"), encoding="utf-8")
+
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+    assert not run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+    assert len(calls) == 1
+
+    recorded = BuildManifest(manifest).stages["s"]
+    assert recorded["output"].endswith("out.csv")
+
+
+def test_run_cached_rebuilds_on_input_code_or_missing_output(tmp_path):
+    raw, code, out = _stage(tmp_path)
+    manifest = tmp_path / "manifest.json"
+    calls = []
+
+    def build():
+        calls.append(1)
+        out.write_text("x\n", encoding="utf-8")
+
+    run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    raw.write_text("a\n2\n", encoding="utf-8")
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    code.write_text("VERSION = 2\n", encoding="utf-8")
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    out.unlink()
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    assert run_cached("s", [raw], out, [code], build, force=True, manifest_path=manifest)
+    assert len(calls) == 5
+
+
+def test_code_closure_follows_project_imports_only(tmp_path):
+    (tmp_path / "stage.py").write_text(
+        "import os\nimport helper\nimport aliased as al, other.part as op\n\ndef f():\n    from lazy import x\n"
+    )
+    (tmp_path / "aliased.py").write_text("")
+    (tmp_path / "other.py").write_text("")
+    (tmp_path / "helper.py").write_text("import numpy as np\nfrom shared.sub import y\n")
+    (tmp_path / "lazy.py").write_text("")
+    (tmp_path / "shared.py").write_text("import helper\n")
+    (tmp_path / "unused.py").write_text("")
+
+    closure = code_closure(tmp_path / "stage.py", search=[tmp_path])
+
+    assert [p.name for p in closure] == [
+        "aliased.py", "helper.py", "lazy.py", "other.py", "shared.py", "stage.py"
+    ]
+
+
+def test_run_cached_rebuilds_when_an_output_or_its_parquet_copy_changes(tmp_path):
+    raw, code, out = _stage(tmp_path)
+    parquet = out.with_suffix(".parquet")
+    manifest = tmp_path / "manifest.json"
+    calls = []
+
+    def build():
+        calls.append(1)
+        out.write_text("x\n", encoding="utf-8")
+        parquet.write_bytes(b"PAR1")
+
+    run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+    assert len(BuildManifest(manifest).stages["s"]["outputs"]) == 2
+
+    out.write_text("edited by hand\n", encoding="utf-8")
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    parquet.write_bytes(b"PAR1 stale")
+    assert run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+
+    assert not run_cached("s", [raw], out, [code], build, manifest_path=manifest)
+    assert len(calls) == 3
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 import pandas as pd
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
@@ -11,6 +12,8 @@ from clean_uk_business_births_2024 import clean_births_2024
 from uk_business_deaths_2024 import clean_deaths_2024
 
 
+# "X1" is not a GSS code; validation's warning about it is not what this test checks
+@pytest.mark.filterwarnings("ignore:survival_2022 failed validation")
 def test_survival2022_cleaning_numeric_and_no_empty_rows():
     df = pd.DataFrame({
         "code": ["X1", None],
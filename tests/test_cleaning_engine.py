@@ -0,0 +1,148 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import pytest
+
+from cleaning_engine import (
+    SPECS,
+    STATUS_DTYPE,
+    clean_dataset,
+    clean_with_spec,
+    is_metadata_row,
+    parse_numeric,
+    save_table,
+    status_column,
+    stream_clean,
+    to_counts,
+)
+
+
+def test_parse_numeric_handles_separators_suppression_and_whitespace():
+    df = pd.DataFrame({
+        "a": ["363,825", " 1,200 ", ":", None],
+        "b": ["92.3", ":", "68.9", "12"],
+    })
+
+    parsed = parse_numeric(df, ["a", "b"])
+
+    assert parsed["a"].tolist()[:2] == [363825, 1200]
+    assert parsed["a"].iloc[2:].isna().all()
+    assert parsed["b"].iloc[0] == 92.3
+    assert np.isnan(parsed["b"].iloc[1])
+
+
+def test_parse_numeric_keeps_integer_dtype_when_every_cell_is_integer():
+    df = pd.DataFrame({"a": ["1,000", "25"], "b": ["1.5", "2"]})
+
+    parsed = parse_numeric(df, ["a", "b"])
+
+    assert parsed["a"].dtype == "int64"
+    assert parsed["b"].dtype == "float64"
+
+
+def test_parse_numeric_reports_cell_status():
+    df = pd.DataFrame({"a": ["1,200", " : ", None, "n/a", "[c]"]})
+
+    parsed, status = parse_numeric(df, ["a"], status=True)
+
+    assert status["a"].dtype == STATUS_DTYPE
+    assert status["a"].tolist() == ["value", "suppressed", "not available", "not available", "suppressed"]
+    assert parsed["a"].iloc[1:].isna().all()
+
+
+def test_clean_with_spec_keeps_counts_compact_with_status():
+    spec = SPECS["survival_2019"]
+    cleaned = clean_with_spec(pd.read_csv(PROJECT_ROOT / "data" / "raw" / spec.raw_file), spec)
+
+    counts = cleaned["Surviving After 5 Years – Count"]
+    status = cleaned[status_column("Surviving After 5 Years – Count")]
+    assert counts.dtype == "Int32"
+    assert cleaned["5-Year Survival Rate (2019 Cohort, %)"].dtype == "float32"
+    # Later cohorts have not reached five years: ONS suppresses those cells
+    assert (status == "suppressed").any()
+    assert counts[status != "value"].isna().all()
+    assert counts[status == "value"].notna().all()
+    assert set(spec.column_types()) == set(cleaned.columns)
+
+
+def test_to_counts_rejects_fractional_values():
+    assert to_counts(pd.Series([5.0, np.nan], name="n")).tolist() == [5, pd.NA]
+    with pytest.raises(ValueError, match="non-integer"):
+        to_counts(pd.Series([2.5], name="n"))
+
+
+def test_engine_matches_committed_processed_files():
+    for spec in SPECS.values():
+        raw = pd.read_csv(PROJECT_ROOT / "data" / "raw" / spec.raw_file)
+        expected = (PROJECT_ROOT / "data" / "processed" / spec.processed_file).read_text(
+            encoding="utf-8"
+        )
+
+        assert clean_with_spec(raw, spec).to_csv(index=False) == expected, spec.name
+
+
+def test_clean_dataset_rejects_unknown_name():
+    try:
+        clean_dataset(pd.DataFrame(), "births_1999")
+    except ValueError as exc:
+        assert "births_1999" in str(exc)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_is_metadata_row_flags_ons_title_rows_only():
+    first = pd.Series([
+        "Table 2.1d - Count Of Deaths Of New Enterprises For 2024",
+        "This worksheet contains one table",
+        "Units: Counts (control rounded to base 5)",
+        "2019",
+        "K02000001",
+        "North East",
+        None,
+    ])
+
+    assert is_metadata_row(first).tolist() == [True, True, True, True, False, False, False]
+
+
+def test_stream_clean_matches_whole_file_cleaning():
+    for spec in SPECS.values():
+        path = PROJECT_ROOT / "data" / "raw" / spec.raw_file
+        whole = clean_with_spec(pd.read_csv(path), spec)
+
+        streamed = pd.concat(list(stream_clean(path, spec, chunksize=50)))
+
+        pd.testing.assert_frame_equal(streamed, whole)
+
+
+def test_save_table_writes_chunks_with_single_header(tmp_path):
+    chunks = [pd.DataFrame({"a": [1.0, 2.0]}), pd.DataFrame({"a": [3.0]}, index=[2])]
+    out = tmp_path / "nested" / "out.csv"
+
+    save_table(iter(chunks), out)
+
+    assert out.read_text(encoding="utf-8").splitlines() == ["a", "1.0", "2.0", "3.0"]
+
+
+def test_streaming_a_table_without_data_rows_still_writes_its_header(tmp_path):
+    spec = SPECS["births_2019"]
+    raw = tmp_path / "raw.csv"
+    raw.write_text("Table 1.1a - Births,,\nThis worksheet contains one table,,\n,,\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+
+    save_table(stream_clean(raw, spec), out)
+
+    assert list(pd.read_csv(out).columns) == list(spec.column_types())
+
+
+def test_save_table_rejects_an_empty_iterable(tmp_path):
+    out = tmp_path / "out.csv"
+
+    with pytest.raises(ValueError, match="No chunks"):
+        save_table(iter([]), out)
+    assert not out.exists()
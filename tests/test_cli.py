@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import cli
+
+
+def _run(code: str) -> str:
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return proc.stdout
+
+
+def test_info_and_help_do_not_import_pandas_or_matplotlib():
+    out = _run(
+        "import sys, cli\n"
+        "cli.main(['info'])\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('pandas', 'numpy', 'matplotlib') if m in sys.modules))\n"
+    )
+
+    assert "births_2019" in out and "plot:births_bar_chart_2024" in out
+    assert out.strip().endswith("[]")
+
+
+def test_import_time_lists_top_level_imports():
+    proc = subprocess.run(
+        [sys.executable, str(SRC_DIR / "cli.py"), "--import-time", "info"], capture_output=True, text=True
+    )
+
+    assert proc.returncode == 0
+    assert "Datasets:" in proc.stdout
+    assert "pipeline" in proc.stdout.split("Imports")[1]
+
+
+def test_slowest_imports_keeps_top_level_modules():
+    report = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |   numpy.core\n"
+        "import time:       200 |        300 | numpy\n"
+        "import time:        50 |         50 | json\n"
+    )
+
+    assert cli.slowest_imports(report) == [("numpy", 200, 300), ("json", 50, 50)]
+
+
+def test_clean_rejects_unknown_datasets():
+    with pytest.raises(SystemExit, match="Unknown datasets: nope"):
+        cli.main(["clean", "nope"])
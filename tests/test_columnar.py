@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from cleaning_engine import SPECS, clean_with_spec, save_table, stream_clean
+from columnar import columnar_path, read_processed
+
+
+def test_save_table_writes_typed_parquet_copy(tmp_path):
+    spec = SPECS["survival_2022"]
+    clean = clean_with_spec(pd.read_csv(PROJECT_ROOT / "data" / "raw" / spec.raw_file), spec)
+    out = tmp_path / spec.processed_file
+
+    save_table(clean, out, spec.column_types())
+
+    typed = pd.read_parquet(columnar_path(out))
+    assert typed["Geography Code"].dtype == "category"
+    assert typed["Number of Business Births (2022)"].dtype == "Int32"
+    assert typed["1-Year Survival Rate (%)"].dtype == "float32"
+    assert len(typed) == len(clean)
+
+
+def test_streamed_chunks_share_one_parquet_schema(tmp_path):
+    spec = SPECS["births_2019"]
+    out = tmp_path / spec.processed_file
+
+    save_table(stream_clean(PROJECT_ROOT / "data" / "raw" / spec.raw_file, spec, 100), out, spec.column_types())
+
+    typed = pd.read_parquet(columnar_path(out))
+    assert len(typed) == len(pd.read_csv(out))
+    assert typed["Geography Name"].dtype == "category"
+
+
+def test_read_processed_loads_only_requested_columns(tmp_path):
+    out = tmp_path / "table.csv"
+    df = pd.DataFrame({"Region": ["North East", "London"], "Births": [10.0, 20.0], "Other": [1.0, 2.0]})
+    save_table(df, out, {"Region": "category", "Births": "Int32"})
+
+    loaded = read_processed(out, columns=["Region", "Births"])
+
+    assert list(loaded.columns) == ["Region", "Births"]
+    assert loaded["Births"].dtype == "Int32"
+
+    columnar_path(out).unlink()
+    assert list(read_processed(out, columns=["Births", "Region"]).columns) == ["Births", "Region"]
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from comparison import YearComparison, top_k_indices
+from panel import BirthsDeathsPanel
+
+
+def test_top_k_indices_matches_a_full_sort_and_puts_nan_last():
+    rng = np.random.default_rng(0)
+    values = rng.random((3, 1000))
+    values[0, :5] = np.nan
+
+    top = top_k_indices(values, 10)
+    bottom = top_k_indices(values, 10, largest=False)
+
+    assert (top == np.argsort(-values, axis=1)[:, :10]).all()
+    assert (bottom[1:] == np.argsort(values[1:], axis=1)[:, :10]).all()
+    assert top_k_indices(np.array([1.0, np.nan, 3.0]), 3).tolist() == [2, 0, 1]
+
+
+def _panel():
+    def table(values, col):
+        return pd.DataFrame({
+            "Geography Code": ["K02000001", "E06000001", "E06000002", "E06000003"],
+            "Geography Name": ["UK", "A", "B", "C"],
+            col: values,
+        })
+
+    tables = {
+        ("births", 2019): table([100, 10, 20, 30], "b19"),
+        ("births", 2024): table([110, 15, 10, 30], "b24"),
+        ("deaths", 2019): table([90, 5, 8, 0], "d19"),
+        ("deaths", 2024): table([80, 4, 9, 6], "d24"),
+    }
+    cols = {key: f"{key[0][0]}{str(key[1])[2:]}" for key in tables}
+    return BirthsDeathsPanel.from_tables(tables, cols)
+
+
+def test_comparison_computes_changes_for_every_metric_at_once():
+    comparison = YearComparison(_panel(), 2019, 2024, level="LA")
+
+    assert comparison.change.tolist() == [[5, -10, 0], [-1, 1, 6]]
+    assert comparison.pct_change[0].tolist() == [50.0, -50.0, 0.0]
+    assert np.isnan(comparison.pct_change[1, 2])
+    assert comparison.rank("change", "births").tolist() == [1, 3, 2]
+
+
+def test_leaderboards():
+    comparison = YearComparison(_panel(), 2019, 2024, level="LA")
+
+    top = comparison.top(2, by="total", metric="births")
+    bottom = comparison.bottom(1, by="change", metric="deaths")
+
+    assert top["Geography Name"].tolist() == ["C", "B"]
+    assert top[2024].tolist() == [30, 10]
+    assert bottom["Geography Code"].tolist() == ["E06000001"]
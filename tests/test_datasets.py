@@ -0,0 +1,104 @@
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import datasets
+from datasets import DatasetRegistry
+
+
+def _write(path: Path, rows: int = 100) -> Path:
+    pd.DataFrame({"Region": [f"R{i}" for i in range(rows)], "Births": range(rows)}).to_csv(path, index=False)
+    return path
+
+
+def test_each_file_is_parsed_once(tmp_path):
+    path = _write(tmp_path / "a.csv")
+    registry = DatasetRegistry()
+
+    full = registry.load(path)
+    births = registry.load(path, columns=["Births"])
+    small = registry.load(path, filters=[("Births", "<", 3)])
+
+    assert registry.stats.misses == 1 and registry.stats.hits == 2
+    assert len(full) == 100 and list(births.columns) == ["Births"]
+    assert small["Region"].tolist() == ["R0", "R1", "R2"]
+
+
+def test_returned_frames_do_not_share_writes(tmp_path):
+    path = _write(tmp_path / "a.csv")
+    registry = DatasetRegistry()
+
+    first = registry.load(path)
+    first.loc[0, "Births"] = -1
+    first["Extra"] = 1
+
+    again = registry.load(path)
+    assert again.loc[0, "Births"] == 0 and "Extra" not in again
+    assert registry.stats.misses == 1
+
+
+def test_rewritten_file_is_read_again(tmp_path):
+    path = _write(tmp_path / "a.csv")
+    registry = DatasetRegistry()
+    registry.load(path)
+
+    _write(path, rows=5)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert len(registry.load(path)) == 5
+    assert registry.stats.misses == 2 and len(registry) == 1
+
+
+def test_least_recently_used_tables_are_evicted_under_budget(tmp_path):
+    paths = [_write(tmp_path / f"{name}.csv", rows=2000) for name in "abc"]
+    one_table = DatasetRegistry().load(paths[0]).memory_usage(index=True, deep=True).sum()
+    registry = DatasetRegistry(budget_mb=2.5 * one_table / 2**20)
+
+    registry.load(paths[0])
+    registry.load(paths[1])
+    registry.load(paths[0])  # a is now more recent than b
+    registry.load(paths[2])
+
+    assert paths[0] in registry and paths[2] in registry
+    assert paths[1] not in registry
+    assert registry.stats.evictions == 1
+    assert registry.nbytes <= registry.budget
+
+
+def test_table_larger_than_budget_is_not_kept(tmp_path):
+    path = _write(tmp_path / "a.csv")
+    registry = DatasetRegistry(budget_mb=0.0001)
+
+    assert len(registry.load(path)) == 100
+    assert len(registry) == 0 and registry.nbytes == 0
+
+
+def test_first_load_pushes_projection_and_filters_into_the_read(tmp_path, monkeypatch):
+    path = _write(tmp_path / "a.csv")
+    registry = DatasetRegistry()
+    reads = []
+    real = datasets.read_processed
+    monkeypatch.setattr(datasets, "read_processed", lambda *a: reads.append(a[1:]) or real(*a))
+
+    low = registry.load(path, columns=["Births"], filters=[("Region", "in", ["R1", "R2", "R50"])])
+    again = registry.load(path, columns=["Births"], filters=[("Region", "in", ["R1", "R2", "R50"])])
+    births = registry.load(path, columns=["Births"])
+    few = registry.load(path, columns=["Births"], filters=[("Births", "<", 3)])
+    regions = registry.load(path, columns=["Region"])
+
+    assert reads == [
+        (["Births"], [("Region", "in", ("R1", "R2", "R50"))]),
+        (["Births"], None),
+        (["Region"], None),
+    ]
+    assert low["Births"].tolist() == again["Births"].tolist() == [1, 2, 50]
+    assert len(births) == 100 and few["Births"].tolist() == [0, 1, 2]
+    assert list(regions.columns) == ["Region"]
+    assert registry.stats.misses == 3 and registry.stats.hits == 2
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from derived_rates import MEASURES, DerivedRates, derive_rates, read_active_counts
+from panel import BirthsDeathsPanel
+
+
+@pytest.fixture(scope="module")
+def panel():
+    return BirthsDeathsPanel.from_processed()
+
+
+def test_read_active_counts_reads_table_1():
+    active = read_active_counts()
+
+    assert active["Year"].tolist() == list(range(2019, 2025))
+    assert active.set_index("Year").loc[2019, "Active"] == 2_889_000
+
+
+def test_uk_rates_match_published_table_1(panel):
+    rates = DerivedRates(panel, read_active_counts())
+    published = pd.read_csv(PROJECT_ROOT / "data" / "processed" / "business_birth_death_rates_clean.csv")
+    published = published.set_index("Year")
+
+    uk = rates.table(level="UK").set_index("Year")
+    for year in panel.years:
+        # Table 1 divides counts rounded to thousands, so allow rounding error
+        assert uk.loc[year, "birth_rate"] == pytest.approx(published.loc[year, "Birth Rate (%)"], abs=0.06)
+        assert uk.loc[year, "death_rate"] == pytest.approx(published.loc[year, "Death Rate (%)"], abs=0.06)
+    assert (uk["churn_rate"] == uk["birth_rate"] + uk["death_rate"]).all()
+
+
+def test_local_authority_rates_from_joined_active_counts(panel):
+    codes = list(panel.codes("LA")[:3])
+    active = pd.DataFrame({
+        "Geography Code": codes + ["E06999999"],
+        "Year": [2024, 2024, 2019, 2024],
+        "Active": [1000.0, 0.0, 2000.0, 5.0],
+    })
+
+    rates = DerivedRates(panel, active)
+    birth_rate = rates.frame("birth_rate", level="LA")
+    births = panel.frame("births", level="LA")
+
+    assert birth_rate.loc[codes[0], 2024] == pytest.approx(100 * births.loc[codes[0], 2024] / 1000)
+    assert np.isnan(birth_rate.loc[codes[1], 2024])  # zero active
+    assert birth_rate.loc[codes[2], 2019] == pytest.approx(100 * births.loc[codes[2], 2019] / 2000)
+    assert birth_rate.notna().sum().sum() == 2
+    # Net formation needs no active count
+    net = rates.frame("net_formation", level="LA")
+    deaths = panel.frame("deaths", level="LA")
+    pd.testing.assert_frame_equal(net, (births - deaths).astype(np.float64))
+
+
+def test_derive_rates_broadcasts_one_active_over_geographies():
+    births = np.array([[10.0, 20.0], [30.0, 40.0]])
+    deaths = np.array([[5.0, 5.0], [10.0, 50.0]])
+
+    values = derive_rates(births, deaths, np.array([100.0, 200.0]))
+
+    assert values.shape == (len(MEASURES), 2, 2)
+    np.testing.assert_allclose(values[MEASURES.index("birth_rate")], [[10, 10], [30, 20]])
+    np.testing.assert_allclose(values[MEASURES.index("net_formation_rate")], [[5, 7.5], [20, -5]])
+    np.testing.assert_allclose(values[MEASURES.index("churn_rate")], [[15, 12.5], [40, 45]])
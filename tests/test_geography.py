@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from geography import GeographyIndex, code_level
+
+
+def _table(codes, values, col):
+    return pd.DataFrame({"Geography Code": codes, "Geography Name": codes, col: values})
+
+
+def test_levels_come_from_code_prefixes():
+    assert code_level("K02000001") == "UK"
+    assert code_level("K04000001 ") == "E&W"
+    assert code_level("W92000004") == "country"
+    assert code_level("E12000007") == "region"
+    assert code_level("E09000001") == "LA"
+    assert code_level("X99") is None
+
+
+def test_select_and_subnational_mask():
+    codes = ["K02000001", "E92000001", "W92000004", "E12000001", "E06000047"]
+    df = _table(codes, range(5), "v")
+    geo = GeographyIndex.from_frames(df)
+
+    assert geo.select(df, "region")["Geography Code"].tolist() == ["E12000001"]
+    assert geo.subnational_mask(df["Geography Code"]).tolist() == [False, False, True, True, True]
+    assert geo.level_of("E06000047") == "LA"
+
+
+def test_join_matches_on_code_not_name_and_handles_categoricals():
+    a = _table(["E06000047", "E06000005", "E06000001"], [1, 2, 3], "2019")
+    b = _table(["E06000001 ", "E06000047"], [30, 10], "2024")
+    b["Geography Name"] = ["renamed", "renamed too"]
+    b["Geography Code"] = b["Geography Code"].astype("category")
+    geo = GeographyIndex.from_frames(a, b)
+
+    inner = geo.join(a, b)
+    assert inner["Geography Code"].tolist() == ["E06000047", "E06000001"]
+    assert inner["2024"].tolist() == [10, 30]
+    assert inner["Geography Name"].tolist() == ["E06000047", "E06000001"]
+
+    left = geo.join(a, b, how="left")
+    assert np.isnan(left["2024"].iloc[1])
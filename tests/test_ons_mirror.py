@@ -0,0 +1,126 @@
+import hashlib
+import sys
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from clean_uk_business_births_2019 import clean_births_2019, load_births_2019
+from ons_mirror import SOURCES, load_state, refresh
+
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+
+
+class _Mirror(BaseHTTPRequestHandler):
+    """Serves files from server.files with ETag / Last-Modified validation."""
+
+    def do_GET(self):
+        name = self.path.lstrip("/")
+        body = self.server.files.get(name)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.server.downloads.append(name)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(0, usegmt=True))
+        if name in self.server.truncated:
+            # Announce one chunk of the whole body, send half of it, then hang up
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"%x\r\n" % len(body) + body[:len(body) // 2])
+            self.close_connection = True
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mirror():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Mirror)
+    server.files = {name: (RAW_DIR / name).read_bytes() for name in SOURCES}
+    server.downloads = []
+    server.truncated = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def test_refresh_downloads_every_source_then_only_changes(mirror, tmp_path):
+    first = refresh(_url(mirror), raw_dir=tmp_path, jobs=4)
+
+    assert {r.status for r in first} == {"downloaded"}
+    assert sorted(mirror.downloads) == sorted(SOURCES)
+    for name in SOURCES:
+        assert (tmp_path / name).read_bytes() == mirror.files[name]
+    assert set(load_state(tmp_path)) == set(SOURCES)
+
+    mirror.downloads.clear()
+    mirror.files["uk_business_births.csv"] += b"\n"
+    second = {r.name: r.status for r in refresh(_url(mirror), raw_dir=tmp_path)}
+
+    assert mirror.downloads == ["uk_business_births.csv"]
+    assert second["uk_business_births.csv"] == "downloaded"
+    assert second["uk_business_deaths.csv"] == "not modified"
+
+
+def test_refreshed_file_feeds_the_loaders(mirror, tmp_path):
+    (result,) = refresh(_url(mirror), ["uk_business_births.csv"], raw_dir=tmp_path)
+
+    cleaned = clean_births_2019(load_births_2019(result.path))
+
+    assert cleaned.equals(clean_births_2019(load_births_2019(RAW_DIR / "uk_business_births.csv")))
+
+
+def test_failed_download_keeps_existing_file(mirror, tmp_path):
+    (tmp_path / "uk_business_births.csv").write_text("old", encoding="utf-8")
+    del mirror.files["uk_business_births.csv"]
+
+    (result,) = refresh(_url(mirror), ["uk_business_births.csv"], raw_dir=tmp_path)
+
+    assert result.status == "failed" and "404" in result.error
+    assert (tmp_path / "uk_business_births.csv").read_text(encoding="utf-8") == "old"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_missing_local_file_is_downloaded_despite_stored_validators(mirror, tmp_path):
+    refresh(_url(mirror), ["uk_business_deaths.csv"], raw_dir=tmp_path)
+    (tmp_path / "uk_business_deaths.csv").unlink()
+
+    (result,) = refresh(_url(mirror), ["uk_business_deaths.csv"], raw_dir=tmp_path)
+
+    assert result.status == "downloaded"
+    assert (tmp_path / "uk_business_deaths.csv").exists()
+
+
+def test_truncated_response_fails_only_its_own_file(mirror, tmp_path):
+    mirror.truncated.add("uk_business_births.csv")
+
+    results = {r.name: r for r in refresh(_url(mirror), raw_dir=tmp_path, jobs=4)}
+
+    assert set(results) == set(SOURCES)
+    assert results["uk_business_births.csv"].status == "failed"
+    assert not (tmp_path / "uk_business_births.csv").exists()
+    assert {r.status for name, r in results.items() if name != "uk_business_births.csv"} == {"downloaded"}
+    assert "uk_business_births.csv" not in load_state(tmp_path)
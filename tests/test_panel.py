@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from panel import BirthsDeathsPanel
+
+
+def _panel():
+    def table(codes, values, col):
+        return pd.DataFrame({"Geography Code": codes, "Geography Name": codes, col: values})
+
+    tables = {
+        ("births", 2019): table(["E06000001", "K02000001", "E12000001"], [10, 100, 40], "b19"),
+        ("births", 2024): table(["K02000001", "E06000001"], [90, 12], "b24"),
+        ("deaths", 2019): table(["E06000001", "E12000001"], [5, 20], "d19"),
+    }
+    cols = {("births", 2019): "b19", ("births", 2024): "b24", ("deaths", 2019): "d19"}
+    return BirthsDeathsPanel.from_tables(tables, cols)
+
+
+def test_geographies_are_grouped_by_level_and_missing_cells_are_nan():
+    panel = _panel()
+
+    assert list(panel.codes()) == ["K02000001", "E12000001", "E06000001"]
+    assert panel.get("births", [2019, 2024], level="LA").tolist() == [[10, 12]]
+    assert np.isnan(panel.get("deaths", [2024])).all()
+
+
+def test_get_returns_views_for_level_and_year_runs():
+    panel = _panel()
+
+    view = panel.get("births", years=[2019, 2024], level="region")
+
+    assert np.shares_memory(view, panel.values)
+    assert view[0, 0] == 40 and np.isnan(view[0, 1])
+    assert panel.get("births", years=[]).shape == (3, 0)
+    assert panel.frame("deaths", years=[], level="LA").shape == (1, 0)
+
+
+def test_saved_panel_loads_memory_mapped(tmp_path):
+    _panel().save(tmp_path / "panel")
+
+    loaded = BirthsDeathsPanel.load(tmp_path / "panel")
+
+    assert isinstance(loaded.values, np.memmap)
+    assert loaded.frame("births", level="UK").loc["K02000001"].tolist() == [100, 90]
+
+
+def test_panel_from_processed_tables():
+    panel = BirthsDeathsPanel.from_processed()
+
+    assert panel.metrics == ("births", "deaths")
+    assert panel.years.tolist() == [2019, 2024]
+    assert panel.frame("deaths", [2019], level="UK").iloc[0, 0] == 303495
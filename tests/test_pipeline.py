@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from build_cache import code_closure
+from pipeline import Stage, build_stages, dependencies, downstream, run_pipeline
+
+
+def test_catalogue_links_plots_to_their_cleaners():
+    deps = dependencies(build_stages())
+
+    assert deps["births_2019"] == set()
+    assert deps["plot:births_vs_survival_bar"] == {"survival_2019"}
+    assert deps["plot:deaths_bar_2019_vs_2024"] == {"deaths_2019", "deaths_2024"}
+
+
+def test_downstream_of_a_raw_change_is_its_cleaner_and_charts():
+    stale = downstream(build_stages(), {"deaths_2024"})
+
+    assert stale == {
+        "deaths_2024",
+        "plot:deaths_bar_2019_vs_2024",
+        "plot:births_bar_chart_2024",
+    }
+
+
+def _copy_script(path, src, dst):
+    path.write_text(
+        "from pathlib import Path\n"
+        f"Path({str(dst)!r}).write_text(Path({str(src)!r}).read_text() + '!')\n"
+    )
+    return path
+
+
+def test_run_pipeline_rebuilds_only_changed_branch(tmp_path):
+    raw_a, raw_b = tmp_path / "a.txt", tmp_path / "b.txt"
+    mid_a, mid_b, chart = tmp_path / "a.out", tmp_path / "b.out", tmp_path / "chart.out"
+    raw_a.write_text("a")
+    raw_b.write_text("b")
+
+    def stage(name, kind, src, dst):
+        script = _copy_script(tmp_path / f"{name}.py", src, dst)
+        return Stage(name, kind, script, (src,), dst, (script,))
+
+    stages = {
+        "a": stage("a", "clean", raw_a, mid_a),
+        "b": stage("b", "clean", raw_b, mid_b),
+        "chart": stage("chart", "plot", mid_a, chart),
+    }
+    manifest = tmp_path / "manifest.json"
+
+    first = run_pipeline(stages, jobs=2, manifest_path=manifest)
+    assert {name: status for name, (status, _) in first.items()} == {
+        "a": "built", "b": "built", "chart": "built"
+    }
+    assert chart.read_text() == "a!!"
+
+    raw_a.write_text("A")
+    second = run_pipeline(stages, jobs=2, manifest_path=manifest)
+    assert {name: status for name, (status, _) in second.items()} == {
+        "a": "built", "b": "skipped", "chart": "built"
+    }
+    assert chart.read_text() == "A!!"
+
+
+def test_stage_code_covers_every_imported_project_module():
+    stages = build_stages()
+    code = {name: {p.name for p in stage.code} for name, stage in stages.items()}
+
+    assert {"validation.py", "profiling.py", "columnar.py", "specs.py"} <= code["births_2019"]
+    assert "validation.py" in code["birth_death_rates"]
+    assert {"render.py", "query.py", "datasets.py"} <= code["plot:births_vs_survival_bar"]
+    assert {"comparison.py", "panel.py", "geography.py"} <= code["plot:births_bar_chart_2024"]
+    # Cleaner scripts record their runs under the same code key as the pipeline
+    assert list(stages["births_2019"].code) == code_closure(stages["births_2019"].script)
+
+
+def test_run_pipeline_on_a_subset_never_waits_for_missing_stages(tmp_path):
+    raw, out = tmp_path / "raw.txt", tmp_path / "out.txt"
+    raw.write_text("x")
+    script = _copy_script(tmp_path / "copy.py", raw, out)
+    stages = {
+        "copy": Stage("copy", "plot", script, (raw,), out, (script,), after=("not-in-this-run",)),
+        "loop_a": Stage("loop_a", "plot", script, (raw,), tmp_path / "a.out", (script,), after=("loop_b",)),
+        "loop_b": Stage("loop_b", "plot", script, (raw,), tmp_path / "b.out", (script,), after=("loop_a",)),
+    }
+
+    results = run_pipeline(stages, jobs=1, manifest_path=tmp_path / "manifest.json")
+
+    assert {name: status for name, (status, _) in results.items()} == {
+        "copy": "built", "loop_a": "blocked", "loop_b": "blocked"
+    }
+    assert out.read_text() == "x!"
+
+
+def test_stages_sharing_an_output_are_fresh_on_a_second_run(tmp_path):
+    raw, chart = tmp_path / "raw.txt", tmp_path / "chart.out"
+    raw.write_text("x")
+    first = _copy_script(tmp_path / "first.py", raw, chart)
+    second = _copy_script(tmp_path / "second.py", raw, chart)
+    stages = {
+        "first": Stage("first", "plot", first, (raw,), chart, (first,)),
+        "second": Stage("second", "plot", second, (raw,), chart, (second,), after=("first",)),
+    }
+    manifest = tmp_path / "manifest.json"
+
+    run_pipeline(stages, jobs=1, manifest_path=manifest)
+    again = run_pipeline(stages, jobs=1, manifest_path=manifest)
+    assert {name: status for name, (status, _) in again.items()} == {"first": "skipped", "second": "skipped"}
+
+    chart.write_text("overwritten")
+    third = run_pipeline(stages, jobs=1, manifest_path=manifest)
+    assert {name: status for name, (status, _) in third.items()} == {"first": "skipped", "second": "built"}
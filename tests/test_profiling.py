@@ -0,0 +1,74 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import profiling
+from clean_uk_business_births_2024 import clean_births_2024, load_births_2024, save_births_2024
+from profiling import enabled, profiled, stage, summarize, tracing
+
+RAW = PROJECT_ROOT / "data" / "raw" / "uk_business_births_2024.csv"
+
+
+def test_hooks_do_nothing_when_tracing_is_off():
+    assert not enabled()
+    with stage("anything", 10) as s:
+        s.rows_out = 5
+
+    assert profiled(lambda x: x + 1)(1) == 2
+    assert profiling._active is None
+
+
+def test_trace_accounts_for_rows_at_every_stage(tmp_path):
+    trace_path = tmp_path / "trace.json"
+
+    with tracing(trace_path, memory=False):
+        raw = load_births_2024(RAW)
+        cleaned = clean_births_2024(raw)
+        save_births_2024(cleaned, tmp_path / "out.csv")
+
+    stages = {r["stage"]: r for r in json.loads(trace_path.read_text(encoding="utf-8"))["stages"]}
+    assert list(stages)[:2] == ["load_births_2024", "clean_births_2024"]
+    assert stages["load_births_2024"]["rows_out"] == len(raw)
+    assert stages["clean_births_2024"]["rows_in"] == len(raw)
+    assert stages["clean_births_2024"]["rows_out"] == len(cleaned)
+    assert "save_births_2024/write csv" in stages
+
+    # The steps inside clean_* account for every row it dropped
+    steps = [r for name, r in stages.items() if name.startswith("clean_births_2024/") and r["depth"] == 1]
+    assert sum(r["rows_in"] - r["rows_out"] for r in steps) == len(raw) - len(cleaned)
+    assert stages["clean_births_2024/drop empty rows"]["rows_out"] < len(raw)
+
+
+def test_nested_stage_peaks_are_reported_by_their_caller():
+    with tracing(memory=True) as tracer:
+        with stage("outer"):
+            with stage("inner"):
+                block = np.ones(2**20)  # 8 MiB
+                del block
+
+    records = {r["stage"]: r for r in tracer.records}
+    assert records["outer/inner"]["peak_mb"] >= 7.9
+    assert records["outer"]["peak_mb"] >= records["outer/inner"]["peak_mb"]
+    assert abs(records["outer"]["alloc_mb"]) < 1
+
+
+def test_summarize_totals_repeated_stages():
+    records = [
+        {"stage": "clean", "seconds": 0.5, "rows_in": 10, "rows_out": 8},
+        {"stage": "clean", "seconds": 0.25, "rows_in": 5, "rows_out": 5},
+        {"stage": "load", "seconds": 0.1, "rows_in": None, "rows_out": 15},
+    ]
+
+    summary = summarize(records).set_index("stage")
+
+    assert summary.loc["clean", "calls"] == 2
+    assert summary.loc["clean", "seconds"] == 0.75
+    assert summary.loc["clean", "rows_dropped"] == 2
+    assert pd.isna(summary.loc["load", "rows_dropped"])
@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import datasets
+import query
+from cleaning_engine import save_table
+from query import collect_all, scan
+
+
+def _table(tmp_path, name="regions.csv"):
+    path = tmp_path / name
+    df = pd.DataFrame({
+        "Region": ["North East", "London", "Total", "London", "East"],
+        "Births": [10, 80, 200, 70, 30],
+        "Rate": [94.1, 93.2, None, 92.0, 95.0],
+        "Unused": [1, 2, 3, 4, 5],
+    })
+    save_table(df, path, {"Region": "category", "Births": "Int32", "Rate": "float32"})
+    return path
+
+
+def test_projection_and_filters_are_pushed_into_the_scan(tmp_path):
+    q = (
+        scan(_table(tmp_path))
+        .select("Region", "Births")
+        .filter("Region", "!=", "Total")
+        .distinct("Region")
+        .filter("Births", ">", 20)
+        .top_k(2, by="Births")
+    )
+
+    plan, rest = q._plan(None)
+
+    assert plan.columns == ("Region", "Births")
+    assert plan.filters == (("Region", "!=", "Total"),)
+    assert not any(isinstance(op, query.Filter) and op.column == "Region" for op in rest)
+    result = q.collect()
+    assert result["Region"].astype(str).tolist() == ["London", "East"]
+    assert result["Births"].tolist() == [80, 30]
+
+
+def test_bare_dropna_keeps_every_column_it_sees(tmp_path):
+    path = _table(tmp_path)
+
+    plan, _ = scan(path).dropna().select("Region")._plan(None)
+    assert plan.columns is None
+    assert scan(path).dropna().select("Region").collect()["Region"].astype(str).tolist() == [
+        "North East", "London", "London", "East"
+    ]
+
+
+def test_collect_all_reads_each_table_once(tmp_path, monkeypatch):
+    path = _table(tmp_path)
+    reads = []
+    real = datasets.read_processed
+    monkeypatch.setattr(datasets, "read_processed", lambda *a, **k: reads.append(a) or real(*a, **k))
+
+    top, london = collect_all([
+        scan(path).select("Region", "Births").top_k(1, by="Births"),
+        scan(path).filter("Region", "in", ["London"]).select("Rate"),
+    ])
+
+    assert len(reads) == 1
+    assert top["Births"].tolist() == [200]
+    assert london["Rate"].tolist() == pytest.approx([93.2, 92.0])
+
+
+def test_scan_reads_only_the_pushed_columns_and_rows(tmp_path, monkeypatch):
+    path = _table(tmp_path)
+    reads = []
+    real = datasets.read_processed
+    monkeypatch.setattr(datasets, "read_processed", lambda *a: reads.append((a[1:], real(*a))) or reads[-1][1])
+
+    result = scan(path).filter("Region", "in", ["London", "East"]).select("Births").collect()
+
+    (columns, filters), frame = reads[0]
+    assert len(reads) == 1
+    assert columns == ["Region", "Births"] and filters == [("Region", "in", ("London", "East"))]
+    # The Parquet reader applied the filter: only the matching rows were read
+    assert len(frame) == 3
+    assert result["Births"].tolist() == [80, 70, 30]
+
+
+def test_join_and_csv_fallback_give_the_same_rows(tmp_path):
+    path = _table(tmp_path)
+    q = scan(path).filter("Region", "==", "London").join(
+        scan(path).select("Region", "Unused").distinct("Region"), on="Region"
+    )
+
+    with_parquet = q.collect()
+    (tmp_path / "regions.parquet").unlink()
+    with_csv = q.collect()
+
+    # Left rows keep their own Unused; the right side's arrives suffixed
+    assert with_parquet["Unused"].tolist() == with_csv["Unused"].tolist() == [2, 4]
+    assert with_parquet["Unused_right"].tolist() == with_csv["Unused_right"].tolist() == [2, 2]
+
+
+def test_where_runs_in_memory_and_ignores_case(tmp_path):
+    path = tmp_path / "regions.csv"
+    df = pd.DataFrame({"Region": ["North East", "TOTAL", "London", "total"], "Births": [10, 500, 80, 500]})
+    save_table(df, path, {"Region": "category", "Births": "Int32"})
+
+    q = scan(path).where("Region", lambda regions: regions.str.lower() != "total").top_k(1, by="Births")
+    plan, rest = q._plan(None)
+
+    assert plan.filters == () and isinstance(rest[0], query.Where)
+    assert q.collect()["Region"].astype(str).tolist() == ["London"]
+
+
+def test_columns_come_from_the_parquet_copy_only_while_it_is_current(tmp_path):
+    path = _table(tmp_path)
+    pd.DataFrame({"Region": ["London"], "Deaths": [3]}).to_csv(path, index=False)
+
+    assert query.table_columns(path) == ["Region", "Deaths"]
+    assert scan(path).select("Deaths").collect()["Deaths"].tolist() == [3]
@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from panel import BirthsDeathsPanel
+from releases import ReleaseStore
+from synthetic_ons import generate
+
+
+def _store(tmp_path, years):
+    generate(tmp_path / "raw", n_local=60, years=years, seed=5)
+    return ReleaseStore(tmp_path / "releases")
+
+
+def test_append_release_updates_only_neighbouring_aggregates(tmp_path):
+    store = _store(tmp_path, [2021, 2022, 2023])
+    for year in (2021, 2023):
+        store.append_release("births", year, tmp_path / "raw" / f"uk_business_births_{year}.csv")
+    before = store.aggregates().set_index("year")
+
+    store.append_release("births", 2022, tmp_path / "raw" / "uk_business_births_2022.csv")
+    after = store.aggregates().set_index("year")
+
+    assert store.years("births") == [2021, 2022, 2023]
+    assert after.loc[2021].equals(before.loc[2021])
+    assert after.loc[2023, "uk_total"] == before.loc[2023, "uk_total"]
+    assert after.loc[2023, "change"] == after.loc[2023, "uk_total"] - after.loc[2022, "uk_total"]
+    assert np.isnan(after.loc[2021, "change"])
+
+
+def test_validation_rejects_duplicates_and_truncated_releases(tmp_path):
+    store = _store(tmp_path, [2022, 2023])
+    raw = tmp_path / "raw"
+    store.append_release("deaths", 2022, raw / "uk_business_deaths_2022.csv")
+
+    with pytest.raises(ValueError, match="already stored"):
+        store.append_release("deaths", 2022, raw / "uk_business_deaths_2022.csv")
+
+    lines = (raw / "uk_business_deaths_2023.csv").read_text(encoding="utf-8-sig").splitlines()
+    (raw / "short.csv").write_text("\n".join(lines[:20]) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="covers only"):
+        store.append_release("deaths", 2023, raw / "short.csv")
+    assert store.years("deaths") == [2022]
+
+
+def test_failed_append_stores_nothing_and_can_be_retried(tmp_path, monkeypatch):
+    store = _store(tmp_path, [2022, 2023])
+    raw = tmp_path / "raw"
+    store.append_release("births", 2022, raw / "uk_business_births_2022.csv")
+    before = store.aggregates()
+
+    to_csv = pd.DataFrame.to_csv
+
+    def full_disk_for_aggregates(frame, path, **kwargs):
+        if Path(path).name.startswith("aggregates"):
+            raise OSError("disk full")
+        return to_csv(frame, path, **kwargs)
+
+    # Fails after the partition has been staged
+    monkeypatch.setattr(pd.DataFrame, "to_csv", full_disk_for_aggregates)
+    with pytest.raises(OSError, match="disk full"):
+        store.append_release("births", 2023, raw / "uk_business_births_2023.csv")
+    monkeypatch.undo()
+
+    assert store.years("births") == [2022]
+    assert store.aggregates().equals(before)
+    assert sorted(p.name for p in (store.root / "births").iterdir()) == ["2022.csv", "2022.parquet"]
+
+    store.append_release("births", 2023, raw / "uk_business_births_2023.csv")
+    assert store.years("births") == [2022, 2023]
+    assert store.aggregates()["year"].tolist() == [2022, 2023]
+
+
+def test_panel_reads_every_stored_year(tmp_path):
+    store = _store(tmp_path, [2023, 2024])
+    for metric in ("births", "deaths"):
+        for year in (2023, 2024):
+            store.append_release(metric, year, tmp_path / "raw" / f"uk_business_{metric}_{year}.csv")
+
+    panel = BirthsDeathsPanel.from_releases(store)
+
+    assert panel.years.tolist() == [2023, 2024]
+    assert panel.frame("births", level="UK").shape == (1, 2)
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+from matplotlib.figure import Figure
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import render
+from render import TIERS, chart_scripts, render_chart
+
+
+def test_every_chart_builds_a_figure_without_pyplot():
+    for script in chart_scripts():
+        chart = render._load_chart(script)
+
+        assert chart["OUTPUT"].endswith(".png"), script.name
+        assert isinstance(chart["build_figure"](), Figure), script.name
+    assert "matplotlib.pyplot" not in sys.modules
+
+
+def test_preview_tier_renders_per_script_at_low_dpi(tmp_path, monkeypatch):
+    monkeypatch.setattr(render, "PREVIEW_DIR", tmp_path / "preview")
+    script = tmp_path / "tiny.py"
+    script.write_text(
+        "from matplotlib.figure import Figure\n"
+        "OUTPUT = 'tiny.png'\n"
+        "def build_figure():\n"
+        "    fig = Figure(figsize=(2, 1))\n"
+        "    fig.subplots().plot([0, 1])\n"
+        "    return fig\n"
+    )
+
+    path, build_s, save_s = render_chart(script, "preview")
+
+    assert path == tmp_path / "preview" / "tiny.png"
+    assert build_s >= 0 and save_s >= 0
+    # PNG width in pixels is figure width x dpi
+    assert int.from_bytes(path.read_bytes()[16:20], "big") == 2 * TIERS["preview"]
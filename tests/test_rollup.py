@@ -0,0 +1,94 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from cleaning_engine import SPECS, clean_with_spec
+from panel import BirthsDeathsPanel
+from rollup import Hierarchy, parent_codes, reconcile, reconcile_panel
+from synthetic_ons import synthetic_geographies, write_counts_table
+
+
+@pytest.fixture(scope="module")
+def panel():
+    return BirthsDeathsPanel.from_processed()
+
+
+@pytest.fixture(scope="module")
+def hierarchy():
+    return Hierarchy.from_processed()
+
+
+def test_parent_codes_follow_row_order():
+    codes = [
+        "K02000001", "E92000001", "E12000001", "E06000001",
+        "E10000002", "E07000001", "E07000002", "E12000002",
+        "E07000003", "E13000001", "E09000001", "W92000004", "W06000001",
+    ]
+
+    parents = dict(zip(codes, parent_codes(codes)))
+
+    assert parents["K02000001"] is None
+    assert parents["E92000001"] is None  # no E&W / GB row in this table
+    assert parents["E06000001"] == "E12000001"
+    assert parents["E07000002"] == "E10000002"
+    # A new region closes the county, so its districts sit in the region
+    assert parents["E07000003"] == "E12000002"
+    assert parents["E09000001"] == "E13000001"
+    assert parents["E13000001"] == "E12000002"
+    assert parents["W06000001"] == "W92000004"
+
+
+def test_published_tables_reconcile(panel, hierarchy):
+    report = reconcile_panel(panel, hierarchy)
+
+    assert len(report) > 0 and report["ok"].all()
+    assert set(report["metric"]) == set(panel.metrics)
+    assert (report["difference"] == 0).all()
+
+
+def test_changed_local_value_flags_only_its_region(panel, hierarchy):
+    tampered = BirthsDeathsPanel(
+        panel.values.copy(), panel.metrics, panel.geo.codes, panel.geo.names, panel.years
+    )
+    la = hierarchy.geo.encode(["E06000001"])[0]
+    region = hierarchy.parent[la]
+    tampered.values[tampered.metrics.index("births"), panel.geo.encode(["E06000001"])[0], -1] += 100
+
+    report = reconcile_panel(tampered, hierarchy)
+    failures = report[~report["ok"]]
+
+    assert failures["Geography Code"].tolist() == [hierarchy.geo.codes[region]]
+    assert failures["difference"].iloc[0] == -100
+    assert failures["year"].iloc[0] == panel.years[-1]
+
+
+def test_roll_up_rebuilds_the_uk_total(panel, hierarchy):
+    ids = panel.geo.encode(hierarchy.geo.codes)
+    values = np.moveaxis(panel.values, 1, 0)[ids]
+
+    rolled = hierarchy.roll_up(values)
+
+    uk = hierarchy.geo.encode(["K02000001"])[0]
+    np.testing.assert_array_equal(rolled[uk], values[uk])
+    leaves = hierarchy.n_children == 0
+    np.testing.assert_array_equal(rolled[leaves], values[leaves])
+
+
+def test_synthetic_table_reconciles(tmp_path):
+    path = tmp_path / "births.csv"
+    write_counts_table(path, "births", 2030, synthetic_geographies(60), np.random.default_rng(1), suppress=0.0)
+    clean = clean_with_spec(pd.read_csv(path), SPECS["births_2019"])
+
+    hierarchy = Hierarchy.from_tables(clean)
+    values = clean.set_index("Geography Code").loc[list(hierarchy.geo.codes), "Number of Business Births (2019)"]
+    report = reconcile(hierarchy, values.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    assert report["ok"].all()
+    assert len(report) == int((hierarchy.n_children > 0).sum())
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from survival import SurvivalMatrix, read_survival_table
+
+
+def test_regional_table_keeps_every_cohort_and_horizon():
+    table = read_survival_table(PROJECT_ROOT / "data" / "raw" / "business_survival_rates.csv")
+
+    assert sorted(table["cohort"].unique()) == [2019, 2020, 2021, 2022, 2023]
+    north_east = table[(table["cohort"] == 2019) & (table["code"] == "E12000001")].iloc[0]
+    assert north_east["births"] == 9445
+    assert north_east["survived_5"] == 3675
+    assert np.isnan(table[table["cohort"] == 2023]["survived_2"]).all()
+
+
+def test_measures_are_consistent_and_masked_beyond_observed_horizons():
+    table = pd.DataFrame({
+        "cohort": [2020, 2021],
+        "code": ["E12000007", "E12000007"],
+        "name": ["London", "London"],
+        "births": [100.0, 200.0],
+        "survived_1": [90.0, 180.0],
+        "survived_2": [72.0, np.nan],
+    })
+    matrix = SurvivalMatrix.from_tables([table])
+
+    cumulative = matrix.cumulative_survival()
+    conditional = matrix.conditional_survival()
+    hazard = matrix.hazard()
+
+    assert cumulative.shape == (2, 2, 1)
+    assert np.allclose(cumulative[0, :, 0], [0.9, 0.72])
+    assert np.isclose(conditional[0, 1, 0], 0.8)
+    assert np.isclose(hazard[0, 1, 0], 0.2)
+    assert np.allclose(np.cumprod(conditional, axis=1)[0], cumulative[0])
+    assert hazard.mask[1, 1, 0]
+
+
+def test_earlier_table_wins_where_tables_overlap():
+    def table(births):
+        return pd.DataFrame({"cohort": [2022], "code": ["E12000001"], "name": ["North East"],
+                             "births": [births], "survived_1": [births / 2]})
+
+    matrix = SurvivalMatrix.from_tables([table(10.0), table(20.0)])
+
+    assert matrix.births[0, 0] == 10.0
+
+    repeated = pd.concat([table(10.0), table(20.0)], ignore_index=True)
+    matrix = SurvivalMatrix.from_tables([repeated])
+
+    assert matrix.births[0, 0] == 10.0
+    assert matrix.survivors[0, 0, 0] == 5.0
+
+
+def test_matrix_from_raw_tables():
+    matrix = SurvivalMatrix.from_raw()
+
+    assert matrix.cohorts.tolist() == [2019, 2020, 2021, 2022, 2023]
+    assert matrix.horizons.tolist() == [1, 2, 3, 4, 5]
+    frame = matrix.frame("cumulative", 2022)
+    assert round(frame.loc["K02000001", 2], 3) == 0.689
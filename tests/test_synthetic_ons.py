@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from cleaning_engine import SPECS, clean_with_spec
+from geography import GeographyIndex
+from synthetic_ons import generate, synthetic_geographies, write_counts_table
+
+
+def test_counts_table_has_ons_quirks_and_consistent_totals(tmp_path):
+    geo = synthetic_geographies(50)
+    path = tmp_path / "births.csv"
+    write_counts_table(path, "births", 2030, geo, np.random.default_rng(0), suppress=0.0, header_every=10)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith("﻿,,,")
+    assert ",,2030," in text
+    assert "\nCode,Geography,2030" in text
+
+    clean = clean_with_spec(pd.read_csv(path), SPECS["births_2019"])
+    counts = clean.set_index("Geography Code")["Number of Business Births (2019)"]
+    assert len(clean) == len(geo.codes)
+    assert (counts % 5 == 0).all()
+
+    levels = GeographyIndex(counts.index)
+    local = counts[levels.level_mask(counts.index, "LA")]
+    regions = counts[levels.level_mask(counts.index, ["region", "country"])]
+    assert local.sum() == counts["K02000001"]
+    assert regions.drop("E92000001").sum() == counts["K02000001"]
+
+
+def test_generated_directory_runs_through_every_cleaner(tmp_path):
+    generate(tmp_path, n_local=30, years=[2023, 2024], seed=3)
+
+    for spec in SPECS.values():
+        clean = clean_with_spec(pd.read_csv(tmp_path / spec.raw_file), spec)
+        assert len(clean) > 0, spec.name
+    assert (tmp_path / "uk_business_deaths_2023.csv").exists()
+
+
+def test_year_files_do_not_overwrite_spec_layouts(tmp_path):
+    generate(tmp_path, n_local=10, years=[2023, 2024], seed=1)
+
+    for name, width in (("births_2024", 4), ("deaths_2024", 5)):
+        raw = pd.read_csv(tmp_path / SPECS[name].raw_file)
+        assert raw.shape[1] == width, name
+    assert pd.read_csv(tmp_path / "uk_business_births_2023.csv").shape[1] == 6
@@ -0,0 +1,106 @@
+import sys
+import warnings
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from clean_business_survival_2022 import clean_survival_2022, load_survival_2022
+from pipeline import build_stages
+from validation import PROCESSED_DIR, PROCESSED_FILES, RULES, ValidationError, check_table, validate
+
+RAW_SURVIVAL = PROJECT_ROOT / "data" / "raw" / "business_survival_2022.csv"
+
+
+@pytest.fixture
+def survival():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return clean_survival_2022(load_survival_2022(RAW_SURVIVAL))
+
+
+@pytest.mark.parametrize("name", list(RULES))
+def test_processed_tables_pass(name):
+    assert validate(pd.read_csv(PROCESSED_DIR / PROCESSED_FILES[name]), name).empty
+
+
+def test_violations_are_reported_by_row(survival):
+    bad = survival.copy()
+    bad.loc[3, "Geography Code"] = "E6000001"
+    bad.loc[5, "Number Still Alive After 1 Year"] = bad.loc[5, "Number of Business Births (2022)"] + 5
+    bad.loc[7, "1-Year Survival Rate (%)"] = 101.0
+
+    violations = validate(bad, "survival_2022")
+
+    by_rule = violations.groupby("rule")["row"].apply(list).to_dict()
+    assert by_rule == {
+        "code matches ONS pattern": [3],
+        "Number Still Alive After 1 Year at most births": [5],
+        "1-Year Survival Rate (%) matches survivors / births": [5, 7],
+        "1-Year Survival Rate (%) within 0-100": [7],
+    }
+    assert violations.loc[violations["row"] == 3, "Geography Code"].tolist() == ["E6000001"]
+
+
+def test_missing_values_must_agree_with_status(survival):
+    bad = survival.copy()
+    bad.loc[2, "Number of Business Births (2022)"] = pd.NA
+
+    violations = validate(bad, "survival_2022")
+
+    assert violations["rule"].tolist() == ["Number of Business Births (2022) agrees with its status"]
+
+
+def test_fail_fast_raises_on_first_broken_rule(survival):
+    bad = survival.copy()
+    bad.loc[[4, 9], "Number of Business Births (2022)"] = -5
+
+    with pytest.raises(ValidationError, match="2 rows break 'Number of Business Births"):
+        validate(bad, "survival_2022", mode="fail-fast")
+
+
+def test_sample_mode_checks_a_subset(survival):
+    bad = survival.copy()
+    bad["1-Year Survival Rate (%)"] = 150.0
+
+    violations = validate(bad, "survival_2022", mode="sample", sample=50)
+
+    # Out of range, so also inconsistent with survivors / births
+    assert violations["row"].nunique() == 50
+    assert len(violations) == 100
+
+
+def test_sample_positions_are_drawn_once_per_table_size(survival):
+    bad = survival.copy()
+    bad["1-Year Survival Rate (%)"] = 150.0
+
+    first = validate(bad, "survival_2022", mode="sample", sample=50)
+    second = validate(bad.iloc[::-1].reset_index(drop=True), "survival_2022", mode="sample", sample=50)
+
+    assert first.groupby("rule")["row"].apply(lambda rows: rows.is_monotonic_increasing).all()
+    assert first["row"].tolist() == second["row"].tolist()
+
+
+def test_every_cleaner_is_rebuilt_when_its_checks_change():
+    stages = build_stages()
+
+    for stage in stages.values():
+        if stage.kind == "clean":
+            assert {"validation.py", "profiling.py", "columnar.py"} <= {p.name for p in stage.code}, stage.name
+
+
+def test_cleaners_warn_unless_validation_is_off(survival, monkeypatch):
+    raw = load_survival_2022(RAW_SURVIVAL)
+    raw.iloc[10, 0] = "not a code"
+
+    with pytest.warns(UserWarning, match="survival_2022 failed validation"):
+        clean_survival_2022(raw)
+    monkeypatch.setenv("ONS_VALIDATE", "fail-fast")
+    with pytest.raises(ValidationError):
+        clean_survival_2022(raw)
+    monkeypatch.setenv("ONS_VALIDATE", "off")
+    assert check_table(survival, "survival_2022").empty
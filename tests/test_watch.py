@@ -0,0 +1,48 @@
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from pipeline import RAW_DIR, build_stages
+from watch import Debouncer, Watcher, affected_stages
+
+
+def test_raw_file_maps_to_its_cleaner_and_dependent_charts():
+    stages = build_stages()
+
+    affected = affected_stages(stages, [RAW_DIR / "uk_business_deaths.csv"])
+
+    assert list(affected) == ["deaths_2019", "plot:deaths_bar_2019_vs_2024", "plot:births_bar_chart_2024"]
+    assert affected_stages(stages, [RAW_DIR / "notes.txt"]) == {}
+
+
+def test_debouncer_waits_for_a_quiet_period():
+    debouncer = Debouncer(delay=0.5)
+
+    debouncer.add({"a"}, now=0.0)
+    debouncer.add({"b"}, now=0.4)
+    assert debouncer.ready(now=0.8) == set()
+
+    assert debouncer.ready(now=0.9) == {"a", "b"}
+    assert debouncer.ready(now=5.0) == set()
+
+
+def test_poll_reports_added_rewritten_and_removed_files(tmp_path):
+    kept, removed = tmp_path / "kept.csv", tmp_path / "removed.csv"
+    kept.write_text("a")
+    removed.write_text("b")
+    watcher = Watcher(tmp_path, stages={})
+    assert watcher.poll() == set()
+
+    kept.write_text("aa")
+    stat = kept.stat()
+    os.utime(kept, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    removed.unlink()
+    added = tmp_path / "added.csv"
+    added.write_text("c")
+
+    assert watcher.poll() == {kept, removed, added}
+    assert watcher.poll() == set()
@@ -0,0 +1,139 @@
+import csv
+import sys
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from workbook import CLEANERS, WORKBOOK_SHEETS, Workbook, _column_index, ingest_workbook
+
+RAW_DIR = PROJECT_ROOT / "data" / "raw"
+PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+
+RAW_FILES = {
+    "births_2024": "uk_business_births_2024.csv",
+    "deaths_2024": "uk_business_deaths_2024.csv",
+    "survival_2019": "business_survival_rates.csv",
+    "survival_2022": "business_survival_2022.csv",
+    "birth_death_rates": "business_birth_death_rates.csv",
+}
+
+
+def _column_letters(i: int) -> str:
+    letters = ""
+    i += 1
+    while i:
+        i, rem = divmod(i - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _write_xlsx(path: Path, sheets: dict[str, list[list[str]]]) -> None:
+    """
+    A minimal workbook as Excel would save the CSV exports.
+
+    Number-like cells become numeric cells, text goes to the shared strings
+    table and empty rows are left out of the sheet XML.
+    """
+    ns = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    rel_ns = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    strings: dict[str, int] = {}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        entries, rels = [], []
+        for n, (name, rows) in enumerate(sheets.items(), start=1):
+            entries.append(f'<sheet name="{escape(name)}" sheetId="{n}" r:id="rId{n}"/>')
+            rels.append(
+                f'<Relationship Id="rId{n}" Target="worksheets/sheet{n}.xml" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+            )
+            xml_rows = []
+            for r, row in enumerate(rows, start=1):
+                cells = []
+                for c, text in enumerate(row):
+                    ref = f"{_column_letters(c)}{r}"
+                    text = text.lstrip("﻿")
+                    if not text.strip():
+                        continue
+                    try:
+                        number = float(text.replace(",", ""))
+                        cells.append(f'<c r="{ref}"><v>{number:g}</v></c>')
+                    except ValueError:
+                        index = strings.setdefault(text, len(strings))
+                        cells.append(f'<c r="{ref}" t="s"><v>{index}</v></c>')
+                if cells:
+                    xml_rows.append(f'<row r="{r}">{"".join(cells)}</row>')
+            zf.writestr(
+                f"xl/worksheets/sheet{n}.xml",
+                f'<worksheet {ns}><sheetData>{"".join(xml_rows)}</sheetData></worksheet>',
+            )
+        zf.writestr("xl/workbook.xml", f'<workbook {ns} {rel_ns}><sheets>{"".join(entries)}</sheets></workbook>')
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(rels) + "</Relationships>",
+        )
+        items = "".join(f"<si><t>{escape(s)}</t></si>" for s in strings)
+        zf.writestr("xl/sharedStrings.xml", f"<sst {ns}>{items}</sst>")
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    sheets = {}
+    for name, raw_file in RAW_FILES.items():
+        with open(RAW_DIR / raw_file, newline="", encoding="utf-8") as fh:
+            sheets[WORKBOOK_SHEETS[name]] = list(csv.reader(fh))
+    path = tmp_path / "businessdemography.xlsx"
+    _write_xlsx(path, sheets)
+    return path
+
+
+def test_column_index():
+    assert [_column_index(s) for s in ("A", "Z", "AA", "AB")] == [0, 25, 26, 27]
+
+
+def test_sheet_frame_matches_csv_export_layout(workbook_path):
+    with Workbook(workbook_path) as book:
+        assert list(book.sheets) == list(WORKBOOK_SHEETS.values())
+        frame = book.frame("Table 1.1d")
+
+    # The CSV export also carries trailing blank rows and columns
+    csv_frame = pd.read_csv(RAW_DIR / "uk_business_births_2024.csv", encoding="utf-8-sig")
+    csv_frame = csv_frame.dropna(how="all").dropna(axis=1, how="all")
+    assert frame.dropna(how="all").shape == csv_frame.shape
+    assert frame.iloc[3, 2] == 317440
+
+
+def test_ingest_workbook_matches_committed_processed_files(workbook_path, tmp_path):
+    out = tmp_path / "processed"
+
+    tables = ingest_workbook(workbook_path, processed_dir=out)
+
+    assert set(tables) == set(WORKBOOK_SHEETS)
+    for name in WORKBOOK_SHEETS:
+        processed_file = CLEANERS[name][3]
+        expected = (PROCESSED_DIR / processed_file).read_text(encoding="utf-8")
+        assert (out / processed_file).read_text(encoding="utf-8") == expected, name
+
+
+def test_ingest_workbook_reports_missing_sheets(workbook_path):
+    with pytest.raises(KeyError, match="Table 9"):
+        ingest_workbook(workbook_path, {"births_2019": "Table 9"})
+
+
+def test_frame_pads_ragged_rows_like_read_csv(tmp_path):
+    rows = [["Code", "", "Code"], ["E1", "x"], [], ["E2", "y", "z", "4"]]
+    path = tmp_path / "ragged.xlsx"
+    _write_xlsx(path, {"Sheet": rows})
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("Code,,Code,\nE1,x,,\n,,,\nE2,y,z,4\n", encoding="utf-8")
+
+    with Workbook(path) as book:
+        frame = book.frame("Sheet")
+
+    pd.testing.assert_frame_equal(frame, pd.read_csv(csv_path, skip_blank_lines=False))